@@ -30,11 +30,15 @@ from music import EnhancedMusicPlayer, EnhancedAAGACAStyles
 class ImageCache:
     """Efficient image caching system for rotated and scaled images"""
     
+    HEADING_TO_DEGREES = -180.0 / math.pi  # Radians heading -> pygame rotate degrees (one multiply, no math.degrees)
+    
     def __init__(self, max_cache_size=1000):
         self.rotation_cache = {}
         self.shadow_cache = {}
         self.scale_cache = {}
+        self.rotation_luts = {}  # id(base_image) -> (base_image, [rotated surface per step])
         self.max_cache_size = max_cache_size
+        self.max_lut_images = 64  # Each LUT holds up to 360 surfaces
         self.cache_hits = 0
         self.cache_misses = 0
     
@@ -58,6 +62,30 @@ class ImageCache:
         self.rotation_cache[cache_key] = rotated
         return rotated
     
+    def get_step_rotated_image(self, base_image, angle, steps=360):
+        """Get image rotated to the nearest whole step from a per-image lookup table"""
+        lut = self.rotation_luts.get(id(base_image))
+        if lut is None or lut[0] is not base_image:
+            if len(self.rotation_luts) >= self.max_lut_images:
+                self.rotation_luts.clear()
+            lut = (base_image, [None] * steps)  # Filled lazily, one step at a time
+            self.rotation_luts[id(base_image)] = lut
+        
+        rotations = lut[1]
+        index = int(round(angle * len(rotations) / 360.0)) % len(rotations)
+        rotated = rotations[index]
+        if rotated is None:
+            self.cache_misses += 1
+            rotated = pygame.transform.rotate(base_image, index * 360.0 / len(rotations))
+            rotations[index] = rotated
+        else:
+            self.cache_hits += 1
+        return rotated
+    
+    def get_heading_rotated_image(self, base_image, heading, offset_degrees=-90):
+        """Get LUT image facing a heading in radians (default offset for sprites drawn pointing up)"""
+        return self.get_step_rotated_image(base_image, heading * self.HEADING_TO_DEGREES + offset_degrees)
+    
     def get_shadow_image(self, base_image, scale, alpha, angle=0):
         """Get shadow image from cache or create new one"""
         # Round values to reduce cache entries
@@ -111,6 +139,7 @@ class ImageCache:
         self.rotation_cache.clear()
         self.shadow_cache.clear()
         self.scale_cache.clear()
+        self.rotation_luts.clear()
     
     def get_cache_stats(self):
         """Get cache performance statistics"""
@@ -120,7 +149,7 @@ class ImageCache:
             'hits': self.cache_hits,
             'misses': self.cache_misses,
             'hit_rate': hit_rate,
-            'total_entries': len(self.rotation_cache) + len(self.shadow_cache) + len(self.scale_cache)
+            'total_entries': len(self.rotation_cache) + len(self.shadow_cache) + len(self.scale_cache) + len(self.rotation_luts)
         }
 
 
@@ -797,26 +826,143 @@ def load_image_with_alpha(filename):
     return image.convert_alpha()
 
 
+# Shared sprite surfaces, loaded on first use (convert_alpha needs the display)
+_shared_images = {}
+
+
+def get_shared_image(filename):
+    """Load image once and reuse the converted surface for every object"""
+    if filename not in _shared_images:
+        try:
+            _shared_images[filename] = load_image_with_alpha(filename)
+        except Exception:
+            _shared_images[filename] = None  # Missing file - callers use their fallback
+    return _shared_images[filename]
+
+
+def get_shared_scaled_image(filename, size, smooth=True):
+    """Scale a shared image once per size and reuse it for every object"""
+    cache_key = (filename, size) if smooth else (filename, size, "scale")
+    if cache_key not in _shared_images:
+        image = get_shared_image(filename)
+        if image:
+            image = pygame.transform.smoothscale(image, size) if smooth else pygame.transform.scale(image, size)
+        _shared_images[cache_key] = image
+    return _shared_images[cache_key]
+
+
+# Color-multiplied sprite copies keyed by (id(base image), color) -> (base image, tinted copy)
+_tinted_images = {}
+
+
+def get_tinted_image(base_image, color):
+    """Tint a sprite once (BLEND_MULT fill) and reuse it - the flash effects used to copy and fill every frame"""
+    key = (id(base_image), color)
+    entry = _tinted_images.get(key)
+    if entry is None or entry[0] is not base_image:
+        tinted = base_image.copy()
+        tinted.fill(color, special_flags=pygame.BLEND_MULT)
+        entry = (base_image, tinted)
+        _tinted_images[key] = entry
+    return entry[1]
+
+
+# Pre-drawn opaque ring outlines keyed by (radius, width, color)
+_ring_surfaces = {}
+
+
+def get_ring_surface(radius, width, color):
+    """Get a cached ring outline surface; callers apply alpha with set_alpha()"""
+    key = (radius, width, color)
+    ring = _ring_surfaces.get(key)
+    if ring is None:
+        ring = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(ring, (*color, 255), (radius, radius), radius, width)
+        _ring_surfaces[key] = ring
+    return ring
+
+
+# Reusable transparent scratch surfaces keyed by size, for shapes redrawn every frame
+_scratch_surfaces = {}
+
+
+def get_scratch_surface(size):
+    """Get a cleared SRCALPHA scratch surface; its contents only last until the next call"""
+    scratch = _scratch_surfaces.get(size)
+    if scratch is None:
+        scratch = pygame.Surface(size, pygame.SRCALPHA)
+        _scratch_surfaces[size] = scratch
+    else:
+        scratch.fill((0, 0, 0, 0))
+    return scratch
+
+
+# Screen shake (intensity, duration) by destroyed asteroid size
+ASTEROID_SHAKE_PARAMS = {
+    9: (12, 0.75),  # Large shake for size 9
+    8: (10, 0.5),   # Base shake for size 8
+    7: (8, 0.4),    # Medium shake for size 7
+    6: (6, 0.30),   # Medium shake for size 6
+    5: (5, 0.20),   # Small shake for size 5
+}
+
+# Screen shake (intensity, duration) by shield rings left after a hit
+SHIELD_DAMAGE_SHAKE_PARAMS = {
+    2: (1, 0.2),   # Lost first shield (3/3 -> 2/3) - Light shake
+    1: (3, 0.4),   # Lost second shield (2/3 -> 1/3) - Medium shake
+    0: (5, 0.6),   # Lost last shield (1/3 -> 0/3) - Strong shake
+}
+
+# Asteroid explosion palettes as (share of particles, color)
+ASTEROID_EXPLOSION_PALETTE = (
+    (0.40, (75, 75, 75)),  # 40% gray particles (75-125 range)
+    (0.20, (34, 9, 1)),  # 20% dark brown particles
+    (0.15, (98, 23, 8)),  # 15% red-brown particles
+    (0.10, (148, 27, 12)),  # 10% orange-red particles
+    (0.08, (188, 57, 8)),  # 8% orange particles
+    (0.07, (246, 170, 28)),  # 7% golden particles
+)
+UFO_ASTEROID_EXPLOSION_PALETTE = (
+    (0.30, (75, 75, 75)),  # 30% Gray particles (75, 75, 75) with ±50 value variations (75-125 range)
+    (0.05, (34, 9, 1)),  # 5% Dark brown particles (34, 9, 1) with ±2 color variations
+    (0.05, (98, 23, 8)),  # 5% Red-brown particles (98, 23, 8) with ±4 color variations
+    (0.20, (255, 50, 50)),  # 20% Red particles (255, 50, 50) - Bright red
+    (0.05, (148, 27, 12)),  # 5% Orange-red particles (148, 27, 12) with ±5 color variations
+    (0.05, (188, 57, 8)),  # 5% Orange particles (188, 57, 8) with ±10 color variations
+    (0.15, (255, 150, 0)),  # 15% Orange particles (255, 150, 0) - Orange-red
+    (0.05, (246, 170, 28)),  # 5% Golden particles (246, 170, 28) with ±15 color variations
+    (0.10, (255, 255, 100)),  # 10% Yellow particles (255, 255, 100) - Bright yellow
+)
+FIERY_ASTEROID_EXPLOSION_PALETTE = (
+    (0.40, (255, 50, 50)),  # 40% red particles
+    (0.35, (255, 150, 0)),  # 35% orange particles
+    (0.25, (255, 255, 100)),  # 25% yellow particles
+)
+
+
+def build_asteroid_explosion_batches(palette):
+    """Precompute add_explosion_multicolor (count, color) batches for every asteroid size (1-9)"""
+    batches = {}
+    for size in range(1, 10):
+        total_particles = int((20 + ((2 * size) * 20)) * 0.5)  # 50% fewer particles
+        batches[size] = tuple((int(total_particles * share), color) for share, color in palette)
+    return batches
+
+
+# Explosion batches by destroyed asteroid size
+ASTEROID_EXPLOSION_BATCHES = build_asteroid_explosion_batches(ASTEROID_EXPLOSION_PALETTE)
+UFO_ASTEROID_EXPLOSION_BATCHES = build_asteroid_explosion_batches(UFO_ASTEROID_EXPLOSION_PALETTE)
+FIERY_ASTEROID_EXPLOSION_BATCHES = build_asteroid_explosion_batches(FIERY_ASTEROID_EXPLOSION_PALETTE)
+
+
 def get_asteroid_shake_params(size):
     """Get screen shake parameters for asteroid destruction by size"""
-    shake_map = {
-        9: (12, 0.75),  # Large shake for size 9
-        8: (10, 0.5),   # Base shake for size 8
-        7: (8, 0.4),    # Medium shake for size 7
-        6: (6, 0.30),   # Medium shake for size 6
-        5: (5, 0.20),   # Small shake for size 5
-    }
-    return shake_map.get(size, (0, 0))  # No shake for sizes 1-4
+    return ASTEROID_SHAKE_PARAMS.get(size, (0, 0))  # No shake for sizes 1-4
 
 
 def get_shield_damage_shake_params(shield_hits, time_dilation_factor):
     """Get screen shake parameters for shield damage"""
-    shake_map = {
-        2: (1, 0.2),   # Lost first shield (3/3 -> 2/3) - Light shake
-        1: (3, 0.4),   # Lost second shield (2/3 -> 1/3) - Medium shake
-        0: (5, 0.6),   # Lost last shield (1/3 -> 0/3) - Strong shake
-    }
-    intensity, duration = shake_map.get(shield_hits, (0, 0))
+    intensity, duration = SHIELD_DAMAGE_SHAKE_PARAMS.get(shield_hits, (0, 0))
     return intensity, duration, time_dilation_factor
 
 
@@ -833,7 +979,7 @@ def draw_ship_with_effects(ship, surface, position, rotation_angle, use_cache=Tr
     
     # Draw main ship with effects
     if use_cache:
-        rotated_ship = image_cache.get_rotated_image(ship.image, rotation_angle)
+        rotated_ship = image_cache.get_step_rotated_image(ship.image, rotation_angle)
     else:
         rotated_ship = pygame.transform.rotate(ship.image, rotation_angle)
     
@@ -841,20 +987,18 @@ def draw_ship_with_effects(ship, surface, position, rotation_angle, use_cache=Tr
     
     # Apply visual effects
     if ship.invulnerable and is_invulnerability_flashing(ship.invulnerable_time):
-        # Cyan flash effect when invulnerable
-        cyan_ship = ship.image.copy()
-        cyan_ship.fill((0, 255, 255, 128), special_flags=pygame.BLEND_MULT)
+        # Cyan flash effect when invulnerable (tinted once, rotated through the same LUT as the ship)
+        cyan_ship = get_tinted_image(ship.image, (0, 255, 255, 128))
         if use_cache:
-            cyan_ship = image_cache.get_rotated_image(cyan_ship, rotation_angle)
+            cyan_ship = image_cache.get_step_rotated_image(cyan_ship, rotation_angle)
         else:
             cyan_ship = pygame.transform.rotate(cyan_ship, rotation_angle)
         surface.blit(cyan_ship, ship_rect)
     elif ship.red_flash_timer > 0:
-        # Red flash effect when taking damage
-        red_ship = ship.image.copy()
-        red_ship.fill((255, 0, 0, 128), special_flags=pygame.BLEND_MULT)
+        # Red flash effect when taking damage (tinted once, rotated through the same LUT as the ship)
+        red_ship = get_tinted_image(ship.image, (255, 0, 0, 128))
         if use_cache:
-            red_ship = image_cache.get_rotated_image(red_ship, rotation_angle)
+            red_ship = image_cache.get_step_rotated_image(red_ship, rotation_angle)
         else:
             red_ship = pygame.transform.rotate(red_ship, rotation_angle)
         surface.blit(red_ship, ship_rect)
@@ -877,6 +1021,22 @@ PARTICLE_SOFT_LIMIT = 1250  # Start reducing particle generation (50% of origina
 # Asteroid system limits
 MAX_ASTEROIDS = 300  # Global asteroid limit for performance
 
+# Grid cell size for the per-frame UFO bullet/asteroid proximity queries (>= the 100px evade / 80px avoid radii)
+UFO_QUERY_CELL_SIZE = 100
+
+# Below this many asteroids the collision pass tests every asteroid instead of building a grid
+COLLISION_GRID_MIN_ASTEROIDS = 32
+COLLISION_GRID_CELL_SIZE = 64
+
+# UFO personality pools by level (levels not listed draw from all four)
+UFO_PERSONALITIES = ("aggressive", "defensive", "tactical", "swarm")
+UFO_LEVEL_PERSONALITIES = {
+    1: ("defensive",),
+    2: ("defensive",),
+    3: ("aggressive", "defensive"),
+    4: ("aggressive",),
+}
+
 # Window resizing
 RESIZABLE = True
 MIN_WIDTH = 420
@@ -891,6 +1051,8 @@ YELLOW = (255, 255, 0)
 CYAN = (0, 255, 255)
 
 class Vector2D:
+    __slots__ = ('x', 'y')  # Millions are created per session - skip the per-instance __dict__
+    
     def __init__(self, x=0, y=0):
         self.x = x
         self.y = y
@@ -905,14 +1067,24 @@ class Vector2D:
         return Vector2D(self.x * scalar, self.y * scalar)
     
     def magnitude(self):
-        return math.sqrt(self.x**2 + self.y**2)
+        return math.hypot(self.x, self.y)  # Single C call instead of two pows + sqrt
+    
+    def magnitude_sq(self):
+        return self.x * self.x + self.y * self.y  # For comparisons - no sqrt
     
     def normalize(self):
-        mag = self.magnitude()
+        mag = math.hypot(self.x, self.y)
         if mag > 0:
             return Vector2D(self.x / mag, self.y / mag)
         return Vector2D(0, 0)
     
+    def scaled_to(self, length):
+        """Return this direction rescaled to the given length - normalize and scale with one hypot"""
+        mag = math.hypot(self.x, self.y)
+        if mag > 0:
+            return Vector2D(self.x / mag * length, self.y / mag * length)
+        return Vector2D(0, 0)
+    
     def rotate(self, angle):
         cos_a = math.cos(angle)
         sin_a = math.sin(angle)
@@ -921,7 +1093,15 @@ class Vector2D:
             self.x * sin_a + self.y * cos_a
         )
 
+# Shared zero vector for "no ship" stand-ins passed around every frame - read-only, never mutate it
+ZERO_VECTOR = Vector2D(0, 0)
+
+# Unit (cos, sin) offsets of the fallback ship triangle's corners, 120 degrees apart
+SHIP_TRIANGLE_OFFSETS = tuple((math.cos(i * math.tau / 3), math.sin(i * math.tau / 3)) for i in range(3))
+
 class GameObject:
+    __slots__ = ('position', 'velocity', 'angle', 'active')  # Subclasses without __slots__ still get a __dict__
+    
     def __init__(self, x, y, vx=0, vy=0):
         self.position = Vector2D(x, y)
         self.velocity = Vector2D(vx, vy)
@@ -930,24 +1110,120 @@ class GameObject:
     
     def update(self, dt, screen_width=None, screen_height=None):
         if self.active:
-            self.position.x += self.velocity.x * dt
-            self.position.y += self.velocity.y * dt
+            # Work on local floats and write back once (runs for every object every frame)
+            position = self.position
+            x = position.x + self.velocity.x * dt
+            y = position.y + self.velocity.y * dt
             
             # Use current screen dimensions or fallback to constants
             width = screen_width if screen_width is not None else SCREEN_WIDTH
             height = screen_height if screen_height is not None else SCREEN_HEIGHT
             
-            # Classic Asteroids Deluxe screen wrapping
-            if self.position.x < 0:
-                self.position.x = width
-            elif self.position.x > width:
-                self.position.x = 0
-            if self.position.y < 0:
-                self.position.y = height
-            elif self.position.y > height:
-                self.position.y = 0
+            # Classic Asteroids Deluxe screen wrapping - modulo carries the overshoot across the edge, no branches
+            position.x = x % width
+            position.y = y % height
+
+class SpatialHash:
+    """Uniform grid of objects bucketed by position, so radius queries only visit nearby cells"""
+    
+    def __init__(self, cell_size, objects=()):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> [(insertion index, object)]
+        self.count = 0
+        for obj in objects:
+            self.insert(obj)
+    
+    def insert(self, obj):
+        """Add an object to the cell containing its position"""
+        cell_key = (int(obj.position.x // self.cell_size), int(obj.position.y // self.cell_size))
+        cell = self.cells.get(cell_key)
+        if cell is None:
+            cell = self.cells[cell_key] = []
+        cell.append((self.count, obj))
+        self.count += 1
+    
+    def query(self, x, y, radius):
+        """Objects in every cell the square around (x, y) touches, in insertion order (caller does the exact test)"""
+        cell_size = self.cell_size
+        cells = self.cells
+        min_cell_y = int((y - radius) // cell_size)
+        max_cell_y = int((y + radius) // cell_size)
+        found = []
+        for cell_x in range(int((x - radius) // cell_size), int((x + radius) // cell_size) + 1):
+            for cell_y in range(min_cell_y, max_cell_y + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell:
+                    found.extend(cell)
+        found.sort()  # Insertion indices are unique, so objects themselves are never compared
+        return [obj for index, obj in found]
+
+class WrappedSpatialHash:
+    """Uniform grid over the wrapping screen - cells tile it exactly, so boxes crossing one edge continue on the far side"""
+    
+    def __init__(self, cell_size, width, height):
+        self.columns = max(1, int(width // cell_size))
+        self.rows = max(1, int(height // cell_size))
+        self.cell_width = width / self.columns
+        self.cell_height = height / self.rows
+        self.cells = {}  # (column, row) -> [(insertion index, object)]
+        self.count = 0
+    
+    def _cell_keys(self, x, y, radius):
+        """Every on-screen cell the square around (x, y) overlaps, wrapped around the edges"""
+        radius += 1  # 1px slack for float rounding at cell borders
+        cell_width = self.cell_width
+        cell_height = self.cell_height
+        columns = {column % self.columns for column in range(int((x - radius) // cell_width), int((x + radius) // cell_width) + 1)}
+        rows = {row % self.rows for row in range(int((y - radius) // cell_height), int((y + radius) // cell_height) + 1)}
+        return [(column, row) for column in columns for row in rows]
+    
+    def insert(self, obj, x, y, radius):
+        """Add an object to every cell its circle's bounding box overlaps"""
+        cells = self.cells
+        entry = (self.count, obj)
+        for cell_key in self._cell_keys(x, y, radius):
+            cell = cells.get(cell_key)
+            if cell is None:
+                cell = cells[cell_key] = []
+            cell.append(entry)
+        self.count += 1
+    
+    def query(self, x, y, radius):
+        """Objects sharing a cell with the circle at (x, y), in insertion order (caller does the exact test)"""
+        cells = self.cells
+        found = {}
+        for cell_key in self._cell_keys(x, y, radius):
+            cell = cells.get(cell_key)
+            if cell:
+                found.update(cell)
+        return [found[index] for index in sorted(found)]
 
 class Ship(GameObject):
+    # Fixed attribute set (no per-instance __dict__); shield_recharge_timer and angular_velocity are set by Game
+    __slots__ = (
+        'radius', 'thrust_power', 'rotation_speed', 'rotation_smoothing', 'target_rotation_speed',
+        'max_speed', 'invulnerable', 'invulnerable_time', 'thrusting', 'shoot_timer', 'shoot_interval',
+        'min_shoot_interval', 'max_shoot_interval', 'rof_progression_time', 'rof_curve_duration',
+        'rof_peak_time', 'rof_peak_reached', 'asteroid_interval_bonus', 'shield_hits', 'max_shield_hits',
+        'shield_recharge_time', 'shield_recharge_duration', 'shield_damage_timer', 'shield_damage_duration',
+        'red_flash_timer', 'red_flash_duration', 'speed_decay_rate', 'low_speed_decay_rate', 'rapid_decay_rate',
+        'total_rotations', 'last_angle', 'spinning_trick_shown', 'is_spinning', 'interstellar_timer', 'interstellar_threshold',
+        'interstellar_shown', 'interstellar_threshold_crossed', 'is_at_max_speed', 'last_speed',
+        'deceleration_rate', 'time_dilation', 'turning_speed', 'accumulated_turning_degrees', 'was_turning',
+        'shot_count', 'was_shooting', 'shield_recharge_pulse_timer', 'shield_recharge_pulse_duration',
+        'shield_full_flash_timer', 'shield_full_flash_duration', 'shield_full_hold_timer',
+        'shield_full_hold_duration', 'shield_full_fade_timer', 'shield_full_fade_duration',
+        'shield_charged_by_ability', 'ability_charges', 'max_ability_charges', 'ability_timer',
+        'ability_duration', 'first_charge_duration', 'ability_ready', 'ability_used', 'is_first_game',
+        'ring_pulse_timer', 'shield_pulse_timer', 'ability_recharge_pulse_timer',
+        'ability_recharge_pulse_duration', 'ability_particle_rotation', 'ability_particle_rotation_speed',
+        'ability_2x_particle_timer', 'ability_2x_particle_interval', 'ability_2x_particle_rotation',
+        'ability_hold_timer', 'ability_hold_duration', 'ability_fade_timer', 'ability_fade_duration',
+        'ability_fully_charged_pulse_timer', 'ability_flash_count', 'level_transition_delay',
+        'level_flash_timer', 'level_flash_duration', 'level_flash_count', 'pending_level', 'image', 'level',
+        'shield_recharge_timer', 'angular_velocity'
+    )
+    
     def __init__(self, x, y):
         super().__init__(x, y)
         self.radius = 15  # 50% increase from 10
@@ -983,6 +1259,8 @@ class Ship(GameObject):
         
         # Speed decay
         self.speed_decay_rate = 0.275  # 50% increase in deceleration (was 0.55, now 0.275 = 72.5% decay per second)
+        self.low_speed_decay_rate = self.speed_decay_rate ** 8  # Below 10% speed: 8th power for very fast decay
+        self.rapid_decay_rate = self.speed_decay_rate ** 2  # CTRL braking: 2x normal decay rate (0.275^2 = 0.075625)
         
         # Rotation tracking for "spinning trick" achievement
         self.total_rotations = 0.0
@@ -998,7 +1276,7 @@ class Ship(GameObject):
         self.is_at_max_speed = False  # Track if currently at 100% speed
         
         # Deceleration tracking for time dilation
-        self.last_velocity = Vector2D(0, 0)  # Previous frame velocity
+        self.last_speed = 0.0  # Previous frame speed (only the magnitude is ever compared)
         self.deceleration_rate = 0.0  # Current deceleration rate
         self.time_dilation = 1.0  # Time dilation factor (1.0 = normal time)
         
@@ -1043,7 +1321,7 @@ class Ship(GameObject):
         
         # Ability particle rotation system
         self.ability_particle_rotation = 0.0  # Current rotation angle for ability particles
-        self.ability_particle_rotation_speed = 2 * math.pi / 3.0  # 1 rotation per 3 seconds
+        self.ability_particle_rotation_speed = math.tau / 3.0  # 1 rotation per 3 seconds
         
         # 2x charged ability particle system
         self.ability_2x_particle_timer = 0.0  # Timer for generating 2x charged particles
@@ -1101,15 +1379,12 @@ class Ship(GameObject):
         effective_thrust_power = self.thrust_power * thrust_multiplier
         
         # Rotate thrust vector 90 degrees clockwise so up arrow moves ship to the right
-        thrust_vector = Vector2D(effective_thrust_power, 0).rotate(self.angle)
-        self.velocity.x += thrust_vector.x * dt
-        self.velocity.y += thrust_vector.y * dt
+        # (rotating (power, 0) by angle is just (power*cos, power*sin) - no temporary vectors)
+        velocity = self.velocity
+        velocity.x += effective_thrust_power * math.cos(self.angle) * dt
+        velocity.y += effective_thrust_power * math.sin(self.angle) * dt
         
-        # Limit max speed
-        speed = self.velocity.magnitude()
-        if speed > self.max_speed:
-            self.velocity.x = (self.velocity.x / speed) * self.max_speed
-            self.velocity.y = (self.velocity.y / speed) * self.max_speed
+        self._clamp_speed(velocity)  # Limit max speed
     
     def reverse_thrust(self, dt):
         self.thrusting = True
@@ -1119,30 +1394,34 @@ class Ship(GameObject):
         effective_thrust_power = self.thrust_power * thrust_multiplier
         
         # Reverse thrust vector (opposite direction)
-        thrust_vector = Vector2D(-effective_thrust_power, 0).rotate(self.angle)
-        self.velocity.x += thrust_vector.x * dt
-        self.velocity.y += thrust_vector.y * dt
+        velocity = self.velocity
+        velocity.x += -effective_thrust_power * math.cos(self.angle) * dt
+        velocity.y += -effective_thrust_power * math.sin(self.angle) * dt
         
-        # Limit max speed
-        speed = self.velocity.magnitude()
-        if speed > self.max_speed:
-            self.velocity.x = (self.velocity.x / speed) * self.max_speed
-            self.velocity.y = (self.velocity.y / speed) * self.max_speed
+        self._clamp_speed(velocity)  # Limit max speed
     
     def stop_thrust(self):
         self.thrusting = False
     
+    def _clamp_speed(self, velocity):
+        """Limit the ship's speed to max_speed - the sqrt is only taken when the limit is actually exceeded"""
+        vx = velocity.x
+        vy = velocity.y
+        max_speed = self.max_speed
+        if vx * vx + vy * vy > max_speed * max_speed:
+            speed = math.hypot(vx, vy)
+            velocity.x = (vx / speed) * max_speed
+            velocity.y = (vy / speed) * max_speed
+    
     def rapid_decelerate(self, dt):
         """Rapid exponential deceleration using CTRL keys - 2x normal decay rate"""
         self.thrusting = True  # Mark as thrusting for visual effects
         
-        # Use exponential decay at 2x the normal rate
-        # Square the decay rate for 2x effect (0.275^2 = 0.075625)
-        rapid_decay_rate = self.speed_decay_rate ** 2
-        
-        # Apply exponential decay to both velocity components
-        self.velocity.x *= rapid_decay_rate ** dt
-        self.velocity.y *= rapid_decay_rate ** dt
+        # Use exponential decay at 2x the normal rate (squared decay rate, precomputed in __init__)
+        # Apply exponential decay to both velocity components (one pow shared by both axes)
+        decay_factor = self.rapid_decay_rate ** dt
+        self.velocity.x *= decay_factor
+        self.velocity.y *= decay_factor
     
     def get_acceleration_multiplier(self):
         """Calculate acceleration multiplier based on current speed"""
@@ -1177,15 +1456,11 @@ class Ship(GameObject):
         effective_thrust_power = self.thrust_power * thrust_multiplier
         
         # Strafe vector is 90 degrees counterclockwise from thrust direction
-        strafe_vector = Vector2D(0, -effective_thrust_power).rotate(self.angle)
-        self.velocity.x += strafe_vector.x * dt
-        self.velocity.y += strafe_vector.y * dt
+        velocity = self.velocity
+        velocity.x += effective_thrust_power * math.sin(self.angle) * dt
+        velocity.y += -effective_thrust_power * math.cos(self.angle) * dt
         
-        # Limit max speed
-        speed = self.velocity.magnitude()
-        if speed > self.max_speed:
-            self.velocity.x = (self.velocity.x / speed) * self.max_speed
-            self.velocity.y = (self.velocity.y / speed) * self.max_speed
+        self._clamp_speed(velocity)  # Limit max speed
     
     def strafe_right(self, dt):
         """Strafe right (perpendicular to ship's facing direction)"""
@@ -1196,15 +1471,11 @@ class Ship(GameObject):
         effective_thrust_power = self.thrust_power * thrust_multiplier
         
         # Strafe vector is 90 degrees clockwise from thrust direction
-        strafe_vector = Vector2D(0, effective_thrust_power).rotate(self.angle)
-        self.velocity.x += strafe_vector.x * dt
-        self.velocity.y += strafe_vector.y * dt
+        velocity = self.velocity
+        velocity.x += -effective_thrust_power * math.sin(self.angle) * dt
+        velocity.y += effective_thrust_power * math.cos(self.angle) * dt
         
-        # Limit max speed
-        speed = self.velocity.magnitude()
-        if speed > self.max_speed:
-            self.velocity.x = (self.velocity.x / speed) * self.max_speed
-            self.velocity.y = (self.velocity.y / speed) * self.max_speed
+        self._clamp_speed(velocity)  # Limit max speed
     
     def update(self, dt, screen_width=None, screen_height=None, time_dilation_factor=1.0, raw_dt=None, multiplier=1.0, asteroid_count=0, level=1):
         # Only update if ship is active
@@ -1218,23 +1489,18 @@ class Ship(GameObject):
         
         # Calculate deceleration rate before updating position
         current_speed = self.velocity.magnitude()
-        last_speed = self.last_velocity.magnitude()
         
         # Calculate deceleration rate (negative when slowing down)
         if dt > 0:
-            self.deceleration_rate = (current_speed - last_speed) / dt
+            self.deceleration_rate = (current_speed - self.last_speed) / dt
         else:
             self.deceleration_rate = 0.0
         
         # Calculate turning speed (degrees per second) and accumulate continuous turning
         if dt > 0:
-            # Calculate angle difference, handling wraparound
-            angle_diff = self.angle - self.last_angle
-            # Normalize angle difference to [-π, π]
-            while angle_diff > math.pi:
-                angle_diff -= 2 * math.pi
-            while angle_diff < -math.pi:
-                angle_diff += 2 * math.pi
+            # Calculate angle difference, normalized to [-π, π] in one step
+            # (IEEE remainder - no loop however far the angle has wound up)
+            angle_diff = math.remainder(self.angle - self.last_angle, math.tau)
             # Convert to degrees per second
             self.turning_speed = abs(angle_diff) * 180 / math.pi / dt
             
@@ -1255,8 +1521,8 @@ class Ship(GameObject):
                 self.accumulated_turning_degrees = 0.0
             self.was_turning = False
         
-        # Store current velocity for next frame
-        self.last_velocity = Vector2D(self.velocity.x, self.velocity.y)
+        # Store current speed for next frame (velocity is unchanged since it was measured above)
+        self.last_speed = current_speed
         # Note: last_angle is now handled in the rotation tracking code
         
         super().update(dt, screen_width, screen_height)
@@ -1411,33 +1677,29 @@ class Ship(GameObject):
         if self.shield_pulse_timer > 0:
             self.shield_pulse_timer -= pulse_dt
         
-        # Apply speed decay
+        # Apply speed decay (velocity is unchanged since current_speed was measured above)
         if not self.thrusting:
             # Only decay when not thrusting
-            current_speed = self.velocity.magnitude()
-            speed_percent = current_speed / 1000.0 * 100  # Convert to percentage
-            
-            # Use much faster decay when speed is below 10%
-            if speed_percent < 10.0:
-                # Much faster decay to quickly reach 0% (doubled from 4th power to 8th power)
-                decay_rate = self.speed_decay_rate ** 8  # 8th power for very fast decay (doubled)
+            # Use much faster decay when speed is below 10% (of the 1000 max speed)
+            if current_speed < 100.0:
+                # Much faster decay to quickly reach 0% (doubled from 4th power to 8th power, precomputed)
+                decay_rate = self.low_speed_decay_rate
             else:
                 decay_rate = self.speed_decay_rate
             
-            self.velocity.x *= decay_rate ** dt
-            self.velocity.y *= decay_rate ** dt
+            decay_factor = decay_rate ** dt  # One pow shared by both axes
+            self.velocity.x *= decay_factor
+            self.velocity.y *= decay_factor
+            # Both axes scale by the same factor, so the speed does too (no extra sqrt)
+            current_speed *= decay_factor
         
         
         # Track speed for "interstellar" achievement (trigger once when reaching 1000 speed)
-        current_speed = self.velocity.magnitude()
         max_speed = 1000.0  # 100% speed threshold
         self.is_at_max_speed = current_speed >= max_speed
         
         # Only trigger once when first crossing the 1000 speed threshold
-        # Use a separate flag to track if we've already crossed the threshold
-        if not hasattr(self, 'interstellar_threshold_crossed'):
-            self.interstellar_threshold_crossed = False
-            
+        # (interstellar_threshold_crossed is set in __init__ and on restart)
         if not self.interstellar_threshold_crossed and current_speed >= max_speed:
             self.interstellar_shown = True
             self.interstellar_threshold_crossed = True
@@ -1480,15 +1742,15 @@ class Ship(GameObject):
                 flame_x = self.position.x + math.cos(flame_angle) * 40
                 flame_y = self.position.y + math.sin(flame_angle) * 40
                 
-                # Try fire.gif image with rotation
-                flame_image = pygame.image.load(get_resource_path("fire.gif"))
-                # Scale thrust width based on player speed
-                thrust_height = max(5, thrust_width // 2)  # Height is half the width
-                flame_image = pygame.transform.scale(flame_image, (thrust_width, thrust_height))
-                # Rotate the flame 180 degrees and match ship rotation
-                rotated_flame = pygame.transform.rotate(flame_image, -math.degrees(self.angle) + 180)
-                flame_rect = rotated_flame.get_rect(center=(int(flame_x), int(flame_y)))
-                screen.blit(rotated_flame, flame_rect)
+                # Try fire.gif image with rotation (loaded once, shared)
+                if get_shared_image("fire.gif"):
+                    # Scale thrust width based on player speed (one shared surface per width, at most 60)
+                    thrust_height = max(5, thrust_width // 2)  # Height is half the width
+                    flame_image = get_shared_scaled_image("fire.gif", (thrust_width, thrust_height), smooth=False)
+                    # Rotate the flame 180 degrees and match ship rotation (cached per 0.1 degree)
+                    rotated_flame = image_cache.get_rotated_image(flame_image, -math.degrees(self.angle) + 180)
+                    flame_rect = rotated_flame.get_rect(center=(int(flame_x), int(flame_y)))
+                    screen.blit(rotated_flame, flame_rect)
         
         # Draw shield with new opacity system
         if self.shield_hits > 0:
@@ -1567,7 +1829,7 @@ class Ship(GameObject):
                             ring_offset = i * 0.33
                             pulse_progress = (pulse_cycle + ring_offset) % 1.0
                             # Pulse from 25% to 100% opacity
-                            ring_intensity = 0.25 + 0.75 * (0.5 + 0.5 * math.sin(pulse_progress * 2 * math.pi))
+                            ring_intensity = 0.25 + 0.75 * (0.5 + 0.5 * math.sin(pulse_progress * math.tau))
                         elif self.shield_hits == 3:
                             # All 3 shields fully charged - use ability-style pulsing for all rings
                             pulse_cycle = (self.ring_pulse_timer * 1) % 1.0  # 1-second cycle
@@ -1575,7 +1837,7 @@ class Ship(GameObject):
                             ring_offset = i * 0.33
                             pulse_progress = (pulse_cycle + ring_offset) % 1.0
                             # Pulse from 25% to 100% opacity
-                            ring_intensity = 0.25 + 0.75 * (0.5 + 0.5 * math.sin(pulse_progress * 2 * math.pi))
+                            ring_intensity = 0.25 + 0.75 * (0.5 + 0.5 * math.sin(pulse_progress * math.tau))
                         else:
                             # Other rings - pulse 2 cycles per 0.5s (game time affected)
                             pulse_cycle = (self.shield_pulse_timer * 4) % 0.5  # 0.5 second cycle with 2 pulses
@@ -1607,12 +1869,10 @@ class Ship(GameObject):
                     else:
                         width = max(1, int(4 * ring_intensity * shield_pulse))  # 2x thickness as ability rings
                     
-                    # Create surface with alpha for transparency (like ability rings)
+                    # Blit a pre-drawn ring with per-frame alpha (like ability rings)
                     circle_radius = shield_radius + i * 5
-                    circle_surface = pygame.Surface((circle_radius * 2, circle_radius * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(circle_surface, (0, 100, 255, alpha), 
-                                    (circle_radius, circle_radius), 
-                                    circle_radius, width)
+                    circle_surface = get_ring_surface(circle_radius, width, (0, 100, 255))
+                    circle_surface.set_alpha(alpha)
                     screen.blit(circle_surface, (int(self.position.x - circle_radius), int(self.position.y - circle_radius)))
         
         # Draw shield recharge progress indicator (clockwise from 12 o'clock)
@@ -1622,7 +1882,7 @@ class Ship(GameObject):
                 # Calculate arc angles for clockwise progress from 12 o'clock
                 # 0% = 12 o'clock (3π/2), 50% = 6 o'clock (π/2), 100% = 12 o'clock (3π/2)
                 start_angle = 3 * math.pi / 2  # 12 o'clock (270 degrees)
-                end_angle = start_angle + (2 * math.pi * recharge_progress)  # Clockwise progress
+                end_angle = start_angle + (math.tau * recharge_progress)  # Clockwise progress
                 
                 # Draw the recharge progress arc
                 shield_radius = self.radius + 15
@@ -1647,6 +1907,10 @@ class Ship(GameObject):
     
     def draw_ability_rings(self, screen):
         """Draw ability rings with shield-like recharge behavior"""
+        # Nothing charged, nothing charging and no flash (e.g. a fresh game): every ring is invisible
+        if self.ability_charges == 0 and self.ability_timer <= 0 and self.ability_recharge_pulse_timer <= 0:
+            return
+        
         base_radius = self.radius + 10  # Inside the smallest shield
         
         # Only show ability rings when charging or during pulse effects
@@ -1728,7 +1992,7 @@ class Ship(GameObject):
                             ring_offset = charge * 0.33
                             pulse_progress = (pulse_cycle + ring_offset) % 1.0
                             # Pulse from 25% to 100% opacity
-                            base_opacity = 0.25 + 0.75 * (0.5 + 0.5 * math.sin(pulse_progress * 2 * math.pi))
+                            base_opacity = 0.25 + 0.75 * (0.5 + 0.5 * math.sin(pulse_progress * math.tau))
                         else:
                             # Normal pulsing: 33%-100% opacity range
                             base_opacity = 0.33 + 0.67 * pulse_intensity
@@ -1740,11 +2004,9 @@ class Ship(GameObject):
                         thickness = 1 + int(2 * pulse_intensity)  # 1 to 3 thickness
                         width = max(1, thickness)
                         
-                        # Create surface with alpha for transparency
-                        circle_surface = pygame.Surface((ability_radius * 2, ability_radius * 2), pygame.SRCALPHA)
-                        pygame.draw.circle(circle_surface, (red, green, blue, alpha), 
-                                        (ability_radius, ability_radius), 
-                                        ability_radius, width)
+                        # Blit a pre-drawn ring with per-frame alpha
+                        circle_surface = get_ring_surface(ability_radius, width, (red, green, blue))
+                        circle_surface.set_alpha(alpha)
                         screen.blit(circle_surface, (int(self.position.x - ability_radius), int(self.position.y - ability_radius)))
                     else:
                         # Charging phase: arc based on progress
@@ -1764,7 +2026,7 @@ class Ship(GameObject):
                             if ability_progress > 0:
                                 # Calculate arc angles for clockwise progress from 12 o'clock
                                 start_angle = 3 * math.pi / 2  # 12 o'clock
-                                end_angle = start_angle + (2 * math.pi * ability_progress)
+                                end_angle = start_angle + (math.tau * ability_progress)
                                 
                                 arc_rect = pygame.Rect(
                                     int(self.position.x - ability_radius), 
@@ -1773,9 +2035,6 @@ class Ship(GameObject):
                                     ability_radius * 2
                                 )
                                 
-                                # Create surface with alpha
-                                arc_surface = pygame.Surface((arc_rect.width, arc_rect.height), pygame.SRCALPHA)
-                                
                                 # Color and opacity based on which ring is charging
                                 if charge == 0:
                                     # First ring: original purple with opacity fade (0% to 100%)
@@ -1794,6 +2053,13 @@ class Ship(GameObject):
                                 # Thickness varies from 1 to 3 based on charging progress
                                 thickness = 1 + int(2 * ability_progress)  # 1 to 3 thickness
                                 width = max(1, thickness)
+                                
+                                # The first ring fades in from 0% opacity - nothing to draw until it is visible
+                                if color[3] == 0:
+                                    continue
+                                
+                                # Reuse a cleared scratch surface for the arc
+                                arc_surface = get_scratch_surface(arc_rect.size)
                                 pygame.draw.arc(arc_surface, color, pygame.Rect(0, 0, arc_rect.width, arc_rect.height), start_angle, end_angle, width)
                                 screen.blit(arc_surface, arc_rect)
     
@@ -1851,6 +2117,8 @@ class Ship(GameObject):
 
 class BossWeaponBullet(GameObject):
     """Special bullet class for boss weapon - uses starshot.gif (already 2x size)"""
+    __slots__ = ('lifespan', 'age', 'is_ufo_bullet', 'scaled_width', 'scaled_height', 'image', 'rotated_image', 'radius')
+    
     def __init__(self, x, y, vx, vy, angle=None):
         super().__init__(x, y, vx, vy)
         # 7-second lifespan for boss bullets
@@ -1868,19 +2136,14 @@ class BossWeaponBullet(GameObject):
         self.scaled_width = 32
         self.scaled_height = 8
         
-        # Load bullet image and scale to exact dimensions
-        try:
-            self.image = pygame.image.load(get_resource_path("starshot.gif"))
-            # Scale to exact 32x8 dimensions regardless of original image size
-            self.image = pygame.transform.scale(self.image, (self.scaled_width, self.scaled_height))
-        except Exception as e:
-            # Fallback to tieshot.gif if starshot.gif doesn't exist
-            try:
-                self.image = pygame.image.load(get_resource_path("tieshot.gif"))
-                # Scale to exact 32x8 dimensions
-                self.image = pygame.transform.scale(self.image, (self.scaled_width, self.scaled_height))
-            except Exception as e2:
-                self.image = None
+        # Bullet image (loaded and converted once, shared by all boss bullets)
+        # Fallback to tieshot.gif if starshot.gif doesn't exist
+        bullet_file = "starshot.gif" if get_shared_image("starshot.gif") else "tieshot.gif"
+        # Scale to exact 32x8 dimensions regardless of original image size
+        self.image = get_shared_scaled_image(bullet_file, (self.scaled_width, self.scaled_height), smooth=False)
+        if self.image:
+            # A bullet never turns - take its whole-degree rotation from the shared LUT once
+            self.rotated_image = image_cache.get_step_rotated_image(self.image, -math.degrees(self.angle))
         
         # Dynamic hitbox radius based on actual bullet dimensions
         self.radius = max(2, min(self.scaled_width, self.scaled_height) // 2)
@@ -1894,14 +2157,22 @@ class BossWeaponBullet(GameObject):
         
         super().update(dt, screen_width, screen_height)
     
+    def append_blit(self, blit_list, offset_x=0, offset_y=0):
+        """Queue the bullet for a batched Surface.blits call (False if it needs the fallback draw)"""
+        if not self.active:
+            return True
+        if not self.image:
+            return False
+        bullet_rect = self.rotated_image.get_rect(center=(int(self.position.x + offset_x), int(self.position.y + offset_y)))
+        blit_list.append((self.rotated_image, bullet_rect))
+        return True
+    
     def draw(self, screen):
         if self.active:
             if self.image:
-                # Draw bullet using cached rotated image
-                rotation_degrees = -math.degrees(self.angle)
-                rotated_image = image_cache.get_rotated_image(self.image, rotation_degrees)
-                bullet_rect = rotated_image.get_rect(center=(int(self.position.x), int(self.position.y)))
-                screen.blit(rotated_image, bullet_rect)
+                # Draw bullet using the image rotated at creation
+                bullet_rect = self.rotated_image.get_rect(center=(int(self.position.x), int(self.position.y)))
+                screen.blit(self.rotated_image, bullet_rect)
             else:
                 # Fallback to ellipse - match actual bullet dimensions
                 color = RED
@@ -1916,6 +2187,9 @@ class BossWeaponBullet(GameObject):
 
 
 class Bullet(GameObject):
+    __slots__ = ('max_distance', 'distance_traveled', 'is_ufo_bullet', 'velocity_scale', 'base_width', 'base_height',
+                 'scaled_width', 'scaled_height', 'radius', 'image', 'rotated_image')
+    
     def __init__(self, x, y, vx, vy, is_ufo_bullet=False, angle=None):
         super().__init__(x, y, vx, vy)
         self.max_distance = 1000.0  # units - distance-based expiration
@@ -1954,16 +2228,14 @@ class Bullet(GameObject):
         # Dynamic hitbox radius based on actual bullet dimensions
         self.radius = max(2, min(self.scaled_width, self.scaled_height) // 2)
         
-        # Load bullet image
-        try:
-            if is_ufo_bullet:
-                self.image = pygame.image.load(get_resource_path("tieshot.gif"))
-            else:
-                self.image = pygame.image.load(get_resource_path("shot.gif"))
-            # Scale bullet based on velocity
-            self.image = pygame.transform.scale(self.image, (self.scaled_width, self.scaled_height))
-        except Exception as e:
-            self.image = None
+        # Bullet image (loaded once, shared by all bullets)
+        # Scale bullet based on velocity (one shared surface per size)
+        self.image = get_shared_scaled_image("tieshot.gif" if is_ufo_bullet else "shot.gif",
+                                             (self.scaled_width, self.scaled_height), smooth=False)
+        self.rotated_image = None
+        if self.image:
+            # A bullet never turns - take its whole-degree rotation from the shared LUT once
+            self.rotated_image = image_cache.get_step_rotated_image(self.image, -math.degrees(self.angle))
     
     def update(self, dt, screen_width=None, screen_height=None):
         # Store previous position for distance calculation
@@ -1993,14 +2265,22 @@ class Bullet(GameObject):
         if self.distance_traveled >= self.max_distance:
             self.active = False
     
+    def append_blit(self, blit_list, offset_x=0, offset_y=0):
+        """Queue the bullet for a batched Surface.blits call (False if it needs the fallback draw)"""
+        if not self.active:
+            return True
+        if not self.image:
+            return False
+        bullet_rect = self.rotated_image.get_rect(center=(int(self.position.x + offset_x), int(self.position.y + offset_y)))
+        blit_list.append((self.rotated_image, bullet_rect))
+        return True
+    
     def draw(self, screen):
         if self.active:
             if self.image:
-                # Draw bullet using cached rotated image
-                rotation_degrees = -math.degrees(self.angle)
-                rotated_image = image_cache.get_rotated_image(self.image, rotation_degrees)
-                bullet_rect = rotated_image.get_rect(center=(int(self.position.x), int(self.position.y)))
-                screen.blit(rotated_image, bullet_rect)
+                # Draw bullet using the image rotated at creation
+                bullet_rect = self.rotated_image.get_rect(center=(int(self.position.x), int(self.position.y)))
+                screen.blit(self.rotated_image, bullet_rect)
             else:
                 # Fallback to ellipse - match actual bullet dimensions
                 color = RED if self.is_ufo_bullet else WHITE
@@ -2016,6 +2296,29 @@ class Bullet(GameObject):
             
 
 class Asteroid(GameObject):
+    # Fixed attribute set (no per-instance __dict__) - dozens live at once and are read every frame
+    __slots__ = (
+        'size', 'creation_time', 'tags', 'has_shadow', 'radius', 'hitbox_offset_x', 'hitbox_offset_y',
+        'rotation_speed', 'rotation_angle', 'image', 'current_rotations'
+    )
+    
+    # Rotations of sizes up to MAX_SHARED_ROTATION_SIZE are shared by every asteroid of that size in
+    # ROTATION_STEP degree buckets; larger sprites cost MBs per angle, so each keeps only its current one
+    ROTATION_STEP = 3
+    MAX_SHARED_ROTATION_SIZE = 5
+    _rotation_cache = {}  # (size, bucket, shadow_alpha) -> rotated surface (shadow_alpha 0 = main sprite)
+    _fallback_images = {}  # radius -> circle outline used when roid.gif is missing
+    
+    # Per-size tables, shared by __init__ and split instead of being rebuilt for every asteroid
+    SCALE_FACTORS = {9: 7.5, 8: 6.0, 7: 4.5, 6: 3.0, 5: 1.5, 4: 1.0, 3: 0.75, 2: 0.5, 1: 0.25}
+    # Optimized hitbox scale and offset values from testing
+    HITBOX_SCALES = {9: 0.9310, 8: 0.9520, 7: 0.9760, 6: 0.9830, 5: 1.0000, 4: 1.0000, 3: 1.0000, 2: 1.0000, 1: 1.0000}
+    HITBOX_OFFSET_X = {9: 8.0000, 8: 6.0000, 7: 5.0000, 6: 3.0000, 5: 2.0000, 4: 1.0000, 3: 1.0000, 2: 0.6667, 1: 0.3333}
+    HITBOX_OFFSET_Y = {9: -17.0000, 8: -15.0000, 7: -9.0000, 6: -5.0000, 5: -3.0000, 4: -2.0000, 3: -1.3333, 2: -0.6667, 1: -0.3333}
+    # Larger = slower rotation and slower movement
+    ROTATION_MULTIPLIERS = {9: 0.1, 8: 0.2, 7: 0.3, 6: 0.4, 5: 0.5, 4: 0.6, 3: 0.7, 2: 0.8, 1: 0.9, 0: 1.0}
+    SPEED_MULTIPLIERS = {9: 1/10, 8: 3/10, 7: 5/10, 6: 7/10, 5: 9/10, 4: 1.0, 3: 1.5, 2: 2.0, 1: 2.5, 0: 3.0}
+    
     def __init__(self, x, y, size=3, level=1):
         super().__init__(x, y)
         self.size = size  # 9=XXXL, 8=XXL, 7=XL, 6=L, 5=M, 4=S, 3=XS, 2=XXS, 1=XXS
@@ -2030,48 +2333,65 @@ class Asteroid(GameObject):
         
         # Match hitbox to visual size better (custom sizes)
         base_radius = 50  # Base radius for 100% scale
-        scale_factors = {9: 7.5, 8: 6.0, 7: 4.5, 6: 3.0, 5: 1.5, 4: 1.0, 3: 0.75, 2: 0.5, 1: 0.25}
-        
-        # Optimized hitbox scale and offset values from testing
-        hitbox_scales = {9: 0.9310, 8: 0.9520, 7: 0.9760, 6: 0.9830, 5: 1.0000, 4: 1.0000, 3: 1.0000, 2: 1.0000, 1: 1.0000}
-        hitbox_offset_x = {9: 8.0000, 8: 6.0000, 7: 5.0000, 6: 3.0000, 5: 2.0000, 4: 1.0000, 3: 1.0000, 2: 0.6667, 1: 0.3333}
-        hitbox_offset_y = {9: -17.0000, 8: -15.0000, 7: -9.0000, 6: -5.0000, 5: -3.0000, 4: -2.0000, 3: -1.3333, 2: -0.6667, 1: -0.3333}
         
         # Calculate optimized hitbox radius
-        base_radius_calc = base_radius * scale_factors.get(size, 1.0) * 0.925  # Original calculation
-        self.radius = int(base_radius_calc * hitbox_scales.get(size, 1.0))  # Apply optimized scale
+        base_radius_calc = base_radius * Asteroid.SCALE_FACTORS.get(size, 1.0) * 0.925  # Original calculation
+        self.radius = int(base_radius_calc * Asteroid.HITBOX_SCALES.get(size, 1.0))  # Apply optimized scale
         
         # Store hitbox offset values
-        self.hitbox_offset_x = hitbox_offset_x.get(size, 0.0)
-        self.hitbox_offset_y = hitbox_offset_y.get(size, 0.0)
+        self.hitbox_offset_x = Asteroid.HITBOX_OFFSET_X.get(size, 0.0)
+        self.hitbox_offset_y = Asteroid.HITBOX_OFFSET_Y.get(size, 0.0)
         # Size-based rotation scaling (larger = slower rotation)
         base_rotation = random.uniform(-2, 2)
-        rotation_multipliers = {9: 0.1, 8: 0.2, 7: 0.3, 6: 0.4, 5: 0.5, 4: 0.6, 3: 0.7, 2: 0.8, 1: 0.9, 0: 1.0}
-        self.rotation_speed = base_rotation * rotation_multipliers.get(size, 1.0)
+        self.rotation_speed = base_rotation * Asteroid.ROTATION_MULTIPLIERS.get(size, 1.0)
         self.rotation_angle = 0
         
         # Size-based speed scaling system (25% slower)
         base_speed = random.uniform(50, 150) * 0.75  # Base speed range, 25% slower
-        speed_multipliers = {9: 1/10, 8: 3/10, 7: 5/10, 6: 7/10, 5: 9/10, 4: 1.0, 3: 1.5, 2: 2.0, 1: 2.5, 0: 3.0}
-        speed = base_speed * speed_multipliers.get(size, 1.0)
-        angle = random.uniform(0, 2 * math.pi)
+        speed = base_speed * Asteroid.SPEED_MULTIPLIERS.get(size, 1.0)
+        angle = random.random() * math.tau
         self.velocity = Vector2D(
             math.cos(angle) * speed,
             math.sin(angle) * speed
         )
         
-        # Load asteroid image
-        try:
-            self.image = pygame.image.load(get_resource_path("roid.gif"))
-            self.image = self.image.convert_alpha()
-            # New size hierarchy scaling (custom sizes)
-            base_size = 100  # Base size for 100% scale
-            scale_factors = {9: 7.5, 8: 6.0, 7: 4.5, 6: 3.0, 5: 1.5, 4: 1.0, 3: 0.75, 2: 0.5, 1: 0.25}
-            scale = int(base_size * scale_factors.get(size, 1.0))
-            self.image = pygame.transform.smoothscale(self.image, (scale, scale))
-        except:
+        # Asteroid image (loaded and scaled once per size, shared by all asteroids)
+        # New size hierarchy scaling (custom sizes)
+        base_size = 100  # Base size for 100% scale
+        scale = int(base_size * Asteroid.SCALE_FACTORS.get(size, 1.0))
+        self.image = get_shared_scaled_image("roid.gif", (scale, scale))
+        if self.image is None:
             # If image loading fails, create a simple fallback image
             self.image = self.create_fallback_image()
+        
+        # Current rotation of large asteroids (not shared between asteroids)
+        self.current_rotations = {}
+    
+    def get_rotated_image(self, shadow_scale=1.0, shadow_alpha=0):
+        """Get the asteroid (or its shadow when shadow_alpha > 0) rotated to its quantized angle"""
+        degrees = -math.degrees(self.rotation_angle) % 360.0
+        if self.size <= Asteroid.MAX_SHARED_ROTATION_SIZE:
+            bucket = int(degrees / Asteroid.ROTATION_STEP) * Asteroid.ROTATION_STEP
+            cache = Asteroid._rotation_cache
+            key = (self.size, bucket, shadow_alpha)
+        else:
+            # Large asteroids turn slowly - only rotate again when the whole degree changes
+            bucket = int(degrees)
+            cache = self.current_rotations
+            key = (bucket, shadow_alpha)
+        
+        rotated = cache.get(key)
+        if rotated is None:
+            if cache is self.current_rotations and len(cache) >= 2:
+                cache.clear()  # Keep only the current main sprite and shadow
+            rotated = pygame.transform.rotate(self.image, bucket)
+            if shadow_alpha > 0:
+                # Same steps as ImageCache.get_shadow_image: rotate -> scale -> blacken -> alpha
+                rotated = pygame.transform.scale_by(rotated, shadow_scale)
+                rotated.fill((0, 0, 0, 255), special_flags=pygame.BLEND_MULT)
+                rotated.set_alpha(shadow_alpha)
+            cache[key] = rotated
+        return rotated
     
     def get_hitbox_center(self):
         """Get the actual hitbox center position (asteroid position + offset)"""
@@ -2080,133 +2400,105 @@ class Asteroid(GameObject):
             self.position.y + self.hitbox_offset_y
         )
     
-    def draw_shadow_only(self, screen, screen_width=None, screen_height=None):
-        """Draw only the shadow of the asteroid (for proper layering)"""
-        if not self.active or not self.has_shadow:
-            return
-        
-        
-            
+    def get_draw_positions(self, screen_width=None, screen_height=None, offset_x=0, offset_y=0):
+        """Get the main and screen-wrapped draw positions (offset is the screen shake)"""
         # Get screen dimensions (use current screen size or fallback to constants)
         width = screen_width if screen_width is not None else SCREEN_WIDTH
         height = screen_height if screen_height is not None else SCREEN_HEIGHT
         
-        # Calculate wrapped positions for screen wrapping
-        positions = []
+        x = self.position.x + offset_x
+        y = self.position.y + offset_y
         
         # Main position
-        positions.append((self.position.x, self.position.y))
+        positions = [(x, y)]
         
-        # Check if asteroid is crossing screen edges and add wrapped positions
+        # Wrap offset per axis (0 when not crossing that edge) - replaces the 8-branch edge/corner ladder
         asteroid_radius = self.radius
+        offset_wrap_x = width if x < asteroid_radius else (-width if x > width - asteroid_radius else 0)
+        offset_wrap_y = height if y < asteroid_radius else (-height if y > height - asteroid_radius else 0)
         
-        # Horizontal wrapping
-        if self.position.x < asteroid_radius:
-            positions.append((self.position.x + width, self.position.y))
-        elif self.position.x > width - asteroid_radius:
-            positions.append((self.position.x - width, self.position.y))
+        # Horizontal, vertical and corner copies
+        if offset_wrap_x:
+            positions.append((x + offset_wrap_x, y))
+        if offset_wrap_y:
+            positions.append((x, y + offset_wrap_y))
+            if offset_wrap_x:
+                positions.append((x + offset_wrap_x, y + offset_wrap_y))
         
-        # Vertical wrapping
-        if self.position.y < asteroid_radius:
-            positions.append((self.position.x, self.position.y + height))
-        elif self.position.y > height - asteroid_radius:
-            positions.append((self.position.x, self.position.y - height))
-        
-        # Corner wrapping (when asteroid is in corner)
-        if (self.position.x < asteroid_radius and self.position.y < asteroid_radius):
-            positions.append((self.position.x + width, self.position.y + height))
-        elif (self.position.x > width - asteroid_radius and self.position.y < asteroid_radius):
-            positions.append((self.position.x - width, self.position.y + height))
-        elif (self.position.x < asteroid_radius and self.position.y > height - asteroid_radius):
-            positions.append((self.position.x + width, self.position.y - height))
-        elif (self.position.x > width - asteroid_radius and self.position.y > height - asteroid_radius):
-            positions.append((self.position.x - width, self.position.y - height))
-        
-        # Draw shadow at all calculated positions
-        for pos_x, pos_y in positions:
+        return positions
+    
+    def get_shadow_style(self):
+        """Get (scale, offset, alpha) of this asteroid's shadow"""
+        # Dynamic shadow size: (100% + (3 * size level)%) = 1.0 + (0.03 * size)
+        shadow_scale = 1.0 + (0.03 * self.size)
+        # Dynamic shadow offset: (10 * size level) pixels
+        shadow_offset = 10 * self.size
+        # Dynamic shadow opacity: Custom formula for specified values
+        if self.size == 1:
+            shadow_alpha = int(255 * 0.40)  # 40%
+        elif self.size == 2:
+            shadow_alpha = int(255 * 0.50)  # 50%
+        elif self.size == 3:
+            shadow_alpha = int(255 * 0.55)  # 55%
+        elif self.size == 4:
+            shadow_alpha = int(255 * 0.60)  # 60%
+        elif self.size == 5:
+            shadow_alpha = int(255 * 0.70)  # 70%
+        elif self.size == 6:
+            shadow_alpha = int(255 * 0.80)  # 80%
+        elif self.size == 7:
+            shadow_alpha = int(255 * 0.85)  # 85%
+        elif self.size == 8:
+            shadow_alpha = int(255 * 0.90)  # 90%
+        else:  # Size 9 and above - no shadows
+            shadow_alpha = 0
+        return shadow_scale, shadow_offset, shadow_alpha
+    
+    def append_shadow_blits(self, blit_list, screen_width=None, screen_height=None, offset_x=0, offset_y=0):
+        """Queue the shadow at every wrapped position for one batched Surface.blits call"""
+        if not self.active or not self.has_shadow:
+            return
+        
+        shadow_scale, shadow_offset, shadow_alpha = self.get_shadow_style()
+        if shadow_alpha > 0:  # Only draw shadow if opacity > 0
             # Use cached shadow image (fallback image created if needed)
-                rotation_angle = -math.degrees(self.rotation_angle)
-                # Dynamic shadow size: (100% + (3 * size level)%) = 1.0 + (0.03 * size)
-                shadow_scale = 1.0 + (0.03 * self.size)
-                # Dynamic shadow offset: (10 * size level) pixels
-                shadow_offset = 10 * self.size
-                # Dynamic shadow opacity: Custom formula for specified values
-                if self.size == 1:
-                    shadow_alpha = int(255 * 0.40)  # 40%
-                elif self.size == 2:
-                    shadow_alpha = int(255 * 0.50)  # 50%
-                elif self.size == 3:
-                    shadow_alpha = int(255 * 0.55)  # 55%
-                elif self.size == 4:
-                    shadow_alpha = int(255 * 0.60)  # 60%
-                elif self.size == 5:
-                    shadow_alpha = int(255 * 0.70)  # 70%
-                elif self.size == 6:
-                    shadow_alpha = int(255 * 0.80)  # 80%
-                elif self.size == 7:
-                    shadow_alpha = int(255 * 0.85)  # 85%
-                elif self.size == 8:
-                    shadow_alpha = int(255 * 0.90)  # 90%
-                else:  # Size 9 and above - no shadows
-                    shadow_alpha = 0
-                if shadow_alpha > 0:  # Only draw shadow if opacity > 0
-                    shadow_asteroid = image_cache.get_shadow_image(self.image, shadow_scale, shadow_alpha, rotation_angle)
-                    shadow_rect = shadow_asteroid.get_rect(center=(int(pos_x + shadow_offset), int(pos_y + shadow_offset)))
-                    screen.blit(shadow_asteroid, shadow_rect, special_flags=pygame.BLEND_ALPHA_SDL2)
+            shadow_asteroid = self.get_rotated_image(shadow_scale, shadow_alpha)
+            for pos_x, pos_y in self.get_draw_positions(screen_width, screen_height, offset_x, offset_y):
+                shadow_rect = shadow_asteroid.get_rect(center=(int(pos_x + shadow_offset), int(pos_y + shadow_offset)))
+                blit_list.append((shadow_asteroid, shadow_rect, None, pygame.BLEND_ALPHA_SDL2))
     
-    def draw_main_only(self, screen, screen_width=None, screen_height=None):
-        """Draw only the main asteroid (without shadow, for proper layering)"""
+    def append_main_blits(self, blit_list, screen_width=None, screen_height=None, offset_x=0, offset_y=0):
+        """Queue the asteroid at every wrapped position for one batched Surface.blits call"""
         if not self.active:
             return
-            
-        # Get screen dimensions (use current screen size or fallback to constants)
-        width = screen_width if screen_width is not None else SCREEN_WIDTH
-        height = screen_height if screen_height is not None else SCREEN_HEIGHT
-        
-        # Calculate wrapped positions for screen wrapping
-        positions = []
-        
-        # Main position
-        positions.append((self.position.x, self.position.y))
-        
-        # Check if asteroid is crossing screen edges and add wrapped positions
-        asteroid_radius = self.radius
-        
-        # Horizontal wrapping
-        if self.position.x < asteroid_radius:
-            positions.append((self.position.x + width, self.position.y))
-        elif self.position.x > width - asteroid_radius:
-            positions.append((self.position.x - width, self.position.y))
         
-        # Vertical wrapping
-        if self.position.y < asteroid_radius:
-            positions.append((self.position.x, self.position.y + height))
-        elif self.position.y > height - asteroid_radius:
-            positions.append((self.position.x, self.position.y - height))
-        
-        # Corner wrapping (when asteroid is in corner)
-        if (self.position.x < asteroid_radius and self.position.y < asteroid_radius):
-            positions.append((self.position.x + width, self.position.y + height))
-        elif (self.position.x > width - asteroid_radius and self.position.y < asteroid_radius):
-            positions.append((self.position.x - width, self.position.y + height))
-        elif (self.position.x < asteroid_radius and self.position.y > height - asteroid_radius):
-            positions.append((self.position.x + width, self.position.y - height))
-        elif (self.position.x > width - asteroid_radius and self.position.y > height - asteroid_radius):
-            positions.append((self.position.x - width, self.position.y - height))
-        
-        # Draw asteroid at all calculated positions
-        for pos_x, pos_y in positions:
-            # Draw asteroid using image (fallback image created if needed)
-            rotated_asteroid = pygame.transform.rotate(self.image, -math.degrees(self.rotation_angle))
-            asteroid_rect = rotated_asteroid.get_rect(center=(int(pos_x), int(pos_y)))
-            screen.blit(rotated_asteroid, asteroid_rect)
+        # Draw asteroid using cached rotated image (fallback image created if needed)
+        rotated_asteroid = self.get_rotated_image()
+        for pos_x, pos_y in self.get_draw_positions(screen_width, screen_height, offset_x, offset_y):
+            blit_list.append((rotated_asteroid, rotated_asteroid.get_rect(center=(int(pos_x), int(pos_y)))))
+    
+    def draw_shadow_only(self, screen, screen_width=None, screen_height=None):
+        """Draw only the shadow of the asteroid (for proper layering)"""
+        blit_list = []
+        self.append_shadow_blits(blit_list, screen_width, screen_height)
+        screen.blits(blit_list, doreturn=False)
+    
+    def draw_main_only(self, screen, screen_width=None, screen_height=None):
+        """Draw only the main asteroid (without shadow, for proper layering)"""
+        blit_list = []
+        self.append_main_blits(blit_list, screen_width, screen_height)
+        screen.blits(blit_list, doreturn=False)
     
     def create_fallback_image(self):
         """Create a simple circular fallback image when roid.gif fails to load"""
-        # Create a simple circular image as fallback
-        size = int(self.radius * 2)
-        surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        pygame.draw.circle(surface, WHITE, (size // 2, size // 2), int(self.radius), 2)
+        # Drawn once per radius and shared, like the roid.gif sprites (every spawn and split would redraw it)
+        surface = Asteroid._fallback_images.get(self.radius)
+        if surface is None:
+            # Create a simple circular image as fallback
+            size = int(self.radius * 2)
+            surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(surface, WHITE, (size // 2, size // 2), int(self.radius), 2)
+            Asteroid._fallback_images[self.radius] = surface
         return surface
     
     def update(self, dt, screen_width=None, screen_height=None, player_speed=0, time_dilation_factor=1.0):
@@ -2218,167 +2510,85 @@ class Asteroid(GameObject):
     def draw(self, screen, screen_width=None, screen_height=None):
         if not self.active:
             return
-        
-        # Get screen dimensions (use current screen size or fallback to constants)
-        width = screen_width if screen_width is not None else SCREEN_WIDTH
-        height = screen_height if screen_height is not None else SCREEN_HEIGHT
-        
-        # Calculate wrapped positions for screen wrapping
-        positions = []
-        
-        # Main position
-        positions.append((self.position.x, self.position.y))
-        
-        # Check if asteroid is crossing screen edges and add wrapped positions
-        asteroid_radius = self.radius
-        
-        # Horizontal wrapping
-        if self.position.x < asteroid_radius:
-            positions.append((self.position.x + width, self.position.y))
-        elif self.position.x > width - asteroid_radius:
-            positions.append((self.position.x - width, self.position.y))
-        
-        # Vertical wrapping
-        if self.position.y < asteroid_radius:
-            positions.append((self.position.x, self.position.y + height))
-        elif self.position.y > height - asteroid_radius:
-            positions.append((self.position.x, self.position.y - height))
-        
-        # Corner wrapping (when asteroid is in corner)
-        if (self.position.x < asteroid_radius and self.position.y < asteroid_radius):
-            positions.append((self.position.x + width, self.position.y + height))
-        elif (self.position.x > width - asteroid_radius and self.position.y < asteroid_radius):
-            positions.append((self.position.x - width, self.position.y + height))
-        elif (self.position.x < asteroid_radius and self.position.y > height - asteroid_radius):
-            positions.append((self.position.x + width, self.position.y - height))
-        elif (self.position.x > width - asteroid_radius and self.position.y > height - asteroid_radius):
-            positions.append((self.position.x - width, self.position.y - height))
+        blit_list = []
+        self.append_blits(blit_list, screen_width, screen_height)
+        screen.blits(blit_list, doreturn=False)
+    
+    def append_blits(self, blit_list, screen_width=None, screen_height=None):
+        """Queue shadow and sprite at every wrap position (each shadow right under its own sprite)"""
+        # Draw asteroid using cached rotated image (fallback image created if needed)
+        rotated_asteroid = self.get_rotated_image()
+        
+        # Shadow is drawn first at each position (behind the asteroid)
+        shadow_asteroid = None
+        if self.has_shadow:
+            shadow_scale, shadow_offset, shadow_alpha = self.get_shadow_style()
+            if shadow_alpha > 0:  # Only draw shadow if opacity > 0
+                shadow_asteroid = self.get_rotated_image(shadow_scale, shadow_alpha)
         
         # Draw asteroid at all calculated positions
-        for pos_x, pos_y in positions:
-            # Draw asteroid using cached rotated image (fallback image created if needed)
-            rotation_degrees = -math.degrees(self.rotation_angle)
-            rotated_asteroid = image_cache.get_rotated_image(self.image, rotation_degrees)
-            asteroid_rect = rotated_asteroid.get_rect(center=(int(pos_x), int(pos_y)))
-            
-            # Draw shadow first (behind the asteroid) - all asteroids have shadows
-            if self.has_shadow:
-                # Dynamic shadow size: (100% + (3 * size level)%) = 1.0 + (0.03 * size)
-                shadow_scale = 1.0 + (0.03 * self.size)
-                # Dynamic shadow offset: (10 * size level) pixels
-                shadow_offset = 10 * self.size
-                # Dynamic shadow opacity: Custom formula for specified values
-                if self.size == 1:
-                    shadow_alpha = int(255 * 0.40)  # 40%
-                elif self.size == 2:
-                    shadow_alpha = int(255 * 0.50)  # 50%
-                elif self.size == 3:
-                    shadow_alpha = int(255 * 0.55)  # 55%
-                elif self.size == 4:
-                    shadow_alpha = int(255 * 0.60)  # 60%
-                elif self.size == 5:
-                    shadow_alpha = int(255 * 0.70)  # 70%
-                elif self.size == 6:
-                    shadow_alpha = int(255 * 0.80)  # 80%
-                elif self.size == 7:
-                    shadow_alpha = int(255 * 0.85)  # 85%
-                elif self.size == 8:
-                    shadow_alpha = int(255 * 0.90)  # 90%
-                else:  # Size 9 and above - no shadows
-                    shadow_alpha = 0
-                if shadow_alpha > 0:  # Only draw shadow if opacity > 0
-                    shadow_asteroid = image_cache.get_shadow_image(self.image, shadow_scale, shadow_alpha, rotation_degrees)
-                    shadow_rect = shadow_asteroid.get_rect(center=(int(pos_x + shadow_offset), int(pos_y + shadow_offset)))
-                    screen.blit(shadow_asteroid, shadow_rect, special_flags=pygame.BLEND_ALPHA_SDL2)
-            
-            # Draw main asteroid
-            screen.blit(rotated_asteroid, asteroid_rect)
-        
-        
+        for pos_x, pos_y in self.get_draw_positions(screen_width, screen_height):
+            if shadow_asteroid:
+                shadow_rect = shadow_asteroid.get_rect(center=(int(pos_x + shadow_offset), int(pos_y + shadow_offset)))
+                blit_list.append((shadow_asteroid, shadow_rect, None, pygame.BLEND_ALPHA_SDL2))
+            blit_list.append((rotated_asteroid, rotated_asteroid.get_rect(center=(int(pos_x), int(pos_y)))))
     
     def split(self, projectile_velocity=None, level=1):
         # Special XXS splitting behavior
         if self.size == 2:  # XXS asteroid
-            if random.random() < 0.25:  # 25% chance to split into 2 XXXS
-                new_asteroids = []
-                for i in range(2):
-                    new_asteroid = Asteroid(self.position.x, self.position.y, 1, level)  # XXXS
-                    # 0.1% chance to add show_circle tag to new asteroid
-                    if random.random() < 0.001:
-                        new_asteroid.tags.append("show_circle")
-                    
-                    # Inherit parent velocity with random offset
-                    base_speed = self.velocity.magnitude() * 1.3
-                    angle_offset = random.uniform(-math.pi/3, math.pi/3)
-                    angle = math.atan2(self.velocity.y, self.velocity.x) + angle_offset
-                    
-                    speed_variation = random.uniform(0.7, 1.3)
-                    final_speed = base_speed * speed_variation
-                    
-                    # Add projectile velocity if provided (5% of projectile velocity)
-                    if projectile_velocity:
-                        new_asteroid.velocity = Vector2D(
-                            math.cos(angle) * final_speed + projectile_velocity.x * 0.05,
-                            math.sin(angle) * final_speed + projectile_velocity.y * 0.05
-                        )
-                    else:
-                        new_asteroid.velocity = Vector2D(
-                            math.cos(angle) * final_speed,
-                            math.sin(angle) * final_speed
-                        )
-                    
-                    # Size-based rotation
-                    base_rotation = random.uniform(-2, 2)
-                    rotation_multipliers = {9: 0.1, 8: 0.2, 7: 0.3, 6: 0.4, 5: 0.5, 4: 0.6, 3: 0.7, 2: 0.8, 1: 0.9, 0: 1.0}
-                    new_asteroid.rotation_speed = base_rotation * rotation_multipliers.get(new_asteroid.size, 1.0)
-                    new_asteroid.rotation_angle = random.uniform(0, 2 * math.pi)
-                    new_asteroids.append(new_asteroid)
-                return new_asteroids
-            else:
+            if random.random() >= 0.25:  # 25% chance to split into 2 XXXS
                 # 75% chance to just be destroyed
                 return []
+        elif self.size <= 1:
+            return []
         
-        # Normal splitting for other sizes
-        elif self.size > 1:
-            new_asteroids = []
-            for i in range(2):
-                new_asteroid = Asteroid(self.position.x, self.position.y, self.size - 1, level)
-                # 0.1% chance to add show_circle tag to new asteroid
-                if random.random() < 0.001:
-                    new_asteroid.tags.append("show_circle")
-                
-                # Classic splitting: inherit parent velocity with random offset
-                base_speed = self.velocity.magnitude() * 1.3  # Classic speed multiplier
-                angle_offset = random.uniform(-math.pi/3, math.pi/3)  # ±60 degrees from parent
-                angle = math.atan2(self.velocity.y, self.velocity.x) + angle_offset
-                
-                # Classic speed variation
-                speed_variation = random.uniform(0.7, 1.3)
-                final_speed = base_speed * speed_variation
-                
-                # Add projectile velocity if provided (5% of projectile velocity)
-                if projectile_velocity:
-                    new_asteroid.velocity = Vector2D(
-                        math.cos(angle) * final_speed + projectile_velocity.x * 0.05,
-                        math.sin(angle) * final_speed + projectile_velocity.y * 0.05
-                    )
-                else:
-                    new_asteroid.velocity = Vector2D(
-                        math.cos(angle) * final_speed,
-                        math.sin(angle) * final_speed
-                    )
-                
-                # Size-based rotation
-                base_rotation = random.uniform(-2, 2)
-                rotation_multipliers = {9: 0.1, 8: 0.2, 7: 0.3, 6: 0.4, 5: 0.5, 4: 0.6, 3: 0.7, 2: 0.8, 1: 0.9, 0: 1.0}
-                new_asteroid.rotation_speed = base_rotation * rotation_multipliers.get(new_asteroid.size, 1.0)
-                new_asteroid.rotation_angle = random.uniform(0, 2 * math.pi)
-                new_asteroids.append(new_asteroid)
-            return new_asteroids
-        return []
+        # Classic splitting: both children inherit the parent's speed and heading (computed once)
+        base_speed = self.velocity.magnitude() * 1.3  # Classic speed multiplier
+        parent_angle = math.atan2(self.velocity.y, self.velocity.x)
+        
+        # Local bindings for the child loop
+        uniform = random.uniform
+        rand = random.random
+        cos = math.cos
+        sin = math.sin
+        
+        new_asteroids = []
+        for i in range(2):
+            new_asteroid = Asteroid(self.position.x, self.position.y, self.size - 1, level)
+            # 0.1% chance to add show_circle tag to new asteroid
+            if rand() < 0.001:
+                new_asteroid.tags.append("show_circle")
+            
+            # Inherit parent velocity with random offset
+            angle_offset = uniform(-math.pi/3, math.pi/3)  # ±60 degrees from parent
+            angle = parent_angle + angle_offset
+            
+            # Classic speed variation
+            speed_variation = uniform(0.7, 1.3)
+            final_speed = base_speed * speed_variation
+            
+            # Add projectile velocity if provided (5% of projectile velocity)
+            if projectile_velocity:
+                new_asteroid.velocity = Vector2D(
+                    cos(angle) * final_speed + projectile_velocity.x * 0.05,
+                    sin(angle) * final_speed + projectile_velocity.y * 0.05
+                )
+            else:
+                new_asteroid.velocity = Vector2D(
+                    cos(angle) * final_speed,
+                    sin(angle) * final_speed
+                )
+            
+            # Size-based rotation
+            base_rotation = uniform(-2, 2)
+            new_asteroid.rotation_speed = base_rotation * Asteroid.ROTATION_MULTIPLIERS.get(new_asteroid.size, 1.0)
+            new_asteroid.rotation_angle = rand() * math.tau
+            new_asteroids.append(new_asteroid)
+        return new_asteroids
 
 class AbilityAsteroid(Asteroid):
     """Special asteroid that grants ability charges when destroyed"""
+    __slots__ = ('ability_charges', 'is_ability_asteroid', 'glow_timer', 'glow_duration', 'glow_intensity', 'color_tint')
     
     def __init__(self, x, y, size=3, level=1, ability_charges=1):
         super().__init__(x, y, size, level)
@@ -2403,7 +2613,7 @@ class AbilityAsteroid(Asteroid):
             self.glow_timer = 0.0
         
         # Calculate glow intensity (0.5 to 1.0)
-        self.glow_intensity = 0.5 + 0.5 * math.sin((self.glow_timer / self.glow_duration) * 2 * math.pi)
+        self.glow_intensity = 0.5 + 0.5 * math.sin((self.glow_timer / self.glow_duration) * math.tau)
     
     def draw(self, screen, screen_width=None, screen_height=None):
         """Draw ability asteroid with special glowing effect"""
@@ -2441,7 +2651,52 @@ class AbilityAsteroid(Asteroid):
             return True
         return False
 
+# AdvancedUFO behavior weights for each AI state; every state also avoids asteroids at 0.5
+UFO_BASE_BEHAVIOR_WEIGHTS = {"seek": 0.0, "flee": 0.0, "flank": 0.0, "swarm": 0.0, "patrol": 0.0,
+                             "intercept": 0.0, "evade": 0.0, "avoid_asteroids": 0.5}
+UFO_STATE_BEHAVIOR_WEIGHTS = {
+    state: dict(UFO_BASE_BEHAVIOR_WEIGHTS, **weights)
+    for state, weights in {
+        "pursue": {"seek": 0.8, "intercept": 0.2},
+        "flank": {"flank": 0.6, "seek": 0.4},
+        "flee": {"flee": 0.9, "evade": 0.1},
+        "evade": {"evade": 0.7, "flee": 0.3},
+        "patrol": {"patrol": 0.8, "seek": 0.2},
+        "intercept": {"intercept": 0.9, "seek": 0.1},
+        "swarm_attack": {"swarm": 0.6, "seek": 0.4},
+        "swarm_patrol": {"swarm": 0.8, "patrol": 0.2},
+        "seek": {"seek": 1.0},
+    }.items()
+}
+
 class AdvancedUFO(GameObject):
+    # Fixed attribute set (no per-instance __dict__); time_dilation_factor and screen_width/height are set by Game
+    __slots__ = (
+        'base_radius', 'radius', 'speed', 'max_speed', 'acceleration', 'rotation_speed', 'personality',
+        'personality_ai',
+        'hitbox_scale', 'hitbox_offset_x', 'hitbox_offset_y', 'current_state', 'state_timer',
+        'state_duration', 'behavior_weights', 'player_position', 'player_velocity', 'player_bullets',
+        'other_ufos', 'other_ufo_count', 'asteroids', 'player_bullet_positions', 'player_nearby_asteroids', 'last_known_player_pos',
+        'player_bullet_grid', 'asteroid_grid',
+        'pursuit_timer', 'retreat_timer', 'flanking_target', 'optimal_distance', 'danger_zone',
+        'swarm_center', 'swarm_radius', 'formation_position', 'shoot_timer', 'shoot_interval',
+        'accuracy_modifier', 'individual_accuracy_multiplier', 'aggression_level', 'bullets_fired',
+        'max_bullets', 'asteroid_avoidance_distance', 'avoidance_force', 'direction', 'oscillation',
+        'oscillation_speed', 'tweened_velocity', 'target_velocity', '_fvx', '_fvy', 'velocity_tween_speed',
+        'position_tween_speed', 'spinout_active', 'spinout_timer', 'spinout_duration',
+        'spinout_flame_scale', 'spinout_flame_scale_timer', 'spinout_flame_scale_duration',
+        'spinout_spark_timer', 'spinout_spark_interval', 'spinout_movement_type', 'spinout_spiral_angle',
+        'spinout_spiral_radius', 'spinout_spiral_center', 'spinout_rotation_speed_multiplier',
+        'spinout_target_rotation_speed', 'spinout_original_max_speed', 'spinout_collision_delay_timer',
+        'spinout_collision_delay', 'spawn_immunity_timer', 'spawn_immunity_active', 'visual_rotation_angle',
+        'thrusting', 'image', 'spinout_flame_image', 'last_player_pos', 'spinout_speed_multiplier',
+        'time_dilation_factor', 'screen_width', 'screen_height'
+    )
+    
+    # Debug label font and rendered labels, shared by all UFOs (labels are a handful of state strings)
+    _debug_font = None
+    _debug_text_cache = {}
+    
     def __init__(self, x, y, ai_personality="aggressive"):
         super().__init__(x, y)
         
@@ -2455,6 +2710,8 @@ class AdvancedUFO(GameObject):
         
         # AI Personality Types
         self.personality = ai_personality  # "aggressive", "defensive", "tactical", "swarm", "deadly"
+        # State-transition function picked once (unknown personalities default to aggressive)
+        self.personality_ai = AdvancedUFO.PERSONALITY_AI.get(ai_personality, AdvancedUFO.update_aggressive_ai)
         
         # Hitbox scaling and offset system
         self.hitbox_scale = 1.0  # Scale factor for hitbox
@@ -2485,8 +2742,13 @@ class AdvancedUFO(GameObject):
         self.player_position = Vector2D(0, 0)
         self.player_velocity = Vector2D(0, 0)
         self.player_bullets = []
-        self.other_ufos = []
+        self.other_ufos = []  # Game's shared UFO list - includes this UFO and ones destroyed earlier this frame
+        self.other_ufo_count = 0  # How many of those the swarm logic averages over (Game keeps it in step)
         self.asteroids = []
+        self.player_bullet_positions = np.empty((0, 2))  # Active player bullet positions, gathered once per frame by Game
+        self.player_bullet_grid = None  # SpatialHash of player bullets / asteroids built once per frame by Game
+        self.asteroid_grid = None  # (None = scan the full lists)
+        self.player_nearby_asteroids = 0  # Asteroids within 200px of the player, counted once per frame by Game
         
         # Tactical Variables
         self.last_known_player_pos = Vector2D(0, 0)
@@ -2536,6 +2798,8 @@ class AdvancedUFO(GameObject):
         # Tweening system for smooth movement
         self.tweened_velocity = Vector2D(self.velocity.x, self.velocity.y)  # Start with current velocity
         self.target_velocity = Vector2D(0, 0)  # AI-calculated target velocity
+        self._fvx = 0.0  # Scratch accumulators for calculate_movement_vector
+        self._fvy = 0.0
         self.velocity_tween_speed = 3.0  # How fast to interpolate (higher = more responsive)
         self.position_tween_speed = 2.0  # How fast to interpolate position changes
         
@@ -2568,64 +2832,19 @@ class AdvancedUFO(GameObject):
         # UFO smoke.gif properties (similar to player fire system)
         self.thrusting = True  # UFOs always have thrust
         
-        # Load UFO image based on personality
-        try:
-            # Map personality to image file
-            image_files = {
-                "aggressive": "tie.gif",
-                "defensive": "tieb.gif", 
-                "deadly": "tiei.gif",
-                "tactical": "tiea.gif",
-                "swarm": "tiefo.gif"
-            }
-            
-            # Get image file for this personality, default to tie.gif
-            image_file = image_files.get(self.personality, "tie.gif")
-            
-            self.image = pygame.image.load(get_resource_path(image_file))
-            self.image = self.image.convert_alpha()
-            
-            # Set image size based on personality and hitbox scale
-            if self.personality == "swarm":
-                base_image_size = 48
-            else:
-                base_image_size = 52  # Base size for others
-                
-            # Scale image based on visual scale (hitbox_scale is used for visual scaling only)
-            image_size = int(base_image_size * self.hitbox_scale)
-            self.image = pygame.transform.smoothscale(self.image, (image_size, image_size))
-            
-            # Apply image-specific transformations
-            if self.personality == "aggressive":
-                # Flip tie.gif horizontally then rotate 90 degrees clockwise then rotate 180 degrees
-                self.image = pygame.transform.flip(self.image, True, False)
-                self.image = pygame.transform.rotate(self.image, -90)
-                self.image = pygame.transform.rotate(self.image, 180)
-            elif self.personality == "deadly":
-                # Rotate tiei.gif 90 degrees counter-clockwise, flip horizontally, flip vertically, and rotate 180 degrees
-                self.image = pygame.transform.rotate(self.image, 90)
-                self.image = pygame.transform.flip(self.image, True, False)
-                self.image = pygame.transform.flip(self.image, False, True)
-                self.image = pygame.transform.rotate(self.image, 180)
-            elif self.personality in ["defensive", "tactical", "swarm"]:
-                # Flip tieb.gif, tiea.gif, and tiefo.gif horizontally then rotate 90 degrees counter-clockwise
-                self.image = pygame.transform.flip(self.image, True, False)
-                self.image = pygame.transform.rotate(self.image, 90)
-        except Exception as e:
-            self.image = None
+        # UFO image based on personality (built once per personality, shared by all UFOs)
+        self.image = AdvancedUFO.get_personality_image(self.personality, self.hitbox_scale)
         
-        # Load spinout flame image
-        try:
-            self.spinout_flame_image = pygame.image.load(get_resource_path("spinout.gif"))
-            self.spinout_flame_image = self.spinout_flame_image.convert_alpha()
+        # Spinout flame image (loaded and scaled once, shared by all UFOs)
+        self.spinout_flame_image = None
+        spinout_image = get_shared_image("spinout.gif")
+        if spinout_image:
             # Scale to 10% (95% smaller than original)
-            original_size = self.spinout_flame_image.get_size()
-            self.spinout_flame_image = pygame.transform.smoothscale(
-                self.spinout_flame_image, 
+            original_size = spinout_image.get_size()
+            self.spinout_flame_image = get_shared_scaled_image(
+                "spinout.gif",
                 (int(original_size[0] * 0.1), int(original_size[1] * 0.1))
             )
-        except Exception as e:
-            self.spinout_flame_image = None
         
         # Update hitbox based on personality data
         self.update_hitbox()
@@ -2665,6 +2884,64 @@ class AdvancedUFO(GameObject):
         self.hitbox_offset_x = data["offset_x"]
         self.hitbox_offset_y = data["offset_y"]
     
+    # Scaled and oriented sprites keyed by (personality, hitbox_scale)
+    _personality_images = {}
+    
+    @staticmethod
+    def get_personality_image(personality, hitbox_scale):
+        """Get the shared sprite for a personality, loading and transforming it on first use"""
+        cache_key = (personality, hitbox_scale)
+        if cache_key in AdvancedUFO._personality_images:
+            return AdvancedUFO._personality_images[cache_key]
+        
+        try:
+            # Map personality to image file
+            image_files = {
+                "aggressive": "tie.gif",
+                "defensive": "tieb.gif", 
+                "deadly": "tiei.gif",
+                "tactical": "tiea.gif",
+                "swarm": "tiefo.gif"
+            }
+            
+            # Get image file for this personality, default to tie.gif
+            image_file = image_files.get(personality, "tie.gif")
+            
+            image = pygame.image.load(get_resource_path(image_file))
+            image = image.convert_alpha()
+            
+            # Set image size based on personality and hitbox scale
+            if personality == "swarm":
+                base_image_size = 48
+            else:
+                base_image_size = 52  # Base size for others
+                
+            # Scale image based on visual scale (hitbox_scale is used for visual scaling only)
+            image_size = int(base_image_size * hitbox_scale)
+            image = pygame.transform.smoothscale(image, (image_size, image_size))
+            
+            # Apply image-specific transformations
+            if personality == "aggressive":
+                # Flip tie.gif horizontally then rotate 90 degrees clockwise then rotate 180 degrees
+                image = pygame.transform.flip(image, True, False)
+                image = pygame.transform.rotate(image, -90)
+                image = pygame.transform.rotate(image, 180)
+            elif personality == "deadly":
+                # Rotate tiei.gif 90 degrees counter-clockwise, flip horizontally, flip vertically, and rotate 180 degrees
+                image = pygame.transform.rotate(image, 90)
+                image = pygame.transform.flip(image, True, False)
+                image = pygame.transform.flip(image, False, True)
+                image = pygame.transform.rotate(image, 180)
+            elif personality in ["defensive", "tactical", "swarm"]:
+                # Flip tieb.gif, tiea.gif, and tiefo.gif horizontally then rotate 90 degrees counter-clockwise
+                image = pygame.transform.flip(image, True, False)
+                image = pygame.transform.rotate(image, 90)
+        except Exception as e:
+            image = None
+        
+        AdvancedUFO._personality_images[cache_key] = image
+        return image
+    
     def update_hitbox(self):
         """Update the hitbox radius - keep constant at base radius, don't scale"""
         self.radius = self.base_radius  # Keep hitbox radius constant at 26px
@@ -2739,8 +3016,9 @@ class AdvancedUFO(GameObject):
             else:
                 rotation_angle = self.angle
             
-            rotation_degrees = -math.degrees(rotation_angle) - 90
-            shadow_ufo = image_cache.get_shadow_image(self.image, 1.2, shadow_alpha, rotation_degrees)
+            rotation_degrees = rotation_angle * ImageCache.HEADING_TO_DEGREES - 90
+            # Whole degrees match the LUT sprite and keep the shadow cache from filling with 0.1 degree variants
+            shadow_ufo = image_cache.get_shadow_image(self.image, 1.2, shadow_alpha, round(rotation_degrees))
             shadow_rect = shadow_ufo.get_rect(center=(int(self.position.x + 8 + shake_x), int(self.position.y + 8 + shake_y)))
             screen.blit(shadow_ufo, shadow_rect, special_flags=pygame.BLEND_ALPHA_SDL2)
         else:
@@ -2788,14 +3066,16 @@ class AdvancedUFO(GameObject):
         # Scale from 0 width at 0% speed to 180 width at 100% speed (3x player's 60)
         thrust_width = int((ufo_speed_percent / 100.0) * 180)
         
-        if thrust_width > 0:  # Only draw if there's thrust
+        # smoke.gif is loaded and converted once, not every frame
+        smoke_image = get_shared_image("smoke.gif")
+        
+        if thrust_width > 0 and smoke_image:  # Only draw if there's thrust
             # Position smoke behind the UFO (opposite direction of movement)
             smoke_angle = self.angle + math.pi
             smoke_x = self.position.x + math.cos(smoke_angle) * 40 + shake_x
             smoke_y = self.position.y + math.sin(smoke_angle) * 40 + shake_y
             
-            # Try smoke.gif image with rotation
-            smoke_image = pygame.image.load(get_resource_path("smoke.gif"))
+            # Scale and rotate the shared smoke image
             # Scale smoke width based on UFO speed (2x wider than player)
             smoke_height = max(10, thrust_width)  # Height equals width (2x player's height)
             smoke_image = pygame.transform.scale(smoke_image, (thrust_width, smoke_height))
@@ -2828,8 +3108,7 @@ class AdvancedUFO(GameObject):
                 rotation_angle = self.visual_rotation_angle
             else:
                 rotation_angle = self.angle
-            rotation_degrees = -math.degrees(rotation_angle) - 90
-            rotated_ufo = image_cache.get_rotated_image(self.image, rotation_degrees)
+            rotated_ufo = image_cache.get_heading_rotated_image(self.image, rotation_angle)
             ufo_rect = rotated_ufo.get_rect(center=(int(self.position.x), int(self.position.y)))
             
             # Shadow fade during spinout over 0.2 seconds
@@ -2873,7 +3152,6 @@ class AdvancedUFO(GameObject):
         
         # Debug text: Show UFO state and personality (only in debug mode)
         if debug_mode:
-            font = pygame.font.Font(None, 24)
             debug_text = f"{self.personality.upper()}: {self.current_state.upper()}"
             
             # Add swarm info if applicable
@@ -2884,44 +3162,54 @@ class AdvancedUFO(GameObject):
             if self.spinout_active:
                 debug_text += " (SPINOUT)"
             
-            text_surface = font.render(debug_text, True, (255, 255, 0))  # Yellow text
+            text_surface = AdvancedUFO._debug_text_cache.get(debug_text)
+            if text_surface is None:
+                if AdvancedUFO._debug_font is None:
+                    AdvancedUFO._debug_font = pygame.font.Font(None, 24)
+                if len(AdvancedUFO._debug_text_cache) > 64:
+                    AdvancedUFO._debug_text_cache.clear()
+                text_surface = AdvancedUFO._debug_font.render(debug_text, True, (255, 255, 0))  # Yellow text
+                AdvancedUFO._debug_text_cache[debug_text] = text_surface
             text_rect = text_surface.get_rect(center=(int(self.position.x), int(self.position.y) + 40))
             screen.blit(text_surface, text_rect)
     
     def update_environmental_awareness(self, ship_pos):
         """Update awareness of game world"""
         if ship_pos:
-            self.player_position = Vector2D(ship_pos.x, ship_pos.y)
+            # One snapshot serves as both current and last position - neither is mutated in place
+            player_position = Vector2D(ship_pos.x, ship_pos.y)
+            self.player_position = player_position
             # Track player movement patterns
             if hasattr(self, 'last_player_pos'):
                 self.player_velocity = ship_pos - self.last_player_pos
-            self.last_player_pos = Vector2D(ship_pos.x, ship_pos.y)
+            self.last_player_pos = player_position
     
     def calculate_threat_level(self):
         """Calculate current threat level (0.0 to 1.0)"""
         threat = 0.0
         
-        # Distance to player (closer = more threat)
-        distance_to_player = (self.position - self.player_position).magnitude()
-        if distance_to_player < self.danger_zone:
+        # Distance to player (closer = more threat) - squared, so no sqrt just to compare
+        dx = self.position.x - self.player_position.x
+        dy = self.position.y - self.player_position.y
+        distance_to_player_sq = dx * dx + dy * dy
+        if distance_to_player_sq < self.danger_zone * self.danger_zone:
             threat += 0.4
-        elif distance_to_player < self.optimal_distance:
+        elif distance_to_player_sq < self.optimal_distance * self.optimal_distance:
             threat += 0.2
         
-        # Player bullets nearby
-        for bullet in self.player_bullets:
-            if bullet.active:
-                bullet_distance = (self.position - bullet.position).magnitude()
-                if bullet_distance < 50:
-                    threat += 0.3
-                elif bullet_distance < 100:
-                    threat += 0.1
+        # Player bullets nearby (one vectorized squared-distance count instead of a loop over bullets)
+        if len(self.player_bullet_positions):
+            offsets = self.player_bullet_positions - (self.position.x, self.position.y)
+            distances_sq = np.einsum('ij,ij->i', offsets, offsets)
+            close_bullets = int(np.count_nonzero(distances_sq < 50 * 50))
+            near_bullets = int(np.count_nonzero(distances_sq < 100 * 100)) - close_bullets
+            threat += 0.3 * close_bullets + 0.1 * near_bullets
         
         # Player speed (faster = more dangerous)
-        player_speed = self.player_velocity.magnitude()
-        if player_speed > 800:
+        player_speed_sq = self.player_velocity.magnitude_sq()
+        if player_speed_sq > 800 * 800:
             threat += 0.3
-        elif player_speed > 400:
+        elif player_speed_sq > 400 * 400:
             threat += 0.1
         
         return min(threat, 1.0)
@@ -2931,16 +3219,14 @@ class AdvancedUFO(GameObject):
         opportunity = 0.0
         
         # Player is slow or stationary
-        player_speed = self.player_velocity.magnitude()
-        if player_speed < 200:
+        player_speed_sq = self.player_velocity.magnitude_sq()
+        if player_speed_sq < 200 * 200:
             opportunity += 0.4
-        elif player_speed < 400:
+        elif player_speed_sq < 400 * 400:
             opportunity += 0.2
         
-        # Player is busy with asteroids
-        nearby_asteroids = sum(1 for asteroid in self.asteroids 
-                              if asteroid.active and (asteroid.position - self.player_position).magnitude() < 200)
-        if nearby_asteroids > 2:
+        # Player is busy with asteroids (same player for every UFO, so Game counts once per frame)
+        if self.player_nearby_asteroids > 2:
             opportunity += 0.3
         
         return min(opportunity, 1.0)
@@ -2950,19 +3236,7 @@ class AdvancedUFO(GameObject):
         self.state_timer += dt
         
         # State transitions based on personality
-        if self.personality == "aggressive":
-            self.update_aggressive_ai(dt, threat_level, opportunity_level)
-        elif self.personality == "defensive":
-            self.update_defensive_ai(dt, threat_level, opportunity_level)
-        elif self.personality == "tactical":
-            self.update_tactical_ai(dt, threat_level, opportunity_level)
-        elif self.personality == "swarm":
-            self.update_swarm_ai(dt, threat_level, opportunity_level)
-        elif self.personality == "deadly":
-            self.update_deadly_ai(dt, threat_level, opportunity_level)
-        else:
-            # Default to aggressive behavior
-            self.update_aggressive_ai(dt, threat_level, opportunity_level)
+        self.personality_ai(self, dt, threat_level, opportunity_level)
     
     def update_aggressive_ai(self, dt, threat_level, opportunity_level):
         """Aggressive UFOs prioritize direct engagement"""
@@ -3005,9 +3279,9 @@ class AdvancedUFO(GameObject):
     
     def update_tactical_ai(self, dt, threat_level, opportunity_level):
         """Tactical UFOs use complex strategies"""
-        player_speed = self.player_velocity.magnitude()
+        player_speed_sq = self.player_velocity.magnitude_sq()
         
-        if player_speed > 500:  # Player is moving fast
+        if player_speed_sq > 500 * 500:  # Player is moving fast
             self.current_state = "intercept"
             self.state_duration = 2.0
         elif threat_level > 0.5:
@@ -3022,7 +3296,7 @@ class AdvancedUFO(GameObject):
     
     def update_swarm_ai(self, dt, threat_level, opportunity_level):
         """Swarm UFOs coordinate with each other"""
-        if len(self.other_ufos) > 0:
+        if self.other_ufo_count > 0:
             if opportunity_level > 0.6:
                 self.current_state = "swarm_attack"
                 self.state_duration = 3.0
@@ -3054,104 +3328,84 @@ class AdvancedUFO(GameObject):
                 self.current_state = "evade"  # Only evade when very threatened
                 self.state_duration = 1.0  # Short evade, then back to attack
     
+    # Personality -> state-transition function, looked up once per UFO in __init__
+    PERSONALITY_AI = {
+        "aggressive": update_aggressive_ai,
+        "defensive": update_defensive_ai,
+        "tactical": update_tactical_ai,
+        "swarm": update_swarm_ai,
+        "deadly": update_deadly_ai,
+    }
+    
     def update_behavior_weights(self):
         """Dynamically adjust behavior weights based on current state"""
-        # Reset all weights
-        for behavior in self.behavior_weights:
-            self.behavior_weights[behavior] = 0.0
-        
-        # Base weights from current state
-        if self.current_state == "pursue":
-            self.behavior_weights["seek"] = 0.8
-            self.behavior_weights["intercept"] = 0.2
-        elif self.current_state == "flank":
-            self.behavior_weights["flank"] = 0.6
-            self.behavior_weights["seek"] = 0.4
-        elif self.current_state == "flee":
-            self.behavior_weights["flee"] = 0.9
-            self.behavior_weights["evade"] = 0.1
-        elif self.current_state == "evade":
-            self.behavior_weights["evade"] = 0.7
-            self.behavior_weights["flee"] = 0.3
-        elif self.current_state == "patrol":
-            self.behavior_weights["patrol"] = 0.8
-            self.behavior_weights["seek"] = 0.2
-        elif self.current_state == "intercept":
-            self.behavior_weights["intercept"] = 0.9
-            self.behavior_weights["seek"] = 0.1
-        elif self.current_state == "swarm_attack":
-            self.behavior_weights["swarm"] = 0.6
-            self.behavior_weights["seek"] = 0.4
-        elif self.current_state == "swarm_patrol":
-            self.behavior_weights["swarm"] = 0.8
-            self.behavior_weights["patrol"] = 0.2
-        elif self.current_state == "seek":
-            self.behavior_weights["seek"] = 1.0
-        
-        # Always add asteroid avoidance
-        self.behavior_weights["avoid_asteroids"] = 0.5
+        # Precomputed per-state table (shared, read-only) - unknown states only avoid asteroids
+        self.behavior_weights = UFO_STATE_BEHAVIOR_WEIGHTS.get(self.current_state, UFO_BASE_BEHAVIOR_WEIGHTS)
     
     def calculate_movement_vector(self, dt):
         """Calculate final movement vector combining all behaviors"""
-        final_velocity = Vector2D(0, 0)
+        # Behaviors accumulate into two float scratch slots - one Vector2D at the end instead of ~20 temporaries
+        self._fvx = 0.0
+        self._fvy = 0.0
+        weights = self.behavior_weights
         
         # Apply each behavior with its weight
-        if self.behavior_weights["seek"] > 0:
-            seek_vector = self.calculate_seek_vector()
-            final_velocity += seek_vector * self.behavior_weights["seek"]
+        if weights["seek"] > 0:
+            self.add_seek_vector(weights["seek"])
         
-        if self.behavior_weights["flee"] > 0:
-            flee_vector = self.calculate_flee_vector()
-            final_velocity += flee_vector * self.behavior_weights["flee"]
+        if weights["flee"] > 0:
+            self.add_flee_vector(weights["flee"])
         
-        if self.behavior_weights["flank"] > 0:
-            flank_vector = self.calculate_flank_vector()
-            final_velocity += flank_vector * self.behavior_weights["flank"]
+        if weights["flank"] > 0:
+            self.add_flank_vector(weights["flank"])
         
-        if self.behavior_weights["swarm"] > 0:
-            swarm_vector = self.calculate_swarm_vector()
-            final_velocity += swarm_vector * self.behavior_weights["swarm"]
+        if weights["swarm"] > 0:
+            self.add_swarm_vector(weights["swarm"])
         
-        if self.behavior_weights["patrol"] > 0:
-            patrol_vector = self.calculate_patrol_vector(dt)
-            final_velocity += patrol_vector * self.behavior_weights["patrol"]
+        if weights["patrol"] > 0:
+            self.add_patrol_vector(weights["patrol"], dt)
         
-        if self.behavior_weights["intercept"] > 0:
-            intercept_vector = self.calculate_intercept_vector()
-            final_velocity += intercept_vector * self.behavior_weights["intercept"]
+        if weights["intercept"] > 0:
+            self.add_intercept_vector(weights["intercept"])
         
-        if self.behavior_weights["evade"] > 0:
-            evade_vector = self.calculate_evade_vector()
-            final_velocity += evade_vector * self.behavior_weights["evade"]
+        if weights["evade"] > 0:
+            self.add_evade_vector(weights["evade"])
         
-        if self.behavior_weights["avoid_asteroids"] > 0:
-            avoid_vector = self.calculate_asteroid_avoidance_vector()
-            final_velocity += avoid_vector * self.behavior_weights["avoid_asteroids"]
+        if weights["avoid_asteroids"] > 0:
+            self.add_asteroid_avoidance_vector(weights["avoid_asteroids"])
         
         # Normalize and apply speed limits
-        if final_velocity.magnitude() > 0:
-            final_velocity = final_velocity.normalize() * min(final_velocity.magnitude(), self.max_speed)
+        fvx = self._fvx
+        fvy = self._fvy
+        final_magnitude = math.hypot(fvx, fvy)
+        if final_magnitude > 0:
+            final_speed = min(final_magnitude, self.max_speed)
+            fvx = fvx / final_magnitude * final_speed
+            fvy = fvy / final_magnitude * final_speed
             # Store AI target velocity
-            self.target_velocity = final_velocity
-        else:
+            self.target_velocity = Vector2D(fvx, fvy)
+        elif self.target_velocity.x or self.target_velocity.y:
             # No movement target - gradually slow down
             self.target_velocity = Vector2D(0, 0)
         
         # Tween towards target velocity for smooth movement
-        if self.target_velocity.magnitude() > 0:
+        target = self.target_velocity
+        tweened = self.tweened_velocity
+        if target.x or target.y:
             # Smooth velocity interpolation
-            velocity_diff = self.target_velocity - self.tweened_velocity
-            self.tweened_velocity += velocity_diff * self.velocity_tween_speed * dt
+            tween_speed = self.velocity_tween_speed
+            self.tweened_velocity = Vector2D(tweened.x + (target.x - tweened.x) * tween_speed * dt,
+                                             tweened.y + (target.y - tweened.y) * tween_speed * dt)
             
             # Use tweened velocity for actual movement
             self.velocity = self.tweened_velocity
         else:
             # No movement - gradually slow down using ease-out
-            current_speed = self.tweened_velocity.magnitude()
+            current_speed = tweened.magnitude()
             if current_speed > 0.1:  # Only slow down if moving
                 # Apply ease-out deceleration
                 decel_factor = self.ease_out_cubic(1.0 - self.velocity_tween_speed * dt * 0.5)
-                self.tweened_velocity = self.tweened_velocity * decel_factor
+                self.tweened_velocity = tweened * decel_factor
                 self.velocity = self.tweened_velocity
             else:
                 # Stop completely
@@ -3160,7 +3414,7 @@ class AdvancedUFO(GameObject):
         
         # Always update angle for smooth visual rotation
         # Use time dilation factor to smooth the rotation during slow motion
-        if final_velocity.magnitude() > 0:
+        if fvx or fvy:
             target_angle = math.atan2(self.velocity.y, self.velocity.x)
             
             # Smooth rotation based on time dilation
@@ -3168,14 +3422,8 @@ class AdvancedUFO(GameObject):
                 # Faster rotation when time is dilated (slow motion) - 50% of original speed
                 rotation_speed = 2.5 * (1.0 / max(self.time_dilation_factor, 0.1))
                 
-                # Calculate angle difference
-                angle_diff = target_angle - self.angle
-                
-                # Normalize angle difference to [-π, π]
-                while angle_diff > math.pi:
-                    angle_diff -= 2 * math.pi
-                while angle_diff < -math.pi:
-                    angle_diff += 2 * math.pi
+                # Calculate angle difference, normalized to [-π, π] in one C call
+                angle_diff = math.remainder(target_angle - self.angle, math.tau)
                 
                 # Smooth interpolation towards target angle
                 self.angle += angle_diff * rotation_speed * dt
@@ -3183,96 +3431,137 @@ class AdvancedUFO(GameObject):
                 # Fallback to direct angle update
                 self.angle = target_angle
     
-    def calculate_seek_vector(self):
-        """Calculate vector to move toward player"""
-        direction = self.player_position - self.position
-        if direction.magnitude() > 0:
-            return direction.normalize() * self.speed
-        return Vector2D(0, 0)
-    
-    def calculate_flee_vector(self):
-        """Calculate vector to move away from player"""
-        direction = self.position - self.player_position
-        if direction.magnitude() > 0:
-            return direction.normalize() * self.speed
-        return Vector2D(0, 0)
-    
-    def calculate_flank_vector(self):
-        """Calculate vector to flanking position"""
-        # Calculate perpendicular positions to flank the player
-        player_angle = math.atan2(self.player_velocity.y, self.player_velocity.x)
-        flank_angle = player_angle + math.pi/2  # 90 degrees perpendicular
+    def add_seek_vector(self, weight):
+        """Accumulate weighted vector to move toward player"""
+        dx = self.player_position.x - self.position.x
+        dy = self.player_position.y - self.position.y
+        magnitude = math.hypot(dx, dy)
+        if magnitude > 0:
+            self._fvx += dx / magnitude * self.speed * weight
+            self._fvy += dy / magnitude * self.speed * weight
+    
+    def add_flee_vector(self, weight):
+        """Accumulate weighted vector to move away from player"""
+        dx = self.position.x - self.player_position.x
+        dy = self.position.y - self.player_position.y
+        magnitude = math.hypot(dx, dy)
+        if magnitude > 0:
+            self._fvx += dx / magnitude * self.speed * weight
+            self._fvy += dy / magnitude * self.speed * weight
+    
+    def add_flank_vector(self, weight):
+        """Accumulate weighted vector to flanking position"""
+        # Calculate perpendicular positions to flank the player: heading + 90 degrees is (-vy, vx) / |v| (no trig)
+        player_vx = self.player_velocity.x
+        player_vy = self.player_velocity.y
+        player_speed = math.hypot(player_vx, player_vy)
+        if player_speed > 0:
+            perp_x = -player_vy / player_speed
+            perp_y = player_vx / player_speed
+        else:
+            perp_x, perp_y = 0.0, 1.0  # Stationary player: heading 0, so flank straight below
         
         # Choose the closer flanking position
-        flank_x = self.player_position.x + math.cos(flank_angle) * 150
-        flank_y = self.player_position.y + math.sin(flank_angle) * 150
-        
-        direction = Vector2D(flank_x, flank_y) - self.position
-        if direction.magnitude() > 0:
-            return direction.normalize() * self.speed
-        return Vector2D(0, 0)
-    
-    def calculate_swarm_vector(self):
-        """Calculate vector for swarm coordination"""
-        if len(self.other_ufos) == 0:
-            return Vector2D(0, 0)
+        flank_x = self.player_position.x + perp_x * 150
+        flank_y = self.player_position.y + perp_y * 150
+        
+        dx = flank_x - self.position.x
+        dy = flank_y - self.position.y
+        magnitude = math.hypot(dx, dy)
+        if magnitude > 0:
+            self._fvx += dx / magnitude * self.speed * weight
+            self._fvy += dy / magnitude * self.speed * weight
+    
+    def add_swarm_vector(self, weight):
+        """Accumulate weighted vector for swarm coordination"""
+        if self.other_ufo_count == 0:
+            return
         
         # Calculate swarm center
-        swarm_center = Vector2D(0, 0)
+        center_x = 0
+        center_y = 0
         for ufo in self.other_ufos:
-            if ufo.active:
-                swarm_center += ufo.position
-        swarm_center = swarm_center * (1.0 / len(self.other_ufos))
+            if ufo.active and ufo is not self:
+                center_x += ufo.position.x
+                center_y += ufo.position.y
+        inv_count = 1.0 / self.other_ufo_count
         
         # Move toward swarm center but maintain some distance
-        direction = swarm_center - self.position
-        if direction.magnitude() > 0:
-            return direction.normalize() * self.speed * 0.5
-        return Vector2D(0, 0)
-    
-    def calculate_patrol_vector(self, dt):
-        """Calculate random patrol movement"""
+        dx = center_x * inv_count - self.position.x
+        dy = center_y * inv_count - self.position.y
+        magnitude = math.hypot(dx, dy)
+        if magnitude > 0:
+            self._fvx += dx / magnitude * self.speed * 0.5 * weight
+            self._fvy += dy / magnitude * self.speed * 0.5 * weight
+    
+    def add_patrol_vector(self, weight, dt):
+        """Accumulate weighted random patrol movement"""
         # Simple oscillating movement
         self.oscillation += self.oscillation_speed * dt
-        return Vector2D(self.direction * self.speed, math.sin(self.oscillation) * 50)
+        self._fvx += self.direction * self.speed * weight
+        self._fvy += math.sin(self.oscillation) * 50 * weight
     
-    def calculate_intercept_vector(self):
-        """Calculate vector to intercept player"""
+    def add_intercept_vector(self, weight):
+        """Accumulate weighted vector to intercept player"""
         # Predict where player will be in 1 second
-        future_pos = self.player_position + self.player_velocity * 1.0
-        direction = future_pos - self.position
-        if direction.magnitude() > 0:
-            return direction.normalize() * self.speed
-        return Vector2D(0, 0)
-    
-    def calculate_evade_vector(self):
-        """Calculate vector to evade player bullets"""
-        evade_force = Vector2D(0, 0)
-        for bullet in self.player_bullets:
+        dx = self.player_position.x + self.player_velocity.x * 1.0 - self.position.x
+        dy = self.player_position.y + self.player_velocity.y * 1.0 - self.position.y
+        magnitude = math.hypot(dx, dy)
+        if magnitude > 0:
+            self._fvx += dx / magnitude * self.speed * weight
+            self._fvy += dy / magnitude * self.speed * weight
+    
+    def add_evade_vector(self, weight):
+        """Accumulate weighted vector to evade player bullets"""
+        evade_x = 0
+        evade_y = 0
+        x = self.position.x
+        y = self.position.y
+        bullets = self.player_bullet_grid.query(x, y, 100) if self.player_bullet_grid else self.player_bullets
+        hypot = math.hypot
+        for bullet in bullets:
             if bullet.active:
-                bullet_distance = (self.position - bullet.position).magnitude()
-                if bullet_distance < 100:
-                    direction = self.position - bullet.position
-                    if direction.magnitude() > 0:
-                        evade_strength = (100 - bullet_distance) / 100
-                        evade_force += direction.normalize() * evade_strength
-        return evade_force.normalize() * self.speed if evade_force.magnitude() > 0 else Vector2D(0, 0)
-    
-    def calculate_asteroid_avoidance_vector(self):
-        """Calculate vector to avoid asteroids"""
-        avoid_force = Vector2D(0, 0)
-        for asteroid in self.asteroids:
+                dx = x - bullet.position.x
+                dy = y - bullet.position.y
+                if dx * dx + dy * dy >= 100 * 100:  # Squared gate - most candidates are out of range
+                    continue
+                bullet_distance = hypot(dx, dy)
+                if 0 < bullet_distance < 100:
+                    evade_strength = (100 - bullet_distance) / 100
+                    evade_x += dx / bullet_distance * evade_strength
+                    evade_y += dy / bullet_distance * evade_strength
+        magnitude = math.hypot(evade_x, evade_y)
+        if magnitude > 0:
+            self._fvx += evade_x / magnitude * self.speed * weight
+            self._fvy += evade_y / magnitude * self.speed * weight
+    
+    def add_asteroid_avoidance_vector(self, weight):
+        """Accumulate weighted vector to avoid asteroids"""
+        avoid_x = 0
+        avoid_y = 0
+        x = self.position.x
+        y = self.position.y
+        avoidance_distance = self.asteroid_avoidance_distance
+        avoidance_distance_sq = avoidance_distance * avoidance_distance
+        asteroids = self.asteroid_grid.query(x, y, avoidance_distance) if self.asteroid_grid else self.asteroids
+        hypot = math.hypot
+        for asteroid in asteroids:
             if asteroid.active:
-                asteroid_distance = (self.position - asteroid.position).magnitude()
-                if asteroid_distance < self.asteroid_avoidance_distance:
-                    # Calculate avoidance direction
-                    direction = self.position - asteroid.position
-                    if direction.magnitude() > 0:
-                        # Stronger avoidance for closer asteroids
-                        avoidance_strength = (self.asteroid_avoidance_distance - asteroid_distance) / self.asteroid_avoidance_distance
-                        avoid_force += direction.normalize() * avoidance_strength * 2.0
-        
-        return avoid_force.normalize() * self.speed if avoid_force.magnitude() > 0 else Vector2D(0, 0)
+                dx = x - asteroid.position.x
+                dy = y - asteroid.position.y
+                if dx * dx + dy * dy >= avoidance_distance_sq:  # Squared gate - most candidates are out of range
+                    continue
+                asteroid_distance = hypot(dx, dy)
+                if 0 < asteroid_distance < avoidance_distance:
+                    # Stronger avoidance for closer asteroids
+                    avoidance_strength = (avoidance_distance - asteroid_distance) / avoidance_distance
+                    avoid_x += dx / asteroid_distance * avoidance_strength * 2.0
+                    avoid_y += dy / asteroid_distance * avoidance_strength * 2.0
+        
+        magnitude = math.hypot(avoid_x, avoid_y)
+        if magnitude > 0:
+            self._fvx += avoid_x / magnitude * self.speed * weight
+            self._fvy += avoid_y / magnitude * self.speed * weight
     
     def update_shooting_behavior(self, dt):
         """Update shooting behavior and return whether to shoot"""
@@ -3374,7 +3663,7 @@ class AdvancedUFO(GameObject):
             
             if self.spinout_movement_type == "straight":
                 # Random direction with random velocity 100-250
-                angle = random.uniform(0, 2 * math.pi)
+                angle = random.random() * math.tau
                 random_speed = random.uniform(100, 250)
                 self.velocity = Vector2D(math.cos(angle), math.sin(angle)) * random_speed
             else:
@@ -3382,9 +3671,11 @@ class AdvancedUFO(GameObject):
                 self.spinout_spiral_center = Vector2D(self.position.x, self.position.y)
                 self.spinout_spiral_angle = 0.0
                 self.spinout_spiral_radius = 0.0
-                # Start with current velocity direction for spiral at 250 units/second
-                current_angle = math.atan2(self.velocity.y, self.velocity.x)
-                self.velocity = Vector2D(math.cos(current_angle), math.sin(current_angle)) * 250
+                # Start with current velocity direction for spiral at 250 units/second (heading 0 if stationary)
+                if self.velocity.x or self.velocity.y:
+                    self.velocity = self.velocity.scaled_to(250)
+                else:
+                    self.velocity = Vector2D(250, 0)
             
             # Velocity is now set directly above based on movement type
             
@@ -3434,11 +3725,9 @@ class AdvancedUFO(GameObject):
                 y = self.spinout_spiral_center.y + r * math.sin(self.spinout_spiral_angle)
                 
                 # Update velocity to move towards spiral position at 250 units/second
-                target_pos = Vector2D(x, y)
-                direction = target_pos - self.position
-                if direction.magnitude() > 0:
-                    direction = direction.normalize()
-                    self.velocity = direction * 250  # Fixed 250 units/second for spiral
+                direction = Vector2D(x - self.position.x, y - self.position.y)
+                if direction.x or direction.y:
+                    self.velocity = direction.scaled_to(250)  # Fixed 250 units/second for spiral
             
             # Update rotation speed gradually from 1x to target (1x-10x)
             current_rotation_speed = self.rotation_speed
@@ -3450,7 +3739,7 @@ class AdvancedUFO(GameObject):
             self.visual_rotation_angle += self.rotation_speed * dt * time_dilation_factor
             
             # Update UFO's angle to match current movement direction during spinout
-            if self.velocity.magnitude() > 0:
+            if self.velocity.x or self.velocity.y:
                 self.angle = math.atan2(self.velocity.y, self.velocity.x)
             
             # Debug logging for UFO spinout state
@@ -3521,8 +3810,14 @@ class AdvancedUFO(GameObject):
                     int(original_size[1] * self.spinout_flame_scale)
                 )
                 
-                if scaled_size[0] > 0 and scaled_size[1] > 0:
-                    scaled_flame = pygame.transform.smoothscale(self.spinout_flame_image, scaled_size)
+                if scaled_size == original_size:
+                    scaled_flame = self.spinout_flame_image  # Fully grown - no per-frame rescale
+                elif scaled_size[0] > 0 and scaled_size[1] > 0:
+                    # Plain scale while growing (a new size every frame for 1-3 seconds)
+                    scaled_flame = pygame.transform.scale(self.spinout_flame_image, scaled_size)
+                else:
+                    scaled_flame = None
+                if scaled_flame is not None:
                     # Rotate the flame to be parallel to UFO's movement direction (180 degrees behind)
                     rotated_flame = pygame.transform.rotate(scaled_flame, -math.degrees(self.angle) + 180)
                     # Apply screen shake offset to flame position to match UFO
@@ -3538,6 +3833,7 @@ class AdvancedUFO(GameObject):
 
 class AbilityUFO(AdvancedUFO):
     """Special UFO that grants ability charges when destroyed"""
+    __slots__ = ('ability_charges', 'is_ability_ufo', 'glow_timer', 'glow_duration', 'glow_intensity', 'color_tint')
     
     def __init__(self, x, y, ai_personality="aggressive", ability_charges=1):
         super().__init__(x, y, ai_personality)
@@ -3567,7 +3863,7 @@ class AbilityUFO(AdvancedUFO):
             self.glow_timer = 0.0
         
         # Calculate glow intensity (0.3 to 1.0)
-        self.glow_intensity = 0.3 + 0.7 * math.sin((self.glow_timer / self.glow_duration) * 2 * math.pi)
+        self.glow_intensity = 0.3 + 0.7 * math.sin((self.glow_timer / self.glow_duration) * math.tau)
     
     def draw(self, screen, screen_width=None, screen_height=None):
         """Draw ability UFO with special glowing effect"""
@@ -3602,6 +3898,30 @@ class AbilityUFO(AdvancedUFO):
         return False
 
 
+def build_boss_gun_offsets():
+    """Boss gun offsets from the circle center (boss position + 15px right) - fixed, so computed once"""
+    offsets = []
+    
+    # 12 guns in a perfect circle: 50px radius (100px diameter), evenly distributed
+    for i in range(12):
+        angle = (i / 12.0) * math.tau
+        offsets.append((math.cos(angle) * 50, math.sin(angle) * 50))
+    
+    # 12 guns along a 500px line through the circle center, rotated 5 degrees counter-clockwise
+    rotation_angle = -5 * math.pi / 180  # Convert 5 degrees to radians (negative for counter-clockwise)
+    cos_angle = math.cos(rotation_angle)
+    sin_angle = math.sin(rotation_angle)
+    for i in range(12):
+        line_x = -250 + (i / 11.0) * 500  # Distribute evenly from -250 to +250
+        line_y = 0                        # No vertical offset before rotation
+        offsets.append((line_x * cos_angle - line_y * sin_angle, line_x * sin_angle + line_y * cos_angle))
+    
+    return tuple(offsets)
+
+
+BOSS_GUN_OFFSETS = build_boss_gun_offsets()
+
+
 class BossEnemy(GameObject):
     def __init__(self, x, y, direction="right", screen_width=1000, screen_height=750, level=3):
         super().__init__(x, y)
@@ -3709,6 +4029,7 @@ class BossEnemy(GameObject):
         except Exception as e:
             # Image loading failed - continue without image
             self.image = None
+        self.shadow_image = None  # Built from this boss's own (possibly flipped) image on first draw
         
         # Set radius for collision detection (if needed later) - 250px radius for 500px image
         self.radius = 250
@@ -3899,7 +4220,7 @@ class BossEnemy(GameObject):
         self.sine_timer += dt
         
         # Calculate sine wave offset based on movement direction
-        sine_offset = self.amplitude * math.sin(self.frequency * self.sine_timer * 2 * math.pi)
+        sine_offset = self.amplitude * math.sin(self.frequency * self.sine_timer * math.tau)
         
         # Update position - all bosses move horizontally with sine wave on y-axis
         self.position.x += self.velocity.x * dt
@@ -3938,79 +4259,23 @@ class BossEnemy(GameObject):
         # Clear any existing gun positions
         self.gun_positions.clear()
         
-        # Generate 12 gun positions in a perfect circle around the boss center
-        for i in range(12):
-            # Calculate angle for this gun (evenly distributed around circle)
-            angle = (i / 12.0) * 2 * math.pi
-            
-            # Fixed position on 50px radius circle (100px diameter), offset 15px to the right
-            gun_x = self.position.x + 15 + math.cos(angle) * 50
-            gun_y = self.position.y + math.sin(angle) * 50
-            
-            self.gun_positions.append((gun_x, gun_y))
-        
-        # Generate 12 gun positions in a 500px line through the center of the circle, rotated 5 degrees counter-clockwise
-        rotation_angle = -5 * math.pi / 180  # Convert 5 degrees to radians (negative for counter-clockwise)
-        cos_angle = math.cos(rotation_angle)
-        sin_angle = math.sin(rotation_angle)
-        
-        for i in range(12):
-            # Calculate position along 500px line centered on the circle
-            line_center_x = self.position.x + 15  # Circle center X
-            line_center_y = self.position.y       # Circle center Y
-            
-            # Start with horizontal line from -250 to +250 (500px total)
-            line_offset = -250 + (i / 11.0) * 500  # Distribute evenly along 500px line
-            line_x = line_offset  # Horizontal offset from center
-            line_y = 0            # No vertical offset initially
-            
-            # Rotate the line 5 degrees counter-clockwise
-            rotated_x = line_x * cos_angle - line_y * sin_angle
-            rotated_y = line_x * sin_angle + line_y * cos_angle
-            
-            # Apply rotation and center offset
-            gun_x = line_center_x + rotated_x
-            gun_y = line_center_y + rotated_y
-            
-            self.gun_positions.append((gun_x, gun_y))
+        # 12 guns on the circle, then 12 along the rotated line (offsets precomputed in BOSS_GUN_OFFSETS)
+        center_x = self.position.x + 15  # Circle center X
+        center_y = self.position.y       # Circle center Y
+        for offset_x, offset_y in BOSS_GUN_OFFSETS:
+            self.gun_positions.append((center_x + offset_x, center_y + offset_y))
     
     def update_gun_positions(self):
         """Update gun positions to follow boss position"""
         if not self.gun_positions or not self.active or len(self.gun_positions) < 24:
             return
-            
-        # Update circle gun positions (first 12)
-        for i in range(12):
-            if i < len(self.gun_positions):
-                angle = (i / 12.0) * 2 * math.pi
-                gun_x = self.position.x + 15 + math.cos(angle) * 50
-                gun_y = self.position.y + math.sin(angle) * 50
-                self.gun_positions[i] = (gun_x, gun_y)
         
-        # Update line gun positions (next 12) - 500px line rotated 5 degrees counter-clockwise
-        rotation_angle = -5 * math.pi / 180  # Convert 5 degrees to radians (negative for counter-clockwise)
-        cos_angle = math.cos(rotation_angle)
-        sin_angle = math.sin(rotation_angle)
-        
-        for i in range(12, 24):
-            if i < len(self.gun_positions):
-                line_index = i - 12  # Convert to 0-11 range
-                line_center_x = self.position.x + 15  # Circle center X
-                line_center_y = self.position.y       # Circle center Y
-                
-                # Start with horizontal line from -250 to +250 (500px total)
-                line_offset = -250 + (line_index / 11.0) * 500  # Distribute evenly along 500px line
-                line_x = line_offset  # Horizontal offset from center
-                line_y = 0            # No vertical offset initially
-                
-                # Rotate the line 5 degrees counter-clockwise
-                rotated_x = line_x * cos_angle - line_y * sin_angle
-                rotated_y = line_x * sin_angle + line_y * cos_angle
-                
-                # Apply rotation and center offset
-                gun_x = line_center_x + rotated_x
-                gun_y = line_center_y + rotated_y
-                self.gun_positions[i] = (gun_x, gun_y)
+        # Same fixed offsets as generate_gun_positions - only the boss center moves
+        center_x = self.position.x + 15  # Circle center X
+        center_y = self.position.y       # Circle center Y
+        gun_positions = self.gun_positions
+        for i, (offset_x, offset_y) in enumerate(BOSS_GUN_OFFSETS):
+            gun_positions[i] = (center_x + offset_x, center_y + offset_y)
     
     
     def get_asteroids_by_distance_from_player(self, asteroids, player):
@@ -4179,12 +4444,10 @@ class BossEnemy(GameObject):
         if not hasattr(self, 'weapon_bullets') or not self.weapon_bullets:
             return
             
-        # Update existing bullets
-        for bullet in self.weapon_bullets[:]:  # Use slice to avoid modification during iteration
-            if bullet.active:
-                bullet.update(dt, screen_width, screen_height)
-            else:
-                self.weapon_bullets.remove(bullet)
+        # Drop spent bullets with one filter (not a copy plus an O(n) remove each), then update the rest
+        self.weapon_bullets = [bullet for bullet in self.weapon_bullets if bullet.active]
+        for bullet in self.weapon_bullets:
+            bullet.update(dt, screen_width, screen_height)
     
     def draw_weapon_bullets(self, screen):
         """Draw boss weapon bullets"""
@@ -4195,6 +4458,15 @@ class BossEnemy(GameObject):
             if bullet.active:
                 bullet.draw(screen)
 
+    def get_shadow_image(self):
+        """Get this boss's shadow (33.3% bigger, black, 66% opacity), built once per boss"""
+        if self.shadow_image is None:
+            shadow_image = pygame.transform.scale_by(self.image, 1.333)  # Make shadow 33.3% bigger
+            shadow_image.fill((0, 0, 0, 255), special_flags=pygame.BLEND_MULT)  # Make it black first
+            shadow_image.set_alpha(168)  # 66% opacity
+            self.shadow_image = shadow_image
+        return self.shadow_image
+    
     def draw(self, screen, screen_width=None, screen_height=None):
         if not self.active or self.image is None:
             return
@@ -4211,9 +4483,7 @@ class BossEnemy(GameObject):
         y = int(self.position.y - 250 + shake_y)
         
         # Draw boss shadow first (behind the boss)
-        shadow_image = pygame.transform.scale_by(self.image, 1.333)  # Make shadow 33.3% bigger
-        shadow_image.fill((0, 0, 0, 255), special_flags=pygame.BLEND_MULT)  # Make it black first
-        shadow_image.set_alpha(168)  # 66% opacity
+        shadow_image = self.get_shadow_image()  # 33.3% bigger, 66% opacity (cached per boss)
         shadow_x = x + 15
         shadow_y = y + 15
         screen.blit(shadow_image, (shadow_x, shadow_y), special_flags=pygame.BLEND_ALPHA_SDL2)
@@ -4226,7 +4496,13 @@ class BossEnemy(GameObject):
 
 
 class Particle:
+    __slots__ = ('x', 'y', 'vx', 'vy', 'color', 'lifetime', 'max_lifetime', 'size', 'active', 'use_raw_time')  # Thousands alive at once
+    
     def __init__(self, x, y, vx, vy, color, lifetime=1.0, size=2.0, use_raw_time=False):
+        self.reset(x, y, vx, vy, color, lifetime, size, use_raw_time)
+    
+    def reset(self, x, y, vx, vy, color, lifetime=1.0, size=2.0, use_raw_time=False):
+        """(Re)initialize this particle - ExplosionSystem recycles spent particles through reset"""
         self.x = x
         self.y = y
         self.vx = vx
@@ -4266,14 +4542,7 @@ class Particle:
     def draw(self, screen):
         if not self.active:
             return
-            
-        # Calculate alpha based on remaining lifetime
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        alpha = max(0, min(255, alpha))
-        
-        # Create color with alpha
-        color_with_alpha = (*self.color, alpha)
-        
+
         # Draw particle (ensure minimum size of 1 pixel)
         radius = max(1, int(self.size))
         pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), radius)
@@ -4281,6 +4550,9 @@ class Particle:
 
 class SpinoutParticle:
     """Dedicated particle class for spinout sparks with specific properties"""
+    __slots__ = ('x', 'y', 'vx', 'vy', 'color', 'lifetime', 'max_lifetime', 'size', 'spark_type', 'active',
+                 'initial_velocity', 'use_raw_time')
+    
     def __init__(self, x, y, vx, vy, color, lifetime=None, size=None, spark_type="firey"):
         self.x = x
         self.y = y
@@ -4328,20 +4600,34 @@ class SpinoutParticle:
     def draw(self, screen):
         if not self.active:
             return
-            
-        # Calculate alpha based on remaining lifetime
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        alpha = max(0, min(255, alpha))
-        
+
         # Simple particle rendering to match Copy (3)
         radius = max(1, int(self.size))
         pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), radius)
 
 
 class ExplosionSystem:
+    # Per-channel ± color variation for the explosion palette colors (other colors vary by ±50)
+    COLOR_VARIATIONS = {
+        (34, 9, 1): 2,  # Dark brown
+        (98, 23, 8): 4,  # Red-brown
+        (148, 27, 12): 5,  # Orange-red
+        (188, 57, 8): 10,  # Orange
+        (246, 170, 28): 15,  # Golden
+    }
+    
     def __init__(self):
         self.particles = []
         self.particle_priorities = []  # Track particle priorities for cleanup
+        self.free_particles = []  # Spent particles kept for reuse by new_particle
+    
+    def new_particle(self, x, y, vx, vy, color, lifetime=1.0, size=2.0, use_raw_time=False):
+        """Return a particle from the free list (or a new one) - avoids allocation churn during big explosions"""
+        if self.free_particles:
+            particle = self.free_particles.pop()
+            particle.reset(x, y, vx, vy, color, lifetime, size, use_raw_time)
+            return particle
+        return Particle(x, y, vx, vy, color, lifetime, size, use_raw_time)
     
     def _check_particle_limit(self, priority=1):
         """Check if we can add more particles, cleanup if needed"""
@@ -4397,6 +4683,10 @@ class ExplosionSystem:
                 del self.particle_priorities[index]
     
     def add_explosion(self, x, y, num_particles=50, color=(255, 255, 0), asteroid_size=None, is_ufo=False, use_raw_time=False):
+        self.add_explosion_multicolor(x, y, ((num_particles, color),), asteroid_size, is_ufo, use_raw_time)
+    
+    def add_explosion_multicolor(self, x, y, color_counts, asteroid_size=None, is_ufo=False, use_raw_time=False):
+        """One explosion made of several (num_particles, color) batches - shared setup is done once for all colors"""
         # Determine priority: UFO explosions and large asteroids are high priority
         priority = 1  # Default low priority
         if is_ufo:
@@ -4406,143 +4696,125 @@ class ExplosionSystem:
         elif asteroid_size and asteroid_size >= 5:
             priority = 3  # Medium priority for medium asteroids
         
-        # Check particle limit before adding
-        if not self._check_particle_limit(priority):
-            return
-        
-        for _ in range(int(num_particles)):
-            # Random spawn position within diameter based on asteroid size
-            if asteroid_size is not None:
-                # All asteroid sizes: spawn within diameter radius
-                spawn_radius = asteroid_size * 8  # Diameter increases with asteroid size
-                spawn_angle = random.uniform(0, 2 * math.pi)
-                spawn_distance = random.uniform(0, spawn_radius)
-                spawn_x = x + math.cos(spawn_angle) * spawn_distance
-                spawn_y = y + math.sin(spawn_angle) * spawn_distance
-            elif is_ufo:
-                # UFO particles: spawn within ±10 pixels of UFO center
-                spawn_x = x + random.uniform(-10, 10)
-                spawn_y = y + random.uniform(-10, 10)
+        # Everything that depends only on the explosion type is worked out once, not per particle
+        if asteroid_size is not None:
+            spawn_radius = asteroid_size * 8  # Diameter increases with asteroid size
+            
+            # New asteroid particle speed formula
+            if asteroid_size == 1:
+                base_speed = 50
+            elif asteroid_size == 5:
+                base_speed = 100
+            elif asteroid_size == 9:
+                base_speed = 150
             else:
-                spawn_x = x
-                spawn_y = y
-            
-            # Random velocity in all directions
-            angle = random.uniform(0, 2 * math.pi)
-            
-            if asteroid_size is not None:
-                # New asteroid particle speed formula
-                if asteroid_size == 1:
-                    base_speed = 50
-                elif asteroid_size == 5:
-                    base_speed = 100
-                elif asteroid_size == 9:
-                    base_speed = 150
+                # Interpolate for other sizes
+                if asteroid_size < 5:
+                    base_speed = 50 + ((asteroid_size - 1) / 4) * 50  # 50 to 100
                 else:
-                    # Interpolate for other sizes
-                    if asteroid_size < 5:
-                        base_speed = 50 + ((asteroid_size - 1) / 4) * 50  # 50 to 100
-                    else:
-                        base_speed = 100 + ((asteroid_size - 5) / 4) * 50  # 100 to 150
-                
-                speed_multiplier = random.uniform(0.5, 1.5)  # ±50% variation (100% additional randomization)
-                speed = base_speed * speed_multiplier
-            elif is_ufo:
-                # UFO explosion particles - 50-200 units/second
-                speed = random.uniform(50, 200)  # 50-200 units/second
-                angle = random.uniform(0, math.pi/4)  # Random direction 0-45 degrees
+                    base_speed = 100 + ((asteroid_size - 5) / 4) * 50  # 100 to 150
+            
+            # New asteroid particle lifetime formula
+            base_lifetime = asteroid_size * 0.2  # asteroid size x 0.2 seconds
+            
+            # New asteroid particle size formula
+            if asteroid_size == 1:
+                size_base = 1.0
+            elif asteroid_size == 5:
+                size_base = 2.0
+            elif asteroid_size == 9:
+                size_base = 4.0
             else:
-                # Default speed for non-asteroid explosions (with 100% additional randomization)
-                speed = random.uniform(25, 100) * random.uniform(0.5, 1.5)  # ±50% variation
-            
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
+                # Interpolate for other sizes
+                if asteroid_size < 5:
+                    size_base = 1.0 + ((asteroid_size - 1) / 4) * 1.0  # 1 to 2
+                else:
+                    size_base = 2.0 + ((asteroid_size - 5) / 4) * 2.0  # 2 to 4
+        
+        # Local bindings for the per-particle loop (up to a few hundred iterations per call)
+        uniform = random.uniform
+        rand = random.random
+        randint = random.randint
+        cos = math.cos
+        sin = math.sin
+        tau = math.tau
+        add_particle = self.particles.append
+        add_priority = self.particle_priorities.append
+        new_particle = self.new_particle
+        check_particle_limit = self._check_particle_limit
+        
+        for num_particles, color in color_counts:
+            # Check particle limit before adding each color batch
+            if not check_particle_limit(priority):
+                continue
             
-            # Random particle properties with different variation amounts
+            # Random particle color ranges per channel
             if color == (75, 75, 75):  # Gray with random values 75-125
+                color_ranges = ((75, 125), (75, 125), (75, 125))
+            else:
+                # Known explosion palette colors get tighter variation, anything else ±50
+                variation = ExplosionSystem.COLOR_VARIATIONS.get(color, 50)
+                color_ranges = tuple((max(0, channel - variation), min(255, channel + variation)) for channel in color)
+            (red_low, red_high), (green_low, green_high), (blue_low, blue_high) = color_ranges
+            
+            for _ in range(int(num_particles)):
+                # Random spawn position within diameter based on asteroid size
+                if asteroid_size is not None:
+                    # All asteroid sizes: spawn within diameter radius
+                    spawn_angle = rand() * tau  # Same draw as uniform(0, 2π) without the Python-level call
+                    spawn_distance = uniform(0, spawn_radius)
+                    spawn_x = x + cos(spawn_angle) * spawn_distance
+                    spawn_y = y + sin(spawn_angle) * spawn_distance
+                elif is_ufo:
+                    # UFO particles: spawn within ±10 pixels of UFO center
+                    spawn_x = x + uniform(-10, 10)
+                    spawn_y = y + uniform(-10, 10)
+                else:
+                    spawn_x = x
+                    spawn_y = y
+                
+                # Random velocity in all directions
+                angle = rand() * tau
+                
+                if asteroid_size is not None:
+                    speed_multiplier = uniform(0.5, 1.5)  # ±50% variation (100% additional randomization)
+                    speed = base_speed * speed_multiplier
+                elif is_ufo:
+                    # UFO explosion particles - 50-200 units/second
+                    speed = uniform(50, 200)  # 50-200 units/second
+                    angle = uniform(0, math.pi/4)  # Random direction 0-45 degrees
+                else:
+                    # Default speed for non-asteroid explosions (with 100% additional randomization)
+                    speed = uniform(25, 100) * uniform(0.5, 1.5)  # ±50% variation
+                
+                vx = cos(angle) * speed
+                vy = sin(angle) * speed
+                
+                # Random particle properties with different variation amounts
                 particle_color = (
-                    random.randint(75, 125),
-                    random.randint(75, 125),
-                    random.randint(75, 125)
-                )
-            elif color == (34, 9, 1):  # Dark brown - ±2 variation
-                variation = 2
-                particle_color = (
-                    random.randint(max(0, color[0] - variation), min(255, color[0] + variation)),
-                    random.randint(max(0, color[1] - variation), min(255, color[1] + variation)),
-                    random.randint(max(0, color[2] - variation), min(255, color[2] + variation))
-                )
-            elif color == (98, 23, 8):  # Red-brown - ±4 variation
-                variation = 4
-                particle_color = (
-                    random.randint(max(0, color[0] - variation), min(255, color[0] + variation)),
-                    random.randint(max(0, color[1] - variation), min(255, color[1] + variation)),
-                    random.randint(max(0, color[2] - variation), min(255, color[2] + variation))
-                )
-            elif color == (148, 27, 12):  # Orange-red - ±5 variation
-                variation = 5
-                particle_color = (
-                    random.randint(max(0, color[0] - variation), min(255, color[0] + variation)),
-                    random.randint(max(0, color[1] - variation), min(255, color[1] + variation)),
-                    random.randint(max(0, color[2] - variation), min(255, color[2] + variation))
-                )
-            elif color == (188, 57, 8):  # Orange - ±10 variation
-                variation = 10
-                particle_color = (
-                    random.randint(max(0, color[0] - variation), min(255, color[0] + variation)),
-                    random.randint(max(0, color[1] - variation), min(255, color[1] + variation)),
-                    random.randint(max(0, color[2] - variation), min(255, color[2] + variation))
-                )
-            elif color == (246, 170, 28):  # Golden - ±15 variation
-                variation = 15
-                particle_color = (
-                    random.randint(max(0, color[0] - variation), min(255, color[0] + variation)),
-                    random.randint(max(0, color[1] - variation), min(255, color[1] + variation)),
-                    random.randint(max(0, color[2] - variation), min(255, color[2] + variation))
-                )
-            else:  # Default - ±50 variation
-                variation = 50
-                particle_color = (
-                    random.randint(max(0, color[0] - variation), min(255, color[0] + variation)),
-                    random.randint(max(0, color[1] - variation), min(255, color[1] + variation)),
-                    random.randint(max(0, color[2] - variation), min(255, color[2] + variation))
+                    randint(red_low, red_high),
+                    randint(green_low, green_high),
+                    randint(blue_low, blue_high)
                 )
-            
-            if asteroid_size is not None:
-                # New asteroid particle lifetime formula
-                base_lifetime = asteroid_size * 0.2  # asteroid size x 0.2 seconds
-                lifetime_multiplier = random.uniform(0.75, 1.00)
-                lifetime = base_lifetime * lifetime_multiplier
-                
-                # New asteroid particle size formula
-                if asteroid_size == 1:
-                    size_base = 1.0
-                elif asteroid_size == 5:
-                    size_base = 2.0
-                elif asteroid_size == 9:
-                    size_base = 4.0
+                
+                if asteroid_size is not None:
+                    lifetime_multiplier = uniform(0.75, 1.00)
+                    lifetime = base_lifetime * lifetime_multiplier
+                    size_random = uniform(0.75, 1.0)  # 0.75-1.0 multiplier
+                    size = size_base * size_random
+                elif is_ufo:
+                    # UFO explosion properties: 0.5-1.5 seconds (randomized), 1.0-3.0 pixels
+                    lifetime = uniform(0.5, 1.5)  # 0.5-1.5 seconds (randomized)
+                    size = uniform(1.0, 3.0)  # UFO explosion size: 1.0-3.0 pixels
                 else:
-                    # Interpolate for other sizes
-                    if asteroid_size < 5:
-                        size_base = 1.0 + ((asteroid_size - 1) / 4) * 1.0  # 1 to 2
-                    else:
-                        size_base = 2.0 + ((asteroid_size - 5) / 4) * 2.0  # 2 to 4
-                
-                size_random = random.uniform(0.75, 1.0)  # 0.75-1.0 multiplier
-                size = size_base * size_random
-            elif is_ufo:
-                # UFO explosion properties: 0.5-1.5 seconds (randomized), 1.0-3.0 pixels
-                lifetime = random.uniform(0.5, 1.5)  # 0.5-1.5 seconds (randomized)
-                size = random.uniform(1.0, 3.0)  # UFO explosion size: 1.0-3.0 pixels
-            else:
-                # Default properties for non-asteroid explosions
-                base_lifetime = random.uniform(0.5, 1.5)
-                lifetime = base_lifetime * random.uniform(0.8, 1.2)  # ±20% variation
-                size = random.uniform(1.0, 1.5)  # Default explosion size
-            
-            particle = Particle(spawn_x, spawn_y, vx, vy, particle_color, lifetime, size, use_raw_time)
-            self.particles.append(particle)
-            self.particle_priorities.append(priority)
+                    # Default properties for non-asteroid explosions
+                    base_lifetime = uniform(0.5, 1.5)
+                    lifetime = base_lifetime * uniform(0.8, 1.2)  # ±20% variation
+                    size = uniform(1.0, 1.5)  # Default explosion size
+                
+                particle = new_particle(spawn_x, spawn_y, vx, vy, particle_color, lifetime, size, use_raw_time)
+                add_particle(particle)
+                add_priority(priority)
     
     def add_rainbow_explosion(self, x, y, num_particles=200):
         """Add rainbow color cycling particles for player death"""
@@ -4555,7 +4827,7 @@ class ExplosionSystem:
             
         for _ in range(num_particles):
             # Random velocity in all directions
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.random() * math.tau
             speed = random.uniform(50, 600)  # Increased range for 100% additional randomization
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
@@ -4571,7 +4843,7 @@ class ExplosionSystem:
             lifetime = random.uniform(2.0, 4.0)
             size = random.uniform(1.5, 2.0)  # Player death size range
             
-            particle = Particle(x, y, vx, vy, particle_color, lifetime, size)
+            particle = self.new_particle(x, y, vx, vy, particle_color, lifetime, size)
             self.particles.append(particle)
             self.particle_priorities.append(priority)
     
@@ -4586,7 +4858,7 @@ class ExplosionSystem:
             
         for _ in range(num_particles):
             # Random velocity in all directions
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.random() * math.tau
             speed = random.uniform(75, 300)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
@@ -4613,7 +4885,7 @@ class ExplosionSystem:
             lifetime = random.uniform(1.2, 2.5)
             size = random.uniform(1.25, 3.5)  # Half as big as before
             
-            particle = Particle(x, y, vx, vy, color, lifetime, size)
+            particle = self.new_particle(x, y, vx, vy, color, lifetime, size)
             self.particles.append(particle)
             self.particle_priorities.append(priority)
     
@@ -4629,7 +4901,7 @@ class ExplosionSystem:
         # 4 white particles of various brightnesses (20-80%)
         for _ in range(4):
             # Random direction
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.random() * math.tau
             speed = random.uniform(20, 60)  # Slow speed
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
@@ -4645,14 +4917,14 @@ class ExplosionSystem:
             # Small size (1-2 pixels)
             size = random.uniform(1.0, 2.0)
             
-            particle = Particle(x, y, vx, vy, color, lifetime, size)
+            particle = self.new_particle(x, y, vx, vy, color, lifetime, size)
             self.particles.append(particle)
             self.particle_priorities.append(priority)
         
         # 6 green particles of various brightnesses (25-75%)
         for _ in range(6):
             # Random direction
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.random() * math.tau
             speed = random.uniform(20, 60)  # Slow speed
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
@@ -4668,7 +4940,7 @@ class ExplosionSystem:
             # Small size (1-2 pixels)
             size = random.uniform(1.0, 2.0)
             
-            particle = Particle(x, y, vx, vy, color, lifetime, size)
+            particle = self.new_particle(x, y, vx, vy, color, lifetime, size)
             self.particles.append(particle)
             self.particle_priorities.append(priority)
     
@@ -4716,45 +4988,66 @@ class ExplosionSystem:
             lifetime = random.uniform(0.5, 0.75)
             size = random.uniform(1.0, 2.0)  # Small particles
             
-            particle = Particle(spawn_x, spawn_y, vx, vy, color, lifetime, size)
+            particle = self.new_particle(spawn_x, spawn_y, vx, vy, color, lifetime, size)
             self.particles.append(particle)
             self.particle_priorities.append(priority)
     
     def update(self, dt, screen_width=None, screen_height=None, raw_dt=None):
-        # Use list comprehension for more efficient cleanup
-        # Keep both particles and priorities in sync
-        active_particles = []
-        active_priorities = []
-        
-        # Ensure both lists are the same length
-        min_length = min(len(self.particles), len(self.particle_priorities))
-        
-        for i in range(min_length):
-            particle = self.particles[i]
-            if particle.active:
-                active_particles.append(particle)
-                active_priorities.append(self.particle_priorities[i])
-        
-        # Handle any remaining particles without priorities (assign default priority)
-        for i in range(min_length, len(self.particles)):
-            particle = self.particles[i]
-            if particle.active:
-                active_particles.append(particle)
-                active_priorities.append(1)  # Default low priority
-        
-        self.particles = active_particles
-        self.particle_priorities = active_priorities
-        
-        # Update particles with appropriate time (raw or dilated)
-        for particle in self.particles:
-            if particle.use_raw_time and raw_dt is not None:
-                particle.update(raw_dt, screen_width, screen_height)
+        # One pass drops the particles that died last frame and advances the rest, compacting both
+        # lists in place with a write index (no list copies, no O(n) remove per dead particle)
+        particles = self.particles
+        priorities = self.particle_priorities
+        if len(priorities) < len(particles):
+            # Particles without priorities get the default low priority
+            priorities.extend([1] * (len(particles) - len(priorities)))
+        
+        keep = 0
+        wrap = screen_width is not None and screen_height is not None
+        recycle = self.free_particles.append
+        for index, particle in enumerate(particles):
+            if not particle.active:
+                recycle(particle)  # Died last frame - no longer referenced once compacted away
+                continue
+            particles[keep] = particle
+            priorities[keep] = priorities[index]
+            keep += 1
+            
+            # Particle.update inlined (runs for every live particle every frame) - raw or dilated time
+            step = raw_dt if particle.use_raw_time and raw_dt is not None else dt
+            x = particle.x + particle.vx * step
+            y = particle.y + particle.vy * step
+            lifetime = particle.lifetime - step
+            
+            # Screen wrapping for particles
+            if wrap:
+                if x < 0:
+                    x = screen_width
+                elif x > screen_width:
+                    x = 0
+                if y < 0:
+                    y = screen_height
+                elif y > screen_height:
+                    y = 0
+            particle.x = x
+            particle.y = y
+            
+            # Fade out over time
+            if lifetime <= 0:
+                particle.lifetime = 0
+                particle.active = False
             else:
-                particle.update(dt, screen_width, screen_height)
+                particle.lifetime = lifetime
+        
+        del particles[keep:]
+        del priorities[keep:]  # Also trims any priorities left over from removed particles
     
     def draw(self, screen):
+        # Particle.draw inlined - thousands of particles per frame at the limit
+        draw_circle = pygame.draw.circle
         for particle in self.particles:
-            particle.draw(screen)
+            if particle.active:
+                # Draw particle (ensure minimum size of 1 pixel)
+                draw_circle(screen, particle.color, (int(particle.x), int(particle.y)), max(1, int(particle.size)))
     
     def add_shot_hit_particles(self, x, y):
         """Add particles when player shot hits an object"""
@@ -4767,7 +5060,7 @@ class ExplosionSystem:
             
         # 4 particles with color (255,75,62) with +/-5 variations
         for _ in range(4):
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.random() * math.tau
             speed = random.uniform(60, 80)  # 60-80 units/second speed
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
@@ -4779,13 +5072,13 @@ class ExplosionSystem:
                 random.randint(57, 67)     # 62 +/- 5
             )
             
-            particle = Particle(x, y, vx, vy, particle_color, 0.5, 2.0)  # 0.5 second life
+            particle = self.new_particle(x, y, vx, vy, particle_color, 0.5, 2.0)  # 0.5 second life
             self.particles.append(particle)
             self.particle_priorities.append(priority)
         
         # 3 particles with color (255,229,72) with +/-10 variations
         for _ in range(3):
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.random() * math.tau
             speed = random.uniform(60, 80)  # 60-80 units/second speed
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
@@ -4797,13 +5090,13 @@ class ExplosionSystem:
                 random.randint(62, 82)     # 72 +/- 10
             )
             
-            particle = Particle(x, y, vx, vy, particle_color, 0.5, 2.0)  # 0.5 second life
+            particle = self.new_particle(x, y, vx, vy, particle_color, 0.5, 2.0)  # 0.5 second life
             self.particles.append(particle)
             self.particle_priorities.append(priority)
         
         # 3 particles with color (x,x,x) where x=200-255
         for _ in range(3):
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.random() * math.tau
             speed = random.uniform(60, 80)  # 60-80 units/second speed
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
@@ -4812,7 +5105,7 @@ class ExplosionSystem:
             gray_value = random.randint(200, 255)
             particle_color = (gray_value, gray_value, gray_value)
             
-            particle = Particle(x, y, vx, vy, particle_color, 0.5, 2.0)  # 0.5 second life
+            particle = self.new_particle(x, y, vx, vy, particle_color, 0.5, 2.0)  # 0.5 second life
             self.particles.append(particle)
             self.particle_priorities.append(priority)
     
@@ -4827,7 +5120,7 @@ class ExplosionSystem:
             
         # 4 particles with color (255,75,62) with +/-5 variations - 2x size
         for _ in range(4):
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.random() * math.tau
             speed = random.uniform(60, 80)  # 60-80 units/second speed
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
@@ -4839,13 +5132,13 @@ class ExplosionSystem:
                 random.randint(57, 67)     # 62 +/- 5
             )
             
-            particle = Particle(x, y, vx, vy, particle_color, 0.5, 4.0)  # 2x size (4.0 instead of 2.0)
+            particle = self.new_particle(x, y, vx, vy, particle_color, 0.5, 4.0)  # 2x size (4.0 instead of 2.0)
             self.particles.append(particle)
             self.particle_priorities.append(priority)
         
         # 3 particles with color (255,229,72) with +/-10 variations - 2x size
         for _ in range(3):
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.random() * math.tau
             speed = random.uniform(60, 80)  # 60-80 units/second speed
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
@@ -4857,13 +5150,13 @@ class ExplosionSystem:
                 random.randint(62, 82)     # 72 +/- 10
             )
             
-            particle = Particle(x, y, vx, vy, particle_color, 0.5, 4.0)  # 2x size (4.0 instead of 2.0)
+            particle = self.new_particle(x, y, vx, vy, particle_color, 0.5, 4.0)  # 2x size (4.0 instead of 2.0)
             self.particles.append(particle)
             self.particle_priorities.append(priority)
         
         # 3 particles with color (x,x,x) where x=200-255 - 2x size
         for _ in range(3):
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.random() * math.tau
             speed = random.uniform(60, 80)  # 60-80 units/second speed
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
@@ -4872,7 +5165,7 @@ class ExplosionSystem:
             gray_value = random.randint(200, 255)
             particle_color = (gray_value, gray_value, gray_value)
             
-            particle = Particle(x, y, vx, vy, particle_color, 0.5, 4.0)  # 2x size (4.0 instead of 2.0)
+            particle = self.new_particle(x, y, vx, vy, particle_color, 0.5, 4.0)  # 2x size (4.0 instead of 2.0)
             self.particles.append(particle)
             self.particle_priorities.append(priority)
     
@@ -4927,7 +5220,7 @@ class ExplosionSystem:
             # Low velocity - particles move slowly outward from grid
             speed = random.uniform(5, 15)  # Low velocity range
             # Random direction from the grid position
-            random_angle = random.uniform(0, 2 * math.pi)
+            random_angle = random.random() * math.tau
             vx = math.cos(random_angle) * speed
             vy = math.sin(random_angle) * speed
             
@@ -4949,7 +5242,7 @@ class ExplosionSystem:
             particle_color = random.choice(electric_colors)
             
             # 3 game second lifetime, small size
-            particle = Particle(particle_x, particle_y, vx, vy, particle_color, 3.0, 1.0, use_raw_time=True)
+            particle = self.new_particle(particle_x, particle_y, vx, vy, particle_color, 3.0, 1.0, use_raw_time=True)
             self.particles.append(particle)
             self.particle_priorities.append(priority)
 
@@ -4986,7 +5279,7 @@ class ExplosionSystem:
             base_y = y + 15 * math.sin(rotation_angle)
             
             # Add random offset within 10px diameter (5px radius)
-            offset_angle = random.uniform(0, 2 * math.pi)
+            offset_angle = random.random() * math.tau
             offset_distance = random.uniform(0, 5)  # 5px radius for 10px diameter
             
             particle_x = base_x + offset_distance * math.cos(offset_angle)
@@ -4995,7 +5288,7 @@ class ExplosionSystem:
             # Low velocity - particles move slowly outward
             speed = random.uniform(5, 15)  # Low velocity range
             # Random direction from the circle position
-            random_angle = random.uniform(0, 2 * math.pi)
+            random_angle = random.random() * math.tau
             vx = math.cos(random_angle) * speed + player_vx
             vy = math.sin(random_angle) * speed + player_vy
             
@@ -5003,11 +5296,24 @@ class ExplosionSystem:
             particle_color = random.choice(pink_purple_colors)
             
             # 3 game second lifetime, small size
-            particle = Particle(particle_x, particle_y, vx, vy, particle_color, 3.0, 1.0, use_raw_time=True)
+            particle = self.new_particle(particle_x, particle_y, vx, vy, particle_color, 3.0, 1.0, use_raw_time=True)
             self.particles.append(particle)
             self.particle_priorities.append(priority)
 
 
+class Star:
+    """Background star - slotted since StarField reads and writes every star every frame"""
+    __slots__ = ('x', 'y', 'speed', 'brightness', 'size', 'explosion_speed', 'fade_alpha')
+    
+    def __init__(self, screen_width, screen_height):
+        self.x = random.uniform(0, screen_width)
+        self.y = random.uniform(0, screen_height)
+        self.speed = random.uniform(0.5, 3.0)
+        self.brightness = random.uniform(0.1, 1.2)
+        self.size = random.uniform(0.5, 2.0)
+        self.explosion_speed = random.uniform(400, 1000)  # Speed for explosion effect (doubled)
+        self.fade_alpha = None  # Set while the star fades in after a star explosion
+
 class StarField:
     def __init__(self, num_stars=300):
         self.stars = []
@@ -5028,6 +5334,7 @@ class StarField:
         self.fade_in_duration = 0.4  # 0.4 seconds for visible fade-in
         self.fade_in_stars = []  # New stars that fade in gradually
         self.stars_per_fade_frame = 16  # How many stars to add per frame during fade-in
+        self.trail_layer = None  # Screen-sized alpha layer that all hyperspace trails are drawn onto
         
         # Don't generate stars here - will be generated when screen size is known
     
@@ -5036,15 +5343,7 @@ class StarField:
         self.screen_center_x = screen_width // 2
         self.screen_center_y = screen_height // 2
         for _ in range(self.num_stars):
-            star = {
-                'x': random.uniform(0, screen_width),
-                'y': random.uniform(0, screen_height),
-                'speed': random.uniform(0.5, 3.0),
-                'brightness': random.uniform(0.1, 1.2),
-                'size': random.uniform(0.5, 2.0),
-                'explosion_speed': random.uniform(400, 1000)  # Speed for explosion effect (doubled)
-            }
-            self.stars.append(star)
+            self.stars.append(Star(screen_width, screen_height))
     
     def start_explosion(self, screen_width, screen_height):
         """Start the star explosion effect"""
@@ -5066,15 +5365,8 @@ class StarField:
         
         # Generate all stars but don't add them yet - they'll fade in gradually
         for _ in range(self.num_stars):
-            star = {
-                'x': random.uniform(0, screen_width),
-                'y': random.uniform(0, screen_height),
-                'speed': random.uniform(0.5, 3.0),
-                'brightness': random.uniform(0.1, 1.2),
-                'size': random.uniform(0.5, 2.0),
-                'explosion_speed': random.uniform(400, 1000),
-                'fade_alpha': 0.0  # Start invisible
-            }
+            star = Star(screen_width, screen_height)
+            star.fade_alpha = 0.0  # Start invisible
             self.fade_in_stars.append(star)
     
     def update(self, ship_velocity, screen_width, screen_height, dt=0.016):
@@ -5089,10 +5381,13 @@ class StarField:
                 self.explosion_fade_timer = 0.0
             
             # Move stars outward from center during explosion
+            center_x = self.screen_center_x
+            center_y = self.screen_center_y
+            acceleration = 1.0 + self.explosion_timer * 4.0  # Accelerating (doubled)
             for star in self.stars:
                 # Calculate direction from center to star
-                dx = star['x'] - self.screen_center_x
-                dy = star['y'] - self.screen_center_y
+                dx = star.x - center_x
+                dy = star.y - center_y
                 distance = math.sqrt(dx*dx + dy*dy)
                 
                 if distance > 0:  # Avoid division by zero
@@ -5101,9 +5396,9 @@ class StarField:
                     dy /= distance
                     
                     # Move star outward with increasing speed
-                    explosion_speed = star['explosion_speed'] * (1.0 + self.explosion_timer * 4.0)  # Accelerating (doubled)
-                    star['x'] += dx * explosion_speed * dt
-                    star['y'] += dy * explosion_speed * dt
+                    explosion_speed = star.explosion_speed * acceleration
+                    star.x += dx * explosion_speed * dt
+                    star.y += dy * explosion_speed * dt
         elif self.explosion_fade_mode:
             # Update explosion fade-out timer
             self.explosion_fade_timer += dt
@@ -5122,87 +5417,38 @@ class StarField:
             # Move stars in fade_in_stars list before adding them (so they're not static)
             if ship_velocity:
                 speed_factor = min(ship_velocity.magnitude() / 100.0, 10.0)
-                for star in self.fade_in_stars:
-                    # Move stars opposite to ship movement (normal parallaxing)
-                    star['x'] -= ship_velocity.x * star['speed'] * 0.01 * speed_factor
-                    star['y'] -= ship_velocity.y * star['speed'] * 0.01 * speed_factor
-                    
-                    # Wrap around screen
-                    if star['x'] < 0:
-                        star['x'] = screen_width
-                    elif star['x'] > screen_width:
-                        star['x'] = 0
-                    if star['y'] < 0:
-                        star['y'] = screen_height
-                    elif star['y'] > screen_height:
-                        star['y'] = 0
+                # Move stars opposite to ship movement (normal parallaxing)
+                self._parallax_stars(self.fade_in_stars, ship_velocity, speed_factor, screen_width, screen_height)
             else:
                 # If no ship velocity, still move stars to avoid them appearing stationary
-                for star in self.fade_in_stars:
-                    # Move stars in a gentle drift pattern
-                    star['x'] += star['speed'] * 1.0 * dt
-                    star['y'] += star['speed'] * 0.5 * dt
-                    
-                    # Wrap around screen
-                    if star['x'] < 0:
-                        star['x'] = screen_width
-                    elif star['x'] > screen_width:
-                        star['x'] = 0
-                    if star['y'] < 0:
-                        star['y'] = screen_height
-                    elif star['y'] > screen_height:
-                        star['y'] = 0
+                # Move stars in a gentle drift pattern
+                self._drift_stars(self.fade_in_stars, dt, screen_width, screen_height)
             
             # Gradually add stars to the main star list
             stars_to_add = min(self.stars_per_fade_frame, len(self.fade_in_stars))
             for _ in range(stars_to_add):
                 if self.fade_in_stars:
                     star = self.fade_in_stars.pop(0)
-                    star['fade_alpha'] = 0.0  # Start invisible
+                    star.fade_alpha = 0.0  # Start invisible
                     self.stars.append(star)
             
             # Update fade-in alpha for all visible stars
             for star in self.stars:
-                if 'fade_alpha' in star:
+                if star.fade_alpha is not None:
                     # Gradually increase alpha over the fade-in duration
                     fade_progress = min(self.fade_in_timer / self.fade_in_duration, 1.0)
-                    star['fade_alpha'] = fade_progress
+                    star.fade_alpha = fade_progress
             
             # Apply normal parallaxing behavior during fade-in
             # Always move stars during fade-in, even if ship_velocity is None
             if ship_velocity:
                 speed_factor = min(ship_velocity.magnitude() / 100.0, 10.0)  # Cap at 10x speed for trails
-                
-                for star in self.stars:
-                    # Move stars opposite to ship movement (normal parallaxing)
-                    star['x'] -= ship_velocity.x * star['speed'] * 0.01 * speed_factor
-                    star['y'] -= ship_velocity.y * star['speed'] * 0.01 * speed_factor
-                    
-                    # Wrap around screen
-                    if star['x'] < 0:
-                        star['x'] = screen_width
-                    elif star['x'] > screen_width:
-                        star['x'] = 0
-                    if star['y'] < 0:
-                        star['y'] = screen_height
-                    elif star['y'] > screen_height:
-                        star['y'] = 0
+                # Move stars opposite to ship movement (normal parallaxing)
+                self._parallax_stars(self.stars, ship_velocity, speed_factor, screen_width, screen_height)
             else:
                 # If no ship velocity, still move stars to avoid them appearing stationary
-                for star in self.stars:
-                    # Move stars in a gentle drift pattern to avoid stationary appearance
-                    star['x'] += star['speed'] * 1.0 * dt  # Faster movement
-                    star['y'] += star['speed'] * 0.5 * dt  # Slight vertical drift
-                    
-                    # Wrap around screen
-                    if star['x'] < 0:
-                        star['x'] = screen_width
-                    elif star['x'] > screen_width:
-                        star['x'] = 0
-                    if star['y'] < 0:
-                        star['y'] = screen_height
-                    elif star['y'] > screen_height:
-                        star['y'] = 0
+                # Move stars in a gentle drift pattern to avoid stationary appearance
+                self._drift_stars(self.stars, dt, screen_width, screen_height)
             
             # Check if fade-in is complete
             if self.fade_in_timer >= self.fade_in_duration and not self.fade_in_stars:
@@ -5210,117 +5456,175 @@ class StarField:
                 self.fade_in_timer = 0.0
                 # Remove fade_alpha from all stars as they're now fully visible
                 for star in self.stars:
-                    if 'fade_alpha' in star:
-                        del star['fade_alpha']
+                    star.fade_alpha = None
                 # Clear fade_in_stars list to free memory
                 self.fade_in_stars.clear()
         else:
             # Normal star movement
             speed_factor = min(ship_velocity.magnitude() / 100.0, 10.0)  # Cap at 10x speed for trails
             
-            for star in self.stars:
-                # Move stars opposite to ship movement
-                star['x'] -= ship_velocity.x * star['speed'] * 0.01 * speed_factor
-                star['y'] -= ship_velocity.y * star['speed'] * 0.01 * speed_factor
-                
-                # Wrap around screen
-                if star['x'] < 0:
-                    star['x'] = screen_width
-                elif star['x'] > screen_width:
-                    star['x'] = 0
-                if star['y'] < 0:
-                    star['y'] = screen_height
-                elif star['y'] > screen_height:
-                    star['y'] = 0
+            # Move stars opposite to ship movement
+            self._parallax_stars(self.stars, ship_velocity, speed_factor, screen_width, screen_height)
+    
+    @staticmethod
+    def _parallax_stars(stars, ship_velocity, speed_factor, screen_width, screen_height):
+        """Move stars opposite to the ship velocity and wrap them around the screen"""
+        vx = ship_velocity.x
+        vy = ship_velocity.y
+        for star in stars:
+            speed = star.speed
+            x = star.x - vx * speed * 0.01 * speed_factor
+            y = star.y - vy * speed * 0.01 * speed_factor
+            
+            # Wrap around screen (modulo keeps the overshoot, so no edge snapping)
+            star.x = x % screen_width
+            star.y = y % screen_height
+    
+    @staticmethod
+    def _drift_stars(stars, dt, screen_width, screen_height):
+        """Drift stars gently down-right when there is no ship velocity, wrapping around the screen"""
+        for star in stars:
+            speed = star.speed
+            x = star.x + speed * 1.0 * dt  # Faster movement
+            y = star.y + speed * 0.5 * dt  # Slight vertical drift
+            
+            # Wrap around screen (modulo keeps the overshoot, so no edge snapping)
+            star.x = x % screen_width
+            star.y = y % screen_height
     
     def draw(self, screen, ship_velocity):
         # Handle case where ship_velocity might be None
         if ship_velocity is None:
-            ship_velocity = Vector2D(0, 0)
+            ship_velocity = ZERO_VECTOR
+        
+        explosion_mode = self.explosion_mode
+        explosion_fade_mode = self.explosion_fade_mode
+        normal_mode = not explosion_mode and not explosion_fade_mode
+        raw_speed_factor = min(ship_velocity.magnitude() / 100.0, 10.0)  # Match update method cap
+        fade_progress = min(self.explosion_fade_timer / self.explosion_fade_duration, 1.0)
+        
+        if normal_mode:
+            # Smooth the speed factor once per frame to reduce flickering
+            speed_factor = self.last_speed_factor * 0.8 + raw_speed_factor * 0.2
+            self.last_speed_factor = speed_factor
+            
+            if speed_factor > 0.1:  # Threshold to switch between stationary and moving
+                # When moving: brightness scales with speed AND depth
+                base_brightness = min(speed_factor, 2.0)
+            else:
+                # When stationary or very slow: use individual star brightness with depth
+                base_brightness = 0.3
+            
+            # Trails: starts at 42% Player Speed, max length at 100% Player Speed
+            trail_speed_factor = speed_factor * 0.8 + raw_speed_factor * 0.2
+            draw_trails = trail_speed_factor >= 4.2  # 42% of Player Speed % (420 units/second)
+            # Scale from 0 to 840 pixels as speed goes from 4.2 to 10.0 speed_factor
+            trail_progress = min((trail_speed_factor - 4.2) / 5.8, 1.0)  # 0 to 1 as speed goes from 4.2 to 10.0
+            trail_length = trail_progress * 840  # 0 to 840 pixels (100% longer)
+            ship_vx = ship_velocity.x
+            ship_vy = ship_velocity.y
+        
+        # Normal-mode 1px stars are plotted in batches; hyperspace trails are collected and drawn under them in one layer
+        pixel_xs = []
+        pixel_ys = []
+        pixel_shades = []
+        trail_starts = []
+        trail_circles = []
             
         for star in self.stars:
-            if self.explosion_mode:
+            if explosion_mode:
                 # During explosion: bright stars with trails
-                brightness = int(200 * star['brightness'] * 1.5)  # Brighter during explosion
+                brightness = int(200 * star.brightness * 1.5)  # Brighter during explosion
                 brightness = max(0, min(255, brightness))
                 color = (brightness, brightness, brightness)
-            elif self.explosion_fade_mode:
+            elif explosion_fade_mode:
                 # During explosion fade-out: stars fade from bright to transparent
-                fade_progress = min(self.explosion_fade_timer / self.explosion_fade_duration, 1.0)
-                base_brightness = int(200 * star['brightness'] * 1.5)  # Same as explosion brightness
+                base_brightness = int(200 * star.brightness * 1.5)  # Same as explosion brightness
                 brightness = int(base_brightness * (1.0 - fade_progress))  # Fade from 100% to 0%
                 brightness = max(0, min(255, brightness))
                 color = (brightness, brightness, brightness)
             else:
                 # Normal star behavior (including fade-in mode)
-                # Calculate brightness based on speed with smoothing
-                raw_speed_factor = min(ship_velocity.magnitude() / 100.0, 10.0)  # Match update method cap
-                # Smooth the speed factor to reduce flickering
-                speed_factor = self.last_speed_factor * 0.8 + raw_speed_factor * 0.2
-                self.last_speed_factor = speed_factor
-                
                 # Base brightness calculation with depth-based dimming
-                # Use star['speed'] as depth indicator: slower stars are further back
-                depth_factor = star['speed']  # 0.5 to 3.0 range from star generation
+                # Use star.speed as depth indicator: slower stars are further back
+                depth_factor = star.speed  # 0.5 to 3.0 range from star generation
                 depth_brightness = (depth_factor - 0.5) / 2.5  # Normalize to 0.0 to 1.0
                 depth_brightness = max(0.2, depth_brightness)  # Minimum 20% brightness even for far stars
-                
-                if speed_factor > 0.1:  # Threshold to switch between stationary and moving
-                    # When moving: brightness scales with speed AND depth
-                    base_brightness = min(speed_factor, 2.0)
-                    brightness = int(200 * star['brightness'] * base_brightness * depth_brightness * 0.85)  # 15% dimmer
-                else:
-                    # When stationary or very slow: use individual star brightness with depth
-                    brightness = int(200 * star['brightness'] * 0.3 * depth_brightness * 0.85)  # 15% dimmer
+                brightness = int(200 * star.brightness * base_brightness * depth_brightness * 0.85)  # 15% dimmer
                 
                 # Clamp brightness to valid range
                 brightness = max(0, min(255, brightness))
                 color = (brightness, brightness, brightness)
             
             # Draw star with trail effect (works in normal, explosion, and explosion fade modes)
-            if not self.explosion_mode and not self.explosion_fade_mode:
+            if normal_mode:
                 # Normal mode: trails based on ship speed
-                raw_speed_factor = min(ship_velocity.magnitude() / 100.0, 10.0)  # Match update method cap
-                speed_factor = self.last_speed_factor * 0.8 + raw_speed_factor * 0.2
-                if speed_factor >= 4.2:  # 42% of Player Speed % (420 units/second)
-                    # Draw trail - starts at 42% Player Speed, max length at 100% Player Speed
-                    # Scale from 0 to 30 pixels as speed goes from 4.2 to 10.0 speed_factor
-                    trail_progress = min((speed_factor - 4.2) / 5.8, 1.0)  # 0 to 1 as speed goes from 4.2 to 10.0
-                    trail_length = trail_progress * 840  # 0 to 840 pixels (100% longer)
-                    trail_x = star['x'] + ship_velocity.x * star['speed'] * 0.01 * trail_length
-                    trail_y = star['y'] + ship_velocity.y * star['speed'] * 0.01 * trail_length
+                if draw_trails:
                     trail_brightness = max(0, min(255, brightness//3))
-                    # Electric blue hyperspace trail with alpha fade (fades to 90% transparent at 90%)
-                    self.draw_normal_alpha_trail(screen, star['x'], star['y'], trail_x, trail_y, 
-                                                trail_brightness, trail_length)
-            elif self.explosion_mode or self.explosion_fade_mode:
+                    trail_starts.append((star.x, star.y, trail_brightness))
+            else:
                 # Explosion mode: trails based on explosion movement
                 # Calculate trail based on star's explosion movement direction
-                dx = star['x'] - self.screen_center_x
-                dy = star['y'] - self.screen_center_y
+                dx = star.x - self.screen_center_x
+                dy = star.y - self.screen_center_y
                 distance = math.sqrt(dx*dx + dy*dy)
                 if distance > 0:
                     dx /= distance
                     dy /= distance
                     # Trail length based on explosion speed
                     trail_length = 200  # 10x longer trails during explosion (was 20)
-                    trail_x = star['x'] - dx * trail_length
-                    trail_y = star['y'] - dy * trail_length
+                    trail_x = star.x - dx * trail_length
+                    trail_y = star.y - dy * trail_length
                     trail_brightness = max(0, min(255, brightness//3))
                     
                     # Create alpha trail with gradient fade
-                    self.draw_alpha_trail(screen, star['x'], star['y'], trail_x, trail_y, 
+                    self.draw_alpha_trail(screen, star.x, star.y, trail_x, trail_y, 
                                         trail_brightness, trail_length)
             
             # Apply fade-in alpha if in fade-in mode
-            if self.fade_in_mode and 'fade_alpha' in star:
-                alpha = star['fade_alpha']
+            if self.fade_in_mode and star.fade_alpha is not None:
+                alpha = star.fade_alpha
                 # Apply alpha to the color
                 color = (int(color[0] * alpha), int(color[1] * alpha), int(color[2] * alpha))
             
             # Draw star
-            pygame.draw.circle(screen, color, (int(star['x']), int(star['y'])), max(1, int(star['size'])))
+            radius = max(1, int(star.size))
+            if normal_mode and radius == 1:
+                pixel_xs.append(int(star.x))
+                pixel_ys.append(int(star.y))
+                pixel_shades.append(color[0])
+            elif normal_mode and draw_trails:
+                trail_circles.append((color, (int(star.x), int(star.y)), radius))  # Drawn after the trail layer
+            else:
+                if pixel_xs:
+                    self._plot_star_pixels(screen, pixel_xs, pixel_ys, pixel_shades)
+                    pixel_xs = []
+                    pixel_ys = []
+                    pixel_shades = []
+                pygame.draw.circle(screen, color, (int(star.x), int(star.y)), radius)
+        
+        if trail_starts:
+            # Electric blue hyperspace trails with alpha fade (fades to 90% transparent at 90%)
+            self.draw_normal_alpha_trails(screen, trail_starts, ship_vx, ship_vy, trail_length)
+        if pixel_xs:
+            self._plot_star_pixels(screen, pixel_xs, pixel_ys, pixel_shades)
+        for color, position, radius in trail_circles:
+            pygame.draw.circle(screen, color, position, radius)
     
+    @staticmethod
+    def _plot_star_pixels(screen, xs, ys, shades):
+        """Plot grey radius-1 stars in one surfarray write - the same 2x2 block pygame.draw.circle draws, later stars on top"""
+        width, height = screen.get_size()
+        # Star-major pixel order so overlapping blocks resolve exactly like sequential circle calls
+        xs = (np.array(xs)[:, None] + np.array((-1, 0, -1, 0))).ravel()
+        ys = (np.array(ys)[:, None] + np.array((-1, -1, 0, 0))).ravel()
+        shades = np.repeat(np.array(shades, dtype=np.uint8), 4)
+        on_screen = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        pixels = pygame.surfarray.pixels3d(screen)
+        pixels[xs[on_screen], ys[on_screen]] = shades[on_screen, None]
+        del pixels  # Unlock the surface
+    
+
     def draw_alpha_trail(self, screen, start_x, start_y, end_x, end_y, brightness, trail_length):
         """Draw a trail with alpha gradient from full opacity at start to transparent at end"""
         if trail_length <= 0:
@@ -5391,40 +5695,28 @@ class StarField:
             # Blit to screen at correct position
             screen.blit(segment_surface, (int(min_x - 1), int(min_y - 1)))
     
-    def draw_normal_alpha_trail(self, screen, start_x, start_y, end_x, end_y, brightness, trail_length):
-        """Draw a normal trail with alpha gradient that fades to transparency sooner"""
+    def draw_normal_alpha_trails(self, screen, trail_starts, direction_x, direction_y, trail_length):
+        """Draw every star's normal trail (alpha gradient that fades to transparency sooner) onto one layer and blit it once"""
         if trail_length <= 0:
             return
             
-        # Calculate trail direction and segments
-        dx = end_x - start_x
-        dy = end_y - start_y
-        distance = math.sqrt(dx*dx + dy*dy)
+        # All trails this frame share the ship's direction and length - only start and brightness differ
+        distance = math.sqrt(direction_x*direction_x + direction_y*direction_y)
         
         if distance <= 0:
             return
             
         # Normalize direction
-        dx /= distance
-        dy /= distance
+        dx = direction_x / distance
+        dy = direction_y / distance
         
         # Create segments for gradient effect (more segments for longer trails)
         num_segments = max(3, min(20, int(trail_length / 5)))  # 3-20 segments based on length
         segment_length = trail_length / num_segments
         
-        # Electric blue base color
-        base_r = brightness // 4
-        base_g = brightness // 2  
-        base_b = brightness
-        
-        # Draw each segment with decreasing alpha
+        # Segment offsets from the star and alphas, shared by every trail
+        segments = []
         for i in range(num_segments):
-            # Calculate segment start and end positions
-            seg_start_x = start_x + dx * (i * segment_length)
-            seg_start_y = start_y + dy * (i * segment_length)
-            seg_end_x = start_x + dx * ((i + 1) * segment_length)
-            seg_end_y = start_y + dy * ((i + 1) * segment_length)
-            
             # Calculate alpha for this segment (1.0 at start, 0.1 at 90% of trail, 0.0 at end)
             # Fade to 90% transparency at 90% of the way, then fade to 100% transparency
             trail_progress = i / (num_segments - 1) if num_segments > 1 else 0.0
@@ -5435,32 +5727,28 @@ class StarField:
                 # 90% to 100% of trail: fade from 0.1 to 0.0 (90% to 100% transparency)
                 remaining_progress = (trail_progress - 0.9) / 0.1
                 alpha_progress = 0.1 - (remaining_progress * 0.1)
-            alpha = int(255 * alpha_progress)
-            
-            # Calculate bounding box for this segment
-            min_x = min(seg_start_x, seg_end_x)
-            min_y = min(seg_start_y, seg_end_y)
-            max_x = max(seg_start_x, seg_end_x)
-            max_y = max(seg_start_y, seg_end_y)
-            
-            # Create alpha surface for this segment
-            surface_width = max(1, int(max_x - min_x) + 2)
-            surface_height = max(1, int(max_y - min_y) + 2)
-            segment_surface = pygame.Surface((surface_width, surface_height), pygame.SRCALPHA)
-            
-            # Calculate relative positions within the surface
-            rel_start_x = seg_start_x - min_x + 1
-            rel_start_y = seg_start_y - min_y + 1
-            rel_end_x = seg_end_x - min_x + 1
-            rel_end_y = seg_end_y - min_y + 1
-            
-            # Draw line on alpha surface
-            pygame.draw.line(segment_surface, (base_r, base_g, base_b, alpha), 
-                           (rel_start_x, rel_start_y), (rel_end_x, rel_end_y), 1)
-            
-            # Blit to screen at correct position
-            screen.blit(segment_surface, (int(min_x - 1), int(min_y - 1)))
-
+            segments.append((dx * (i * segment_length), dy * (i * segment_length),
+                             dx * ((i + 1) * segment_length), dy * ((i + 1) * segment_length),
+                             int(255 * alpha_progress)))
+        
+        # Reuse one screen-sized alpha layer instead of a new surface per segment
+        size = screen.get_size()
+        if self.trail_layer is None or self.trail_layer.get_size() != size:
+            self.trail_layer = pygame.Surface(size, pygame.SRCALPHA)
+        layer = self.trail_layer
+        layer.fill((0, 0, 0, 0))
+        
+        draw_line = pygame.draw.line
+        for start_x, start_y, brightness in trail_starts:
+            # Electric blue base color
+            base_r = brightness // 4
+            base_g = brightness // 2  
+            base_b = brightness
+            for seg_start_x, seg_start_y, seg_end_x, seg_end_y, alpha in segments:
+                draw_line(layer, (base_r, base_g, base_b, alpha),
+                          (start_x + seg_start_x, start_y + seg_start_y), (start_x + seg_end_x, start_y + seg_end_y), 1)
+        
+        screen.blit(layer, (0, 0))
 
 class Scoreboard:
     """Handles worldwide scoreboard integration with Google Sheets"""
@@ -5731,6 +6019,8 @@ class Game:
         else:
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("chuckS T A Roids")
+        # The game is keyboard-only - keep mouse events out of the queue so the per-frame event drain stays short
+        pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL])
         self.clock = pygame.time.Clock()
         self.running = False
         self.score = 0
@@ -5782,6 +6072,16 @@ class Game:
         self.fps_update_timer = 0.0
         self.fps_update_interval = 0.1  # Update FPS display every 0.1 seconds
         
+        # Rendered HUD/menu/debug text reused across frames (most lines rarely change)
+        self.text_cache = {}
+        self.skewed_text_cache = {}  # (text, size, color) -> skewed message surface
+        self.level_text_shadow = None  # (level text, shadow surface) of the HUD level line
+        self.fonts = {}  # (size, bold) -> pygame Font, shared by all HUD/menu text
+        self.debug_controls_panel = None  # Pre-composed debug controls panel
+        self.title_text_surface = None  # Gradient + skewed title, built once (48 smoothscaled strips)
+        self.screen_overlays = {}  # alpha -> full-screen black dimming overlay, rebuilt on resize
+        self.ship_asteroid_layer = None  # Full-screen alpha layer reused by draw_ship_as_asteroid
+        
         # Adaptive collision detection system
         self.collision_timers = {
             'ship_asteroid': 0.0,
@@ -5942,7 +6242,8 @@ class Game:
         self.ufo_burst_count = 0  # Number of UFOs per burst (4 for 8+ UFOs)
         self.ufo_burst_delay = 0  # Delay between bursts
         self.ufo_burst_interval = 1.0  # 1 second between bursts
-        self.ufo_burst_corners = [(0, 0), (0, 0), (0, 0), (0, 0)]  # Pre-allocated corner list for bursts
+        self.ufo_spawn_corners = ()  # Screen corners for UFO spawns, rebuilt by get_ufo_spawn_corners on resize
+        self.ufo_spawn_corners_size = None
         
         # Spinning trick message
         self.spinning_trick_timer = 0.0
@@ -6194,28 +6495,8 @@ class Game:
             self.time_dilation_factor += dilation_diff * 2.0 * dt  # Fast acceleration
         else:
             # Decaying: use ship's decay rate for consistency
-            current_speed = self.ship.velocity.magnitude()
-            
-            # Calculate current turning movement with same acceleration curve and cap
-            base_multiplier = 0.01
-            max_multiplier = 0.1
-            acceleration_threshold = 1000.0
-            max_turning_contribution = 250.0  # Cap turning at 250 movement units (25% game speed)
-            
-            if self.ship.accumulated_turning_degrees <= 0:
-                current_turning = 0.0
-            elif self.ship.accumulated_turning_degrees >= acceleration_threshold:
-                current_turning = (acceleration_threshold * base_multiplier + 
-                                 (self.ship.accumulated_turning_degrees - acceleration_threshold) * max_multiplier)
-            else:
-                progress = self.ship.accumulated_turning_degrees / acceleration_threshold
-                current_multiplier = base_multiplier + (max_multiplier - base_multiplier) * (progress ** 2)
-                current_turning = self.ship.accumulated_turning_degrees * current_multiplier
-            
-            # Cap turning movement at 25% game speed (250 movement units)
-            current_turning = min(current_turning, max_turning_contribution)
-            
-            current_total = current_speed + current_turning
+            # Ship speed and capped turning movement were already computed above for this frame
+            current_total = player_speed + turning_movement
             
             # Use much faster decay when total movement is below 5% of 1000
             if current_total < 50.0:  # 5% of 1000
@@ -6568,12 +6849,10 @@ class Game:
         # Create font with scaled size
         base_font_size = 36
         scaled_font_size = int(base_font_size * size_scale)
-        font = pygame.font.Font(None, scaled_font_size)
         
-        # Render score text
+        # Render score text (re-rendered only when the score, size or opacity changes)
         score_text = str(self.score)
-        score_surface = font.render(score_text, True, WHITE)
-        score_surface.set_alpha(int(255 * opacity))
+        score_surface = self.render_text(score_text, scaled_font_size, WHITE, alpha=int(255 * opacity))
         
         # Center the score (below level)
         score_rect = score_surface.get_rect(center=(self.current_width//2, 60))
@@ -6601,8 +6880,7 @@ class Game:
             
             # Render multiplier text
             multiplier_text = f"x{current_multiplier:.1f}"
-            multiplier_surface = font.render(multiplier_text, True, multiplier_color)
-            multiplier_surface.set_alpha(int(255 * multiplier_opacity))
+            multiplier_surface = self.render_text(multiplier_text, scaled_font_size, multiplier_color, alpha=int(255 * multiplier_opacity))
             
             # Position multiplier to the right of score
             multiplier_rect = multiplier_surface.get_rect(center=(self.current_width//2 + 100, 60))
@@ -6920,6 +7198,33 @@ class Game:
             if available_slots > 0:
                 self.asteroids.extend(new_asteroids[:available_slots])
     
+    def get_ufo_spawn_corners(self):
+        """Return the four screen corners for UFO spawns, rebuilt only when the screen size changes"""
+        size = (self.current_width, self.current_height)
+        if self.ufo_spawn_corners_size != size:
+            self.ufo_spawn_corners = (
+                (0, 0),  # Top-left
+                (self.current_width, 0),  # Top-right
+                (0, self.current_height),  # Bottom-left
+                (self.current_width, self.current_height)  # Bottom-right
+            )
+            self.ufo_spawn_corners_size = size
+        return self.ufo_spawn_corners
+    
+    def pick_ufo_personality(self, use_spawn_types=False):
+        """Level-based personality selection with 10% deadly chance"""
+        if random.random() < 0.1:
+            return "deadly"
+        if use_spawn_types and self.level == 1:
+            # Level 1: Use specific types in order if available
+            if self.ufo_spawn_types:
+                return self.ufo_spawn_types.pop(0)
+            return random.choice(UFO_PERSONALITIES)
+        personalities = UFO_LEVEL_PERSONALITIES.get(self.level, UFO_PERSONALITIES)
+        if len(personalities) == 1:
+            return personalities[0]  # No random draw for single-type levels, as before
+        return random.choice(personalities)
+    
     def spawn_ufo(self):
         side = random.randint(0, 1)
         if side == 0:  # Left
@@ -6929,28 +7234,7 @@ class Game:
             x = self.current_width
             y = random.uniform(0, self.current_height)
         
-        # Level-based personality selection with 10% deadly chance
-        if random.random() < 0.1:
-            personality = "deadly"
-        else:
-            if self.level == 1:
-                # Level 1: 1 of each type (defensive for this spawn)
-                personality = "defensive"
-            elif self.level == 2:
-                # Level 2: defensive only
-                personality = "defensive"
-            elif self.level == 3:
-                # Level 3: random between aggressive and defensive
-                personality = random.choice(["aggressive", "defensive"])
-            elif self.level == 4:
-                # Level 4: aggressive only
-                personality = "aggressive"
-            elif self.level == 5:
-                # Level 5: random between all 4 types
-                personality = random.choice(["aggressive", "defensive", "tactical", "swarm"])
-            else:
-                # Level 6+: random between all 4 types
-                personality = random.choice(["aggressive", "defensive", "tactical", "swarm"])
+        personality = self.pick_ufo_personality()
         
         # 3% chance to spawn ability UFO
         if random.random() < 0.03:
@@ -6961,48 +7245,17 @@ class Game:
     
     def spawn_ufo_from_corner(self):
         # Pick a random corner
-        corners = [
-            (0, 0),  # Top-left
-            (self.current_width, 0),  # Top-right
-            (0, self.current_height),  # Bottom-left
-            (self.current_width, self.current_height)  # Bottom-right
-        ]
+        corners = self.get_ufo_spawn_corners()
         x, y = random.choice(corners)
         
-        # Level-based personality selection with 10% deadly chance
-        if random.random() < 0.1:
-            personality = "deadly"
-        else:
-            if self.level == 1:
-                # Level 1: 1 of each type (defensive for this spawn)
-                personality = "defensive"
-            elif self.level == 2:
-                # Level 2: defensive only
-                personality = "defensive"
-            elif self.level == 3:
-                # Level 3: random between aggressive and defensive
-                personality = random.choice(["aggressive", "defensive"])
-            elif self.level == 4:
-                # Level 4: aggressive only
-                personality = "aggressive"
-            elif self.level == 5:
-                # Level 5: random between all 4 types
-                personality = random.choice(["aggressive", "defensive", "tactical", "swarm"])
-            else:
-                # Level 6+: random between all 4 types
-                personality = random.choice(["aggressive", "defensive", "tactical", "swarm"])
+        personality = self.pick_ufo_personality()
         
         self.add_ufo(AdvancedUFO(x, y, personality))
     
     def spawn_ufo_with_personality(self, personality):
         """Spawn a UFO with a specific personality from a random corner"""
         # Pick a random corner
-        corners = [
-            (0, 0),  # Top-left
-            (self.current_width, 0),  # Top-right
-            (0, self.current_height),  # Bottom-left
-            (self.current_width, self.current_height)  # Bottom-right
-        ]
+        corners = self.get_ufo_spawn_corners()
         x, y = random.choice(corners)
         self.add_ufo(AdvancedUFO(x, y, personality))
     
@@ -7020,107 +7273,31 @@ class Game:
         """Spawn a UFO with random personality from the selected corner for this level"""
         x, y = self.ufo_spawn_corner
         
-        # Level-based personality selection with 10% deadly chance
-        if random.random() < 0.1:
-            personality = "deadly"
-        else:
-            if self.level == 2:
-                # Level 2: defensive only
-                personality = "defensive"
-            elif self.level == 3:
-                # Level 3: random between aggressive and defensive
-                personality = random.choice(["aggressive", "defensive"])
-            elif self.level == 4:
-                # Level 4: aggressive only
-                personality = "aggressive"
-            elif self.level == 5:
-                # Level 5: random between all 4 types
-                personality = random.choice(["aggressive", "defensive", "tactical", "swarm"])
-            else:
-                # Level 6+: random between all 4 types
-                personality = random.choice(["aggressive", "defensive", "tactical", "swarm"])
+        personality = self.pick_ufo_personality()
         
         self.add_ufo(AdvancedUFO(x, y, personality))
     
     def spawn_all_ufos_mass(self):
         """Spawn all remaining UFOs at once from all corners"""
-        corners = [
-            (0, 0),  # Top-left
-            (self.current_width, 0),  # Top-right
-            (0, self.current_height),  # Bottom-left
-            (self.current_width, self.current_height)  # Bottom-right
-        ]
+        corners = self.get_ufo_spawn_corners()
         
         for i in range(self.ufos_to_spawn):
             # Pick a random corner for each UFO
             x, y = random.choice(corners)
             
-            # Level-based personality selection with 10% deadly chance
-            if random.random() < 0.1:
-                personality = "deadly"
-            else:
-                if self.level == 1:
-                    # Level 1: Use specific types in order if available
-                    if self.ufo_spawn_types and len(self.ufo_spawn_types) > 0:
-                        personality = self.ufo_spawn_types.pop(0)
-                    else:
-                        personality = random.choice(["aggressive", "defensive", "tactical", "swarm"])
-                elif self.level == 2:
-                    # Level 2: defensive only
-                    personality = "defensive"
-                elif self.level == 3:
-                    # Level 3: random between aggressive and defensive
-                    personality = random.choice(["aggressive", "defensive"])
-                elif self.level == 4:
-                    # Level 4: aggressive only
-                    personality = "aggressive"
-                elif self.level == 5:
-                    # Level 5: random between all 4 types
-                    personality = random.choice(["aggressive", "defensive", "tactical", "swarm"])
-                else:
-                    # Level 6+: random between all 4 types
-                    personality = random.choice(["aggressive", "defensive", "tactical", "swarm"])
+            personality = self.pick_ufo_personality(use_spawn_types=True)
             
             self.add_ufo(AdvancedUFO(x, y, personality))
     
     def spawn_ufo_burst(self, num_ufos):
         """Spawn a burst of UFOs (up to 4) with one per corner"""
-        corners = [
-            (0, 0),  # Top-left
-            (self.current_width, 0),  # Top-right
-            (0, self.current_height),  # Bottom-left
-            (self.current_width, self.current_height)  # Bottom-right
-        ]
+        corners = self.get_ufo_spawn_corners()
         
         # Spawn up to 4 UFOs, one per corner
         for i in range(min(num_ufos, 4)):
             x, y = corners[i]
             
-            # Level-based personality selection with 10% deadly chance
-            if random.random() < 0.1:
-                personality = "deadly"
-            else:
-                if self.level == 1:
-                    # Level 1: Use specific types in order if available
-                    if self.ufo_spawn_types and len(self.ufo_spawn_types) > 0:
-                        personality = self.ufo_spawn_types.pop(0)
-                    else:
-                        personality = random.choice(["aggressive", "defensive", "tactical", "swarm"])
-                elif self.level == 2:
-                    # Level 2: defensive only
-                    personality = "defensive"
-                elif self.level == 3:
-                    # Level 3: random between aggressive and defensive
-                    personality = random.choice(["aggressive", "defensive"])
-                elif self.level == 4:
-                    # Level 4: aggressive only
-                    personality = "aggressive"
-                elif self.level == 5:
-                    # Level 5: random between all 4 types
-                    personality = random.choice(["aggressive", "defensive", "tactical", "swarm"])
-                else:
-                    # Level 6+: random between all 4 types
-                    personality = random.choice(["aggressive", "defensive", "tactical", "swarm"])
+            personality = self.pick_ufo_personality(use_spawn_types=True)
             
             self.add_ufo(AdvancedUFO(x, y, personality))
     
@@ -7269,14 +7446,16 @@ class Game:
             
             bullet_speed = base_speed * speed_multiplier
             angle = self.ship.angle
+            cos_a = math.cos(angle)
+            sin_a = math.sin(angle)
             
             # Add player velocity to bullet velocity
-            vx = math.cos(angle) * bullet_speed + self.ship.velocity.x
-            vy = math.sin(angle) * bullet_speed + self.ship.velocity.y
+            vx = cos_a * bullet_speed + self.ship.velocity.x
+            vy = sin_a * bullet_speed + self.ship.velocity.y
             
             # Spawn bullet slightly in front of the rocket
-            bullet_x = self.ship.position.x + math.cos(angle) * 25
-            bullet_y = self.ship.position.y + math.sin(angle) * 25
+            bullet_x = self.ship.position.x + cos_a * 25
+            bullet_y = self.ship.position.y + sin_a * 25
             
             bullet = Bullet(bullet_x, bullet_y, vx, vy, is_ufo_bullet=False, angle=angle)
             self.bullets.append(bullet)
@@ -7319,14 +7498,16 @@ class Game:
                 
                 bullet_speed = base_speed * speed_multiplier
                 angle = self.ship.angle
+                cos_a = math.cos(angle)
+                sin_a = math.sin(angle)
                 
                 # Add player velocity to bullet velocity
-                vx = math.cos(angle) * bullet_speed + self.ship.velocity.x
-                vy = math.sin(angle) * bullet_speed + self.ship.velocity.y
+                vx = cos_a * bullet_speed + self.ship.velocity.x
+                vy = sin_a * bullet_speed + self.ship.velocity.y
                 
                 # Spawn bullet slightly in front of the rocket
-                bullet_x = self.ship.position.x + math.cos(angle) * 25
-                bullet_y = self.ship.position.y + math.sin(angle) * 25
+                bullet_x = self.ship.position.x + cos_a * 25
+                bullet_y = self.ship.position.y + sin_a * 25
                 
                 bullet = Bullet(bullet_x, bullet_y, vx, vy, is_ufo_bullet=False, angle=angle)
                 self.bullets.append(bullet)
@@ -7365,9 +7546,12 @@ class Game:
         """Update screen shake effect"""
         if self.screen_shake_timer > 0:
             self.screen_shake_timer -= dt
-            # Random shake offset
-            self.screen_shake_x = random.uniform(-self.screen_shake_intensity, self.screen_shake_intensity)
-            self.screen_shake_y = random.uniform(-self.screen_shake_intensity, self.screen_shake_intensity)
+            # Random shake offset - random.uniform(-i, i) inlined (same formula, same draws from the game's RNG)
+            intensity = self.screen_shake_intensity
+            span = 2 * intensity  # b - a for uniform(-i, i)
+            rand = random.random
+            self.screen_shake_x = -intensity + span * rand()
+            self.screen_shake_y = -intensity + span * rand()
         else:
             self.screen_shake_x = 0.0
             self.screen_shake_y = 0.0
@@ -7414,30 +7598,14 @@ class Game:
                     # Generate explosion particles with new color distribution
                     total_particles = 20 + asteroid.size * 5
                     
-                    # 40% gray particles (75-125 range)
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.40), 
-                                                color=(75, 75, 75), asteroid_size=asteroid.size, is_ufo=False, use_raw_time=True)  # Gray
-                    # 20% dark brown particles
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.20), 
-                                                color=(34, 9, 1), asteroid_size=asteroid.size, is_ufo=False, use_raw_time=True)  # Dark brown
-                    # 15% red-brown particles
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.15), 
-                                                color=(98, 23, 8), asteroid_size=asteroid.size, is_ufo=False, use_raw_time=True)  # Red-brown
-                    # 10% orange-red particles
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.10), 
-                                                color=(148, 27, 12), asteroid_size=asteroid.size, is_ufo=False, use_raw_time=True)  # Orange-red
-                    # 8% orange particles
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.08), 
-                                                color=(188, 57, 8), asteroid_size=asteroid.size, is_ufo=False, use_raw_time=True)  # Orange
-                    # 7% golden particles
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.07), 
-                                                color=(246, 170, 28), asteroid_size=asteroid.size, is_ufo=False, use_raw_time=True)  # Golden
+                    self.explosions.add_explosion_multicolor(asteroid.position.x, asteroid.position.y, (
+                        (int(total_particles * 0.40), (75, 75, 75)),  # 40% gray particles (75-125 range)
+                        (int(total_particles * 0.20), (34, 9, 1)),  # 20% dark brown particles
+                        (int(total_particles * 0.15), (98, 23, 8)),  # 15% red-brown particles
+                        (int(total_particles * 0.10), (148, 27, 12)),  # 10% orange-red particles
+                        (int(total_particles * 0.08), (188, 57, 8)),  # 8% orange particles
+                        (int(total_particles * 0.07), (246, 170, 28)),  # 7% golden particles
+                    ), asteroid_size=asteroid.size, is_ufo=False, use_raw_time=True)
                     
                     # Add score (like normal asteroid hit)
                     self.add_score(asteroid.size * 1, "asteroid shot")
@@ -7501,15 +7669,10 @@ class Game:
             if ufo.active:
                 # Add explosion particles for each destroyed UFO (5 bright white, 45 electric blue)
                 
-                # 5 bright white particles (matching Copy 3)
-                self.explosions.add_explosion(ufo.position.x, ufo.position.y, 
-                                            num_particles=5, 
-                                            color=(255, 255, 255), is_ufo=True)  # Bright white
-                
-                # 45 electric blue particles (matching Copy 3)
-                self.explosions.add_explosion(ufo.position.x, ufo.position.y, 
-                                            num_particles=45, 
-                                            color=(0, 150, 255), is_ufo=True)  # Electric blue
+                self.explosions.add_explosion_multicolor(ufo.position.x, ufo.position.y, (
+                    (5, (255, 255, 255)),  # 5 bright white particles (matching Copy 3)
+                    (45, (0, 150, 255)),  # 45 electric blue particles (matching Copy 3)
+                ), is_ufo=True)
                 
                 # Mark UFO as inactive
                 ufo.active = False
@@ -7527,7 +7690,7 @@ class Game:
             return
             
         for _ in range(200):
-            angle = random.uniform(0, 2 * math.pi)
+            angle = random.random() * math.tau
             speed = random.uniform(80, 300)  # Increased speed range
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
@@ -7542,7 +7705,7 @@ class Game:
                 color = (100, 200, 255)  # Electric blue
             
             # Create particle with varied size and lifetime
-            particle = Particle(
+            particle = self.explosions.new_particle(
                 x=center_x,
                 y=center_y,
                 vx=vx,
@@ -7609,18 +7772,11 @@ class Game:
                     # Generate particles for all asteroids (6 white, 2 yellow, 2 red)
                     for asteroid in self.asteroids[:]:
                         if asteroid.active:
-                            # 6 white particles
-                            self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                        num_particles=6, color=(255, 255, 255), 
-                                                        asteroid_size=asteroid.size, is_ufo=False, use_raw_time=True)
-                            # 2 yellow particles
-                            self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                        num_particles=2, color=(255, 255, 0), 
-                                                        asteroid_size=asteroid.size, is_ufo=False, use_raw_time=True)
-                            # 2 red particles
-                            self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                        num_particles=2, color=(255, 0, 0), 
-                                                        asteroid_size=asteroid.size, is_ufo=False, use_raw_time=True)
+                            self.explosions.add_explosion_multicolor(asteroid.position.x, asteroid.position.y, (
+                                (6, (255, 255, 255)),  # 6 white particles
+                                (2, (255, 255, 0)),  # 2 yellow particles
+                                (2, (255, 0, 0)),  # 2 red particles
+                            ), asteroid_size=asteroid.size, is_ufo=False, use_raw_time=True)
                     
                     # Generate particles for all UFOs (6 white, 2 yellow, 2 red)
                     for ufo in self.ufos[:]:
@@ -7665,7 +7821,7 @@ class Game:
                     return
                     
                 for _ in range(200):
-                    angle = random.uniform(0, 2 * math.pi)
+                    angle = random.random() * math.tau
                     speed = random.uniform(100, 400)
                     vx = math.cos(angle) * speed
                     vy = math.sin(angle) * speed
@@ -7680,129 +7836,184 @@ class Game:
                     
                     lifetime = random.uniform(1.0, 2.0)
                     size = 1.5
-                    particle = Particle(self.ship.position.x, self.ship.position.y, vx, vy, color, lifetime, size)
+                    particle = self.explosions.new_particle(self.ship.position.x, self.ship.position.y, vx, vy, color, lifetime, size)
                     self.explosions.particles.append(particle)
                     self.explosions.particle_priorities.append(priority)
         except Exception as e:
             # Error in activate_ability - silent error handling
             pass
     
+    def handle_bullet_asteroid_hit(self, bullet, asteroid):
+        """Apply a player bullet hitting an asteroid; returns True when the bullet is spent"""
+        # Hit!
+        bullet.active = False
+        asteroid.active = False
+        
+        # Add shot hit particles
+        self.explosions.add_shot_hit_particles(asteroid.position.x, asteroid.position.y)
+        
+        # Add screen shake for asteroid sizes 5+ only
+        intensity, duration = get_asteroid_shake_params(asteroid.size)
+        if intensity > 0:
+            self.trigger_screen_shake(intensity, duration)
+        
+        # Add explosion particles (new scaling formula)
+        self.explosions.add_explosion_multicolor(asteroid.position.x, asteroid.position.y,
+                                                 ASTEROID_EXPLOSION_BATCHES[asteroid.size], asteroid_size=asteroid.size)
+        
+        # Add score (size 4 = 44 points, size 3 = 33, etc.)
+        self.asteroids_destroyed_this_level += 1  # Track asteroid destroyed by player
+        self.add_score(asteroid.size * 11, "asteroid shot")
+        
+        # Check if this was a circled asteroid and give rewards
+        if "show_circle" in asteroid.tags:
+            # 100% chance to fully recharge shields
+            self.ship.shield_hits = self.ship.max_shield_hits
+            # Trigger shield recharge animation
+            self.ship.shield_recharge_timer = 1.0  # 1 second animation
+            
+            # 100% chance to charge ability rings (1-2 based on current charges)
+            if self.ship.ability_charges < self.ship.max_ability_charges:
+                # Charge 1 ring if at 0, charge 2 rings if at 1
+                rings_to_add = 1 if self.ship.ability_charges == 0 else 2
+                self.ship.ability_charges = min(self.ship.max_ability_charges, self.ship.ability_charges + rings_to_add)
+                # Trigger ability recharge animation
+                self.ship.ability_recharge_pulse_timer = 1.0  # 1 second animation
+            
+            # Add UI message
+            self.show_nice_shot_message = True
+            self.nice_shot_timer = 2.0  # Show for 2 seconds
+        
+        # Check if this is an ability asteroid and grant ability charges
+        if hasattr(asteroid, 'is_ability_asteroid') and asteroid.is_ability_asteroid:
+            if asteroid.grant_ability_charges(self.ship):
+                # Add special score bonus for ability asteroid
+                self.add_score(100, "ability asteroid")
+                # Add special explosion effect
+                self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
+                                            num_particles=30, 
+                                            color=(100, 255, 100), is_ufo=False)  # Green explosion
+        
+        # Increase shot rate for destroying asteroid
+        self.ship.asteroid_interval_bonus += 0.0001
+        
+        # Split asteroid with projectile velocity (only if not ability asteroid)
+        if not (hasattr(asteroid, 'is_ability_asteroid') and asteroid.is_ability_asteroid):
+            new_asteroids = asteroid.split(bullet.velocity, self.level)
+            self._add_asteroids_with_limit(new_asteroids)
+            
+            # Check if this was the last active asteroid after splitting
+            if not any(a.active for a in self.asteroids):  # Stops at the first active asteroid
+                # Last asteroid destroyed - make player invulnerable until new level
+                self.ship.invulnerable = True
+                self.ship.invulnerable_time = 10.0  # Long duration to cover level transition
+            return True  # Bullet is spent - stop checking it
+        else:
+            # For ability asteroids that don't split, check if this was the last one
+            if not any(a.active for a in self.asteroids):  # Stops at the first active asteroid
+                # Last asteroid destroyed - make player invulnerable until new level
+                self.ship.invulnerable = True
+                self.ship.invulnerable_time = 10.0  # Long duration to cover level transition
+        return False
+    
+    def get_position_array(self, objects):
+        """Positions of the active objects as an (N, 2) array for vectorized distance checks"""
+        return np.array([(obj.position.x, obj.position.y) for obj in objects if obj.active], dtype=float).reshape(-1, 2)
+    
+    def count_positions_within(self, positions, x, y, radius):
+        """Count rows of an (N, 2) position array within radius of (x, y)"""
+        if not len(positions):
+            return 0
+        offsets = positions - (x, y)
+        return int(np.count_nonzero(np.einsum('ij,ij->i', offsets, offsets) < radius * radius))
+    
+    def find_wrapped_collision_pairs(self, centers_a, radii_a, centers_b, radii_b):
+        """Vectorized wrapped circle test - returns hits[i, j] for every a/b pair"""
+        a = np.array(centers_a, dtype=float).reshape(-1, 2)
+        b = np.array(centers_b, dtype=float).reshape(-1, 2)
+        width = self.current_width
+        height = self.current_height
+        
+        # Shortest distance on each axis when the screen wraps around
+        dx = np.abs(a[:, 0, None] - b[None, :, 0]) % width
+        dx = np.minimum(dx, width - dx)
+        dy = np.abs(a[:, 1, None] - b[None, :, 1]) % height
+        dy = np.minimum(dy, height - dy)
+        
+        reach = np.asarray(radii_a, dtype=float)[:, None] + np.asarray(radii_b, dtype=float)[None, :]
+        return dx * dx + dy * dy < reach * reach
+    
+    def build_asteroid_grid(self):
+        """Wrapped grid of every asteroid by hitbox center, or None when there are too few to be worth it"""
+        if len(self.asteroids) < COLLISION_GRID_MIN_ASTEROIDS:
+            return None
+        grid = WrappedSpatialHash(COLLISION_GRID_CELL_SIZE, self.current_width, self.current_height)
+        for asteroid in self.asteroids:
+            center = asteroid.get_hitbox_center()
+            grid.insert(asteroid, center.x, center.y, asteroid.radius)
+        return grid
+    
+    def get_asteroid_candidates(self, asteroid_grid, x, y, radius):
+        """Asteroids in list order that may touch the circle at (x, y) - includes fragments added after the grid was built"""
+        if asteroid_grid is None:
+            return self.asteroids[:]
+        candidates = asteroid_grid.query(x, y, radius)
+        if len(self.asteroids) > asteroid_grid.count:
+            candidates += self.asteroids[asteroid_grid.count:]
+        return candidates
+    
     def check_collisions(self):
         # Bullet vs Asteroid (with screen wrapping) - Medium Priority
         if self.should_check_collision('bullet_asteroid', 1.0/60.0):
-            for bullet in self.bullets[:]:
-                if not bullet.active:
-                    continue
-                for asteroid in self.asteroids[:]:
-                    if not asteroid.active:
-                        continue
-                    # Check collision with screen wrapping
-                    if self.check_wrapped_collision(bullet.position, asteroid.get_hitbox_center(), bullet.radius, asteroid.radius):
-                        # Hit!
-                        bullet.active = False
-                        asteroid.active = False
-                        
-                        # Add shot hit particles
-                        self.explosions.add_shot_hit_particles(asteroid.position.x, asteroid.position.y)
-                        
-                        # Add screen shake for asteroid sizes 5+ only
-                        intensity, duration = get_asteroid_shake_params(asteroid.size)
-                        if intensity > 0:
-                            self.trigger_screen_shake(intensity, duration)
-                        
-                        # Add explosion particles (new scaling formula)
-                        total_particles = int((20 + ((2 * asteroid.size) * 20)) * 0.5)  # 50% fewer particles
-                        
-                        # 40% gray particles (75-125 range)
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.40), 
-                                                    color=(75, 75, 75), asteroid_size=asteroid.size)  # Gray
-                        # 20% dark brown particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.20), 
-                                                    color=(34, 9, 1), asteroid_size=asteroid.size)  # Dark brown
-                        # 15% red-brown particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.15), 
-                                                    color=(98, 23, 8), asteroid_size=asteroid.size)  # Red-brown
-                        # 10% orange-red particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.10), 
-                                                    color=(148, 27, 12), asteroid_size=asteroid.size)  # Orange-red
-                        # 8% orange particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.08), 
-                                                    color=(188, 57, 8), asteroid_size=asteroid.size)  # Orange
-                        # 7% golden particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.07), 
-                                                    color=(246, 170, 28), asteroid_size=asteroid.size)  # Golden
-                        
-                        # Add score (size 4 = 44 points, size 3 = 33, etc.)
-                        self.asteroids_destroyed_this_level += 1  # Track asteroid destroyed by player
-                        self.add_score(asteroid.size * 11, "asteroid shot")
-                        
-                        # Check if this was a circled asteroid and give rewards
-                        if "show_circle" in asteroid.tags:
-                            # 100% chance to fully recharge shields
-                            self.ship.shields = self.ship.max_shield_hits
-                            # Trigger shield recharge animation
-                            self.ship.shield_recharge_timer = 1.0  # 1 second animation
-                            
-                            # 100% chance to charge ability rings (1-2 based on current charges)
-                            if self.ship.ability_charges < self.ship.max_ability_charges:
-                                # Charge 1 ring if at 0, charge 2 rings if at 1
-                                rings_to_add = 1 if self.ship.ability_charges == 0 else 2
-                                self.ship.ability_charges = min(self.ship.max_ability_charges, self.ship.ability_charges + rings_to_add)
-                                # Trigger ability recharge animation
-                                self.ship.ability_recharge_pulse_timer = 1.0  # 1 second animation
-                            
-                            # Add UI message
-                            self.show_nice_shot_message = True
-                            self.nice_shot_timer = 2.0  # Show for 2 seconds
-                        
-                        # Check if this is an ability asteroid and grant ability charges
-                        if hasattr(asteroid, 'is_ability_asteroid') and asteroid.is_ability_asteroid:
-                            if asteroid.grant_ability_charges(self.ship):
-                                # Add special score bonus for ability asteroid
-                                self.add_score(100, "ability asteroid")
-                                # Add special explosion effect
-                                self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                            num_particles=30, 
-                                                            color=(100, 255, 100), is_ufo=False)  # Green explosion
-                        
-                        # Increase shot rate for destroying asteroid
-                        self.ship.asteroid_interval_bonus += 0.0001
-                        
-                        # Split asteroid with projectile velocity (only if not ability asteroid)
-                        if not (hasattr(asteroid, 'is_ability_asteroid') and asteroid.is_ability_asteroid):
-                            new_asteroids = asteroid.split(bullet.velocity, self.level)
-                            self._add_asteroids_with_limit(new_asteroids)
-                            
-                            # Check if this was the last active asteroid after splitting
-                            remaining_asteroids = len([a for a in self.asteroids if a.active])
-                            if remaining_asteroids == 0:
-                                # Last asteroid destroyed - make player invulnerable until new level
-                                self.ship.invulnerable = True
-                                self.ship.invulnerable_time = 10.0  # Long duration to cover level transition
+            bullets = [bullet for bullet in self.bullets if bullet.active]
+            asteroids = [asteroid for asteroid in self.asteroids if asteroid.active]
+            if bullets and asteroids:
+                # One broadcast distance test for every bullet/asteroid pair
+                hitbox_centers = [asteroid.get_hitbox_center() for asteroid in asteroids]
+                hit_matrix = self.find_wrapped_collision_pairs(
+                    [(bullet.position.x, bullet.position.y) for bullet in bullets],
+                    [bullet.radius for bullet in bullets],
+                    [(center.x, center.y) for center in hitbox_centers],
+                    [asteroid.radius for asteroid in asteroids])
+                bullet_hits = hit_matrix.any(axis=1).tolist()  # Most bullets hit nothing - skip their rows
+                checked_asteroids = set(map(id, asteroids))
+                fragments_added = False
+                
+                for bullet_index, bullet in enumerate(bullets):
+                    # Asteroids this bullet overlapped at the start of the pass, in list order
+                    candidates = [asteroids[j] for j in np.flatnonzero(hit_matrix[bullet_index])] if bullet_hits[bullet_index] else []
+                    # Fragments split off earlier in this pass are not in the matrix - test them directly
+                    if fragments_added:
+                        candidates += [asteroid for asteroid in self.asteroids
+                                       if asteroid.active and id(asteroid) not in checked_asteroids and
+                                       self.check_wrapped_collision(bullet.position, asteroid.get_hitbox_center(), bullet.radius, asteroid.radius)]
+                    for asteroid in candidates:
+                        if not asteroid.active:
+                            continue
+                        if self.handle_bullet_asteroid_hit(bullet, asteroid):
+                            fragments_added = True
                             break
-                        else:
-                            # For ability asteroids that don't split, check if this was the last one
-                            remaining_asteroids = len([a for a in self.asteroids if a.active])
-                            if remaining_asteroids == 0:
-                                # Last asteroid destroyed - make player invulnerable until new level
-                                self.ship.invulnerable = True
-                                self.ship.invulnerable_time = 10.0  # Long duration to cover level transition
         
         # Bullet vs UFO (with screen wrapping) - Medium Priority
         if self.should_check_collision('bullet_ufo', 1.0/60.0):
-            for bullet in self.bullets[:]:
-                if not bullet.active:
-                    continue
-                for ufo in self.ufos[:]:
-                    if not ufo.active:
-                        continue
-                    if self.check_wrapped_collision(bullet.position, ufo.get_hitbox_center(), bullet.radius, ufo.radius):
+            bullets = [bullet for bullet in self.bullets if bullet.active]
+            ufos = [ufo for ufo in self.ufos if ufo.active]
+            if bullets and ufos:
+                # One broadcast distance test for every bullet/UFO pair (UFOs do not move during the pass)
+                hitbox_centers = [ufo.get_hitbox_center() for ufo in ufos]
+                hit_matrix = self.find_wrapped_collision_pairs(
+                    [(bullet.position.x, bullet.position.y) for bullet in bullets],
+                    [bullet.radius for bullet in bullets],
+                    [(center.x, center.y) for center in hitbox_centers],
+                    [ufo.radius for ufo in ufos])
+                
+                # Only bullets touching at least one UFO, in list order
+                for bullet_index in np.flatnonzero(hit_matrix.any(axis=1)):
+                    bullet = bullets[bullet_index]
+                    for ufo_index in np.flatnonzero(hit_matrix[bullet_index]):
+                        ufo = ufos[ufo_index]
+                        if not ufo.active:
+                            continue
                         # Hit!
                         bullet.active = False
                         
@@ -7980,13 +8191,27 @@ class Game:
                                         )
                             break
         
+        # Asteroids by hitbox center for the remaining circle-vs-asteroid tests (None = test them all)
+        asteroid_grid = self.build_asteroid_grid()
+        
+        # Active-only snapshots for the remaining passes - none of them adds UFOs, bosses or shots,
+        # and anything destroyed along the way is still skipped by the per-object active checks
+        active_ufos = [ufo for ufo in self.ufos if ufo.active]
+        active_bosses = [boss for boss in self.bosses if boss.active]
+        active_bullets = [bullet for bullet in self.bullets if bullet.active]
+        active_ufo_bullets = [bullet for bullet in self.ufo_bullets if bullet.active]
+        
         # Ship vs Asteroid (with screen wrapping) - High Priority
         if self.ship.active and not self.ship.invulnerable and not self.god_mode:
             if self.should_check_collision('ship_asteroid', 1.0/60.0):
-                for asteroid in self.asteroids:
+                # The ship only changes (respawn) right before the loop breaks, so read it once
+                ship_position = self.ship.position
+                ship_radius = self.ship.radius
+                check_wrapped_collision = self.check_wrapped_collision
+                for asteroid in self.get_asteroid_candidates(asteroid_grid, ship_position.x, ship_position.y, ship_radius):
                     if not asteroid.active:
                         continue
-                    if self.check_wrapped_collision(self.ship.position, asteroid.get_hitbox_center(), self.ship.radius, asteroid.radius):
+                    if check_wrapped_collision(ship_position, asteroid.get_hitbox_center(), ship_radius, asteroid.radius):
                         # Collision!
                         # Player hit by asteroid
                         if self.ship.shield_hits > 0:
@@ -8019,7 +8244,7 @@ class Game:
                             # Check if this was a circled asteroid and give rewards
                             if "show_circle" in asteroid.tags:
                                 # 100% chance to fully recharge shields
-                                self.ship.shields = self.ship.max_shield_hits
+                                self.ship.shield_hits = self.ship.max_shield_hits
                                 # Trigger shield recharge animation
                                 self.ship.shield_recharge_timer = 1.0  # 1 second animation
                                 
@@ -8039,8 +8264,7 @@ class Game:
                             self.ship.asteroid_interval_bonus += 0.0001
                             
                             # Check if this was the last active asteroid
-                            remaining_asteroids = len([a for a in self.asteroids if a.active])
-                            if remaining_asteroids == 0:
+                            if not any(a.active for a in self.asteroids):  # Stops at the first active asteroid
                                 # Last asteroid destroyed - make player invulnerable until new level
                                 self.ship.invulnerable = True
                                 self.ship.invulnerable_time = 10.0  # Long duration to cover level transition
@@ -8094,13 +8318,14 @@ class Game:
                         break
         
         # UFO vs Asteroid (with screen wrapping) - UFOs break asteroids on collision
-        for ufo in self.ufos[:]:
+        for ufo in active_ufos:
             if not ufo.active:
                 continue
-            for asteroid in self.asteroids[:]:
+            ufo_center = ufo.get_hitbox_center()
+            for asteroid in self.get_asteroid_candidates(asteroid_grid, ufo_center.x, ufo_center.y, ufo.radius):
                 if not asteroid.active:
                     continue
-                if self.check_wrapped_collision(ufo.get_hitbox_center(), asteroid.get_hitbox_center(), ufo.radius, asteroid.radius):
+                if self.check_wrapped_collision(ufo_center, asteroid.get_hitbox_center(), ufo.radius, asteroid.radius):
                     # UFO hits asteroid - break the asteroid
                     asteroid.active = False
                     
@@ -8212,44 +8437,8 @@ class Game:
                         self.trigger_screen_shake(intensity, duration)
                     
                     # Add explosion particles
-                    total_particles = int((20 + ((2 * asteroid.size) * 20)) * 0.5)  # 50% fewer particles
-                    
-                    # 30% Gray particles (75, 75, 75) with ±50 value variations (75-125 range)
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.30), 
-                                                color=(75, 75, 75), asteroid_size=asteroid.size)  # Gray
-                    # 5% Dark brown particles (34, 9, 1) with ±2 color variations
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.05), 
-                                                color=(34, 9, 1), asteroid_size=asteroid.size)  # Dark brown
-                    # 5% Red-brown particles (98, 23, 8) with ±4 color variations
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.05), 
-                                                color=(98, 23, 8), asteroid_size=asteroid.size)  # Red-brown
-                    # 20% Red particles (255, 50, 50) - Bright red
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.20), 
-                                                color=(255, 50, 50), asteroid_size=asteroid.size)  # Red
-                    # 5% Orange-red particles (148, 27, 12) with ±5 color variations
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.05), 
-                                                color=(148, 27, 12), asteroid_size=asteroid.size)  # Orange-red
-                    # 5% Orange particles (188, 57, 8) with ±10 color variations
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.05), 
-                                                color=(188, 57, 8), asteroid_size=asteroid.size)  # Orange
-                    # 15% Orange particles (255, 150, 0) - Orange-red
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.15), 
-                                                color=(255, 150, 0), asteroid_size=asteroid.size)  # Orange
-                    # 5% Golden particles (246, 170, 28) with ±15 color variations
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.05), 
-                                                color=(246, 170, 28), asteroid_size=asteroid.size)  # Golden
-                    # 10% Yellow particles (255, 255, 100) - Bright yellow
-                    self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.10), 
-                                                color=(255, 255, 100), asteroid_size=asteroid.size)  # Yellow
+                    self.explosions.add_explosion_multicolor(asteroid.position.x, asteroid.position.y,
+                                                             UFO_ASTEROID_EXPLOSION_BATCHES[asteroid.size], asteroid_size=asteroid.size)
                     
                     # No points for UFO-asteroid collision
                     
@@ -8259,10 +8448,10 @@ class Game:
                     break
         
         # UFO vs UFO (with screen wrapping) - 5% chance to spinout on collision
-        for i, ufo1 in enumerate(self.ufos[:]):
+        for i, ufo1 in enumerate(active_ufos):
             if not ufo1.active:
                 continue
-            for j, ufo2 in enumerate(self.ufos[i+1:], i+1):  # Avoid checking same pair twice
+            for ufo2 in active_ufos[i+1:]:  # Avoid checking same pair twice
                 if not ufo2.active:
                     continue
                 if self.check_wrapped_collision(ufo1.position, ufo2.position, ufo1.radius, ufo2.radius):
@@ -8428,10 +8617,10 @@ class Game:
                     break
         
         # UFO vs Boss (with screen wrapping) - Spinning UFOs explode after collision delay, non-spinning pass through
-        for ufo in self.ufos[:]:
+        for ufo in active_ufos:
             if not ufo.active:
                 continue
-            for boss in self.bosses[:]:
+            for boss in active_bosses:
                 if not boss.active:
                     continue
                 # Check collision between UFO and boss using boss's polygon collision method
@@ -8479,10 +8668,12 @@ class Game:
         if self.ship.active and not self.ship.invulnerable and not self.god_mode:
             # Flag to prevent multiple UFO collisions per frame
             ufo_collision_handled = False
-            for ufo in self.ufos:
+            ship_position = self.ship.position  # Read once - a hit always ends the loop
+            ship_radius = self.ship.radius
+            for ufo in active_ufos:
                 if not ufo.active:
                     continue
-                if self.check_wrapped_collision(self.ship.position, ufo.get_hitbox_center(), self.ship.radius, ufo.radius):
+                if self.check_wrapped_collision(ship_position, ufo.get_hitbox_center(), ship_radius, ufo.radius):
                     # Collision!
                     # Player hit by UFO
                     
@@ -8509,12 +8700,9 @@ class Game:
                             self.ship.red_flash_timer = self.ship.red_flash_duration  # Trigger red flash
                             
                             # Add camera shake based on remaining shields (subject to time dilation)
-                            if self.ship.shield_hits == 2:  # Lost first shield (3/3 -> 2/3)
-                                self.trigger_screen_shake(1, 0.2, self.time_dilation_factor)  # Light shake
-                            elif self.ship.shield_hits == 1:  # Lost second shield (2/3 -> 1/3)
-                                self.trigger_screen_shake(3, 0.4, self.time_dilation_factor)  # Medium shake
-                            elif self.ship.shield_hits == 0:  # Lost last shield (1/3 -> 0/3)
-                                self.trigger_screen_shake(5, 0.6, self.time_dilation_factor)  # Strong shake
+                            intensity, duration, time_dilation = get_shield_damage_shake_params(self.ship.shield_hits, self.time_dilation_factor)
+                            if intensity > 0:
+                                self.trigger_screen_shake(intensity, duration, time_dilation)
                             
                             # Add shot hit particles for collision
                             self.explosions.add_shot_hit_particles(ufo.position.x, ufo.position.y)
@@ -8555,12 +8743,10 @@ class Game:
                             ufo.active = False
                             
                             # Add explosion particles
-                            self.explosions.add_explosion(self.ship.position.x, self.ship.position.y, 
-                                                        num_particles=120, 
-                                                        color=(255, 100, 0), is_ufo=False)
-                            self.explosions.add_explosion(self.ship.position.x, self.ship.position.y, 
-                                                        num_particles=20, 
-                                                        color=(255, 255, 255), is_ufo=False)
+                            self.explosions.add_explosion_multicolor(self.ship.position.x, self.ship.position.y, (
+                                (120, (255, 100, 0)),  # Orange
+                                (20, (255, 255, 255)),  # White
+                            ), is_ufo=False)
                             
                             # Decrease lives and check if game over
                             self.lives -= 1
@@ -8602,12 +8788,9 @@ class Game:
                             self.ship.red_flash_timer = self.ship.red_flash_duration  # Trigger red flash
                             
                             # Add camera shake based on remaining shields (subject to time dilation)
-                            if self.ship.shield_hits == 2:  # Lost first shield (3/3 -> 2/3)
-                                self.trigger_screen_shake(1, 0.2, self.time_dilation_factor)  # Light shake
-                            elif self.ship.shield_hits == 1:  # Lost second shield (2/3 -> 1/3)
-                                self.trigger_screen_shake(3, 0.4, self.time_dilation_factor)  # Medium shake
-                            elif self.ship.shield_hits == 0:  # Lost last shield (1/3 -> 0/3)
-                                self.trigger_screen_shake(5, 0.6, self.time_dilation_factor)  # Strong shake
+                            intensity, duration, time_dilation = get_shield_damage_shake_params(self.ship.shield_hits, self.time_dilation_factor)
+                            if intensity > 0:
+                                self.trigger_screen_shake(intensity, duration, time_dilation)
                             
                             # Add shot hit particles for collision
                             self.explosions.add_shot_hit_particles(ufo.position.x, ufo.position.y)
@@ -8648,12 +8831,10 @@ class Game:
                             ufo.active = False
                             
                             # Add explosion particles
-                            self.explosions.add_explosion(self.ship.position.x, self.ship.position.y, 
-                                                        num_particles=120, 
-                                                        color=(255, 100, 0), is_ufo=False)
-                            self.explosions.add_explosion(self.ship.position.x, self.ship.position.y, 
-                                                        num_particles=20, 
-                                                        color=(255, 255, 255), is_ufo=False)
+                            self.explosions.add_explosion_multicolor(self.ship.position.x, self.ship.position.y, (
+                                (120, (255, 100, 0)),  # Orange
+                                (20, (255, 255, 255)),  # White
+                            ), is_ufo=False)
                             
                             # Decrease lives and check if game over
                             self.lives -= 1
@@ -8684,10 +8865,13 @@ class Game:
         
         # Ship vs UFO bullets
         if self.ship.active and not self.ship.invulnerable and not self.god_mode:
-            for bullet in self.ufo_bullets[:]:
+            ship_position = self.ship.position  # Read once - a hit always ends the loop
+            ship_radius = self.ship.radius
+            check_wrapped_collision = self.check_wrapped_collision
+            for bullet in active_ufo_bullets:
                 if not bullet.active:
                     continue
-                if self.check_wrapped_collision(self.ship.position, bullet.position, self.ship.radius, bullet.radius):
+                if check_wrapped_collision(ship_position, bullet.position, ship_radius, bullet.radius):
                     # Hit!
                     # Player hit by UFO bullet
                     bullet.active = False
@@ -8753,10 +8937,10 @@ class Game:
                     break
         
         # UFO bullets vs Asteroids (100% blockable, 33% chance to break)
-        for bullet in self.ufo_bullets[:]:
+        for bullet in active_ufo_bullets:
             if not bullet.active:
                 continue
-            for asteroid in self.asteroids[:]:
+            for asteroid in self.get_asteroid_candidates(asteroid_grid, bullet.position.x, bullet.position.y, bullet.radius):
                 if not asteroid.active:
                     continue
                 if self.check_wrapped_collision(bullet.position, asteroid.get_hitbox_center(), bullet.radius, asteroid.radius):
@@ -8776,20 +8960,8 @@ class Game:
                         self.trigger_screen_shake(intensity, duration)
                         
                         # Add explosion particles
-                        total_particles = int((20 + ((2 * asteroid.size) * 20)) * 0.5)  # 50% fewer particles
-                        
-                        # 40% red particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.40), 
-                                                    color=(255, 50, 50), asteroid_size=asteroid.size)  # Red
-                        # 35% orange particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.35), 
-                                                    color=(255, 150, 0), asteroid_size=asteroid.size)  # Orange
-                        # 25% yellow particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.25), 
-                                                    color=(255, 255, 100), asteroid_size=asteroid.size)  # Yellow
+                        self.explosions.add_explosion_multicolor(asteroid.position.x, asteroid.position.y,
+                                                                 FIERY_ASTEROID_EXPLOSION_BATCHES[asteroid.size], asteroid_size=asteroid.size)
                         
                         # Add score (size 4 = 44 points, size 3 = 33, etc.)
                         self.add_score(asteroid.size * 11, "asteroid collision")
@@ -8804,7 +8976,7 @@ class Game:
             for bullet in boss.weapon_bullets[:]:
                 if not bullet.active:
                     continue
-                for asteroid in self.asteroids[:]:
+                for asteroid in self.get_asteroid_candidates(asteroid_grid, bullet.position.x, bullet.position.y, bullet.radius):
                     if not asteroid.active:
                         continue
                     if self.check_wrapped_collision(bullet.position, asteroid.get_hitbox_center(), bullet.radius, asteroid.radius):
@@ -8821,32 +8993,8 @@ class Game:
                             self.trigger_screen_shake(intensity, duration)
                         
                         # Add explosion particles (new scaling formula)
-                        total_particles = int((20 + ((2 * asteroid.size) * 20)) * 0.5)  # 50% fewer particles
-                        
-                        # 40% gray particles (75-125 range)
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.40), 
-                                                    color=(75, 75, 75), asteroid_size=asteroid.size)  # Gray
-                        # 20% dark brown particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.20), 
-                                                    color=(34, 9, 1), asteroid_size=asteroid.size)  # Dark brown
-                        # 15% red-brown particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.15), 
-                                                    color=(98, 23, 8), asteroid_size=asteroid.size)  # Red-brown
-                        # 10% orange-red particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.10), 
-                                                    color=(148, 27, 12), asteroid_size=asteroid.size)  # Orange-red
-                        # 8% orange particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.08), 
-                                                    color=(188, 57, 8), asteroid_size=asteroid.size)  # Orange
-                        # 7% golden particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.07), 
-                                                    color=(246, 170, 28), asteroid_size=asteroid.size)  # Golden
+                        self.explosions.add_explosion_multicolor(asteroid.position.x, asteroid.position.y,
+                                                                 ASTEROID_EXPLOSION_BATCHES[asteroid.size], asteroid_size=asteroid.size)
                         
                         # No score for boss destroying asteroids
                         # Boss-destroyed asteroids don't count toward player tracking
@@ -8882,12 +9030,9 @@ class Game:
                             self.ship.red_flash_timer = self.ship.red_flash_duration  # Trigger red flash
                             
                             # Add camera shake based on remaining shields (subject to time dilation)
-                            if self.ship.shield_hits == 2:  # Lost first shield (3/3 -> 2/3)
-                                self.trigger_screen_shake(1, 0.2, self.time_dilation_factor)  # Light shake
-                            elif self.ship.shield_hits == 1:  # Lost second shield (2/3 -> 1/3)
-                                self.trigger_screen_shake(3, 0.4, self.time_dilation_factor)  # Medium shake
-                            elif self.ship.shield_hits == 0:  # Lost last shield (1/3 -> 0/3)
-                                self.trigger_screen_shake(5, 0.6, self.time_dilation_factor)  # Strong shake
+                            intensity, duration, time_dilation = get_shield_damage_shake_params(self.ship.shield_hits, self.time_dilation_factor)
+                            if intensity > 0:
+                                self.trigger_screen_shake(intensity, duration, time_dilation)
                         else:
                             # No shields - ship destroyed
                             # Player destroyed by boss bullet - no shields left
@@ -8939,7 +9084,7 @@ class Game:
             for bullet in boss.weapon_bullets[:]:
                 if not bullet.active:
                     continue
-                for ufo in self.ufos[:]:
+                for ufo in active_ufos:
                     if not ufo.active:
                         continue
                     if self.check_wrapped_collision(bullet.position, ufo.get_hitbox_center(), bullet.radius, ufo.radius):
@@ -8951,7 +9096,7 @@ class Game:
                         break
         
         # Boss vs Asteroids (with screen wrapping) - Boss hits asteroids like normal
-        for boss in self.bosses[:]:
+        for boss in active_bosses:
             if not boss.active:
                 continue
             for asteroid in self.asteroids[:]:
@@ -8964,45 +9109,13 @@ class Game:
                         asteroid.active = False
                         
                         # Add screen shake for asteroid sizes 5+ only
-                        if asteroid.size == 9:
-                            self.trigger_screen_shake(12, 0.75)  # Large shake for size 9
-                        elif asteroid.size == 8:
-                            self.trigger_screen_shake(10, 0.5)  # Base shake for size 8
-                        elif asteroid.size == 7:
-                            self.trigger_screen_shake(8, 0.4)  # Medium shake for size 7
-                        elif asteroid.size == 6:
-                            self.trigger_screen_shake(6, 0.30)  # Medium shake for size 6
-                        elif asteroid.size == 5:
-                            self.trigger_screen_shake(5, 0.20)  # Small shake for size 5
-                        # Size 4: No screen shake
+                        intensity, duration = get_asteroid_shake_params(asteroid.size)
+                        if intensity > 0:
+                            self.trigger_screen_shake(intensity, duration)
                         
                         # Add explosion particles (with randomized lifetimes)
-                        total_particles = int((20 + ((2 * asteroid.size) * 20)) * 0.5)  # 50% fewer particles
-                        
-                        # 40% Gray particles (75-125 range)
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.40), 
-                                                    color=(75, 75, 75), asteroid_size=asteroid.size)  # Gray
-                        # 20% dark brown particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.20), 
-                                                    color=(34, 9, 1), asteroid_size=asteroid.size)  # Dark brown
-                        # 15% red-brown particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.15), 
-                                                    color=(98, 23, 8), asteroid_size=asteroid.size)  # Red-brown
-                        # 10% orange-red particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.10), 
-                                                    color=(148, 27, 12), asteroid_size=asteroid.size)  # Orange-red
-                        # 8% orange particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.08), 
-                                                    color=(188, 57, 8), asteroid_size=asteroid.size)  # Orange
-                        # 7% golden particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.07), 
-                                                    color=(246, 170, 28), asteroid_size=asteroid.size)  # Golden
+                        self.explosions.add_explosion_multicolor(asteroid.position.x, asteroid.position.y,
+                                                                 ASTEROID_EXPLOSION_BATCHES[asteroid.size], asteroid_size=asteroid.size)
                         
                         # Add score (size 4 = 44 points, size 5 = 55, etc.)
                         self.add_score(asteroid.size * 11, "asteroid collision")
@@ -9019,7 +9132,7 @@ class Game:
                     break
         
         # Boss vs Player (with screen wrapping) - Player is hit like normal
-        for boss in self.bosses[:]:
+        for boss in active_bosses:
             if not boss.active:
                 continue
             if self.ship.active and not self.ship.invulnerable and not self.god_mode:
@@ -9075,10 +9188,10 @@ class Game:
                     break
         
         # Boss vs Player Shots (with screen wrapping) - Shot collides with boss
-        for boss in self.bosses[:]:
+        for boss in active_bosses:
             if not boss.active:
                 continue
-            for bullet in self.bullets[:]:
+            for bullet in active_bullets:
                 if not bullet.active:
                     continue
                 # Check polygon hitbox collision
@@ -9091,10 +9204,10 @@ class Game:
                     break
         
         # Boss vs UFO Shots (with screen wrapping) - Shot collides with boss
-        for boss in self.bosses[:]:
+        for boss in active_bosses:
             if not boss.active:
                 continue
-            for bullet in self.ufo_bullets[:]:
+            for bullet in active_ufo_bullets:
                 if not bullet.active:
                     continue
                 # Check polygon hitbox collision
@@ -9146,7 +9259,7 @@ class Game:
                 # Pulse between 25% and 100% opacity in 4-second intervals, smoothly transitioning from current fade
                 pulse_time = self.title_start_timer - 6.0  # Time since fade completed
                 pulse_cycle = (pulse_time % 4.0) / 4.0  # 0 to 1 over 4 seconds
-                base_alpha = 64 + (191 * (0.5 + 0.5 * math.sin(pulse_cycle * 2 * math.pi)))  # 64-255 (25%-100%)
+                base_alpha = 64 + (191 * (0.5 + 0.5 * math.sin(pulse_cycle * math.tau)))  # 64-255 (25%-100%)
                 
                 # Smooth transition: start from current fade alpha (255) and blend to pulse
                 if pulse_time < 1.0:  # First second of pulsing
@@ -9171,7 +9284,7 @@ class Game:
             self.update_screen_shake(dt)
             
             # Update starfield with ship velocity (like in game)
-            ship_velocity = self.title_ship.velocity if self.title_ship else Vector2D(0, 0)
+            ship_velocity = self.title_ship.velocity if self.title_ship else ZERO_VECTOR
             self.star_field.update(ship_velocity, self.current_width, self.current_height, dt)
             
             # Update sine wave timer
@@ -9180,11 +9293,10 @@ class Game:
             # Simulate level 10 UFO spawning (no time effects, no player ship)
             self.update_title_screen_ufos(dt)
             
-            # Update title screen bosses
-            for boss in self.bosses[:]:
+            # Update title screen bosses, then drop finished ones in one pass
+            for boss in self.bosses:
                 boss.update(dt, self.current_width, self.current_height, self.asteroids, self.ship)
-                if not boss.active:
-                    self.bosses.remove(boss)
+            self.bosses = [boss for boss in self.bosses if boss.active]
             
             # Spawn title screen boss after 11.38 seconds if none exist
             if len(self.bosses) == 0 and self.title_boss_spawn_timer >= 11.38:
@@ -9214,20 +9326,30 @@ class Game:
             for bullet in self.bullets:
                 bullet.update(dilated_dt, self.current_width, self.current_height)
             
-            # Update asteroids (affected by time dilation)
-            for asteroid in self.asteroids[:]:
-                player_speed = 0  # No ship during death delay
+            # Update asteroids (affected by time dilation), then drop destroyed ones in one pass
+            player_speed = 0  # No ship during death delay
+            for asteroid in self.asteroids:
                 asteroid.update(dilated_dt, self.current_width, self.current_height, player_speed, 1.0)
-                if not asteroid.active:
-                    self.asteroids.remove(asteroid)
+            self.asteroids = [asteroid for asteroid in self.asteroids if asteroid.active]
             
             # Update UFOs (affected by time dilation)
-            for ufo in self.ufos[:]:
+            bullet_positions = self.get_position_array(self.bullets)
+            player_nearby_asteroids = self.count_positions_within(self.get_position_array(self.asteroids), 0, 0, 200)
+            bullet_grid = SpatialHash(UFO_QUERY_CELL_SIZE, self.bullets)
+            asteroid_grid = SpatialHash(UFO_QUERY_CELL_SIZE, self.asteroids)
+            ufos = self.ufos
+            surviving_ufos = []
+            for index, ufo in enumerate(ufos):
                 # Provide environmental context to UFO
-                ufo.player_position = Vector2D(0, 0)  # No ship during death delay
-                ufo.player_velocity = Vector2D(0, 0)  # No ship during death delay
+                ufo.player_position = ZERO_VECTOR  # No ship during death delay
+                ufo.player_velocity = ZERO_VECTOR  # No ship during death delay
                 ufo.player_bullets = self.bullets
-                ufo.other_ufos = [u for u in self.ufos if u != ufo]
+                ufo.player_bullet_positions = bullet_positions
+                ufo.player_nearby_asteroids = player_nearby_asteroids
+                ufo.player_bullet_grid = bullet_grid
+                ufo.asteroid_grid = asteroid_grid
+                ufo.other_ufos = ufos  # Shared list - the UFO skips itself and inactive UFOs
+                ufo.other_ufo_count = len(surviving_ufos) + len(ufos) - index - 1  # Earlier destroyed UFOs do not count
                 ufo.asteroids = self.asteroids
                 ufo.screen_width = self.current_width
                 ufo.screen_height = self.current_height
@@ -9236,9 +9358,10 @@ class Game:
                 # Set bullet limit based on level
                 ufo.max_bullets = 5 + ((self.level // 2) * 5)
                 
-                should_shoot = ufo.update(dilated_dt, Vector2D(0, 0), self.current_width, self.current_height, self.time_dilation_factor, self.explosions)
-                if not ufo.active:
-                    self.ufos.remove(ufo)
+                should_shoot = ufo.update(dilated_dt, ZERO_VECTOR, self.current_width, self.current_height, self.time_dilation_factor, self.explosions)
+                if ufo.active:
+                    surviving_ufos.append(ufo)
+            self.ufos = surviving_ufos
             
             # Update UFO bullets (affected by time dilation)
             self.ufo_bullets = [bullet for bullet in self.ufo_bullets if bullet.active]
@@ -9250,7 +9373,7 @@ class Game:
             
             
             # Update star field with no ship velocity since ship is destroyed
-            self.star_field.update(Vector2D(0, 0), self.current_width, self.current_height, dilated_dt)
+            self.star_field.update(ZERO_VECTOR, self.current_width, self.current_height, dilated_dt)
             
             # After 2 seconds, transition to game over
             if self.death_delay_timer >= 2.0:
@@ -9340,6 +9463,10 @@ class Game:
         # Calculate time dilation based on player movement (Superhot-style)
         self.calculate_time_dilation(dt)
         
+        # Paused: the world is frozen (input is already ignored), so skip every object update and collision pass
+        if self.game_state == "paused":
+            return
+        
         # Update screen shake
         self.update_screen_shake(dt)
         
@@ -9411,16 +9538,12 @@ class Game:
             # Track rotations for "spinning trick" achievement
             if not self.ship.spinning_trick_shown:
                 # Calculate angle difference, handling wraparound
-                angle_diff = self.ship.angle - self.ship.last_angle
-                # Normalize angle difference to [-π, π]
-                while angle_diff > math.pi:
-                    angle_diff -= 2 * math.pi
-                while angle_diff < -math.pi:
-                    angle_diff += 2 * math.pi
+                # Normalized to [-π, π] in one C call - constant time however far the angle moved this frame
+                angle_diff = math.remainder(self.ship.angle - self.ship.last_angle, math.tau)
                 
                 # Add to total rotations (convert to full rotations) - only while spinning
                 if self.ship.is_spinning:
-                    rotation_add = abs(angle_diff) / (2 * math.pi)
+                    rotation_add = abs(angle_diff) / math.tau
                     self.ship.total_rotations += rotation_add
                     
                     # Update last_angle AFTER calculating the difference
@@ -9552,29 +9675,42 @@ class Game:
             bullet.update(dilated_dt, self.current_width, self.current_height)
         
         # Update asteroids (affected by time dilation)
-        for asteroid in self.asteroids[:]:
-            player_speed = self.ship.velocity.magnitude() if self.ship else 0
+        player_speed = self.ship.velocity.magnitude() if self.ship else 0  # Same for every asteroid this frame
+        for asteroid in self.asteroids:
             # Pass dilated time directly to asteroids
             asteroid.update(dilated_dt, self.current_width, self.current_height, player_speed, 1.0)
-            if not asteroid.active:
-                self.asteroids.remove(asteroid)
+        self.asteroids = [asteroid for asteroid in self.asteroids if asteroid.active]
         
         # Update UFOs (affected by time dilation)
-        for ufo in self.ufos[:]:
-            # Provide environmental context to UFO
-            ufo.player_position = self.ship.position if self.ship else Vector2D(0, 0)
-            ufo.player_velocity = self.ship.velocity if self.ship else Vector2D(0, 0)
+        bullet_positions = self.get_position_array(self.bullets)
+        player_position = self.ship.position if self.ship else ZERO_VECTOR
+        player_velocity = self.ship.velocity if self.ship else ZERO_VECTOR
+        player_nearby_asteroids = self.count_positions_within(self.get_position_array(self.asteroids),
+                                                              player_position.x, player_position.y, 200)
+        bullet_grid = SpatialHash(UFO_QUERY_CELL_SIZE, self.bullets)
+        asteroid_grid = SpatialHash(UFO_QUERY_CELL_SIZE, self.asteroids)
+        # Set bullet limit based on level: 5 + ((level/2) * 5), rounded down
+        max_ufo_bullets = 5 + ((self.level // 2) * 5)
+        ufos = self.ufos
+        surviving_ufos = []
+        for index, ufo in enumerate(ufos):
+            # Provide environmental context to UFO (every value except the UFO count is shared, computed above)
+            ufo.player_position = player_position
+            ufo.player_velocity = player_velocity
             ufo.player_bullets = self.bullets
-            ufo.other_ufos = [u for u in self.ufos if u != ufo]
+            ufo.player_bullet_positions = bullet_positions
+            ufo.player_nearby_asteroids = player_nearby_asteroids
+            ufo.player_bullet_grid = bullet_grid
+            ufo.asteroid_grid = asteroid_grid
+            ufo.other_ufos = ufos  # Shared list - the UFO skips itself and inactive UFOs
+            ufo.other_ufo_count = len(surviving_ufos) + len(ufos) - index - 1  # Earlier destroyed UFOs do not count
             ufo.asteroids = self.asteroids
             ufo.screen_width = self.current_width
             ufo.screen_height = self.current_height
             ufo.time_dilation_factor = self.time_dilation_factor
+            ufo.max_bullets = max_ufo_bullets
             
-            # Set bullet limit based on level: 5 + ((level/2) * 5), rounded down
-            ufo.max_bullets = 5 + ((self.level // 2) * 5)
-            
-            should_shoot = ufo.update(dilated_dt, self.ship.position if self.ship else Vector2D(0, 0), self.current_width, self.current_height, self.time_dilation_factor, self.explosions)
+            should_shoot = ufo.update(dilated_dt, player_position, self.current_width, self.current_height, self.time_dilation_factor, self.explosions)
             
             # Handle spinout effects that need game instance
             if ufo.spinout_active and hasattr(ufo, 'update_spinout'):
@@ -9608,21 +9744,22 @@ class Game:
                 # Increment bullet count for this UFO
                 ufo.bullets_fired += 1
             
-            if not ufo.active:
+            if ufo.active:
+                surviving_ufos.append(ufo)
+            else:
                 # Reset bullet count when UFO is destroyed
                 ufo.bullets_fired = 0
-                self.ufos.remove(ufo)
+        self.ufos = surviving_ufos
         
         # Update UFO bullets (affected by time dilation) - use list comprehension for efficiency
         self.ufo_bullets = [bullet for bullet in self.ufo_bullets if bullet.active]
         for bullet in self.ufo_bullets:
             bullet.update(dilated_dt, self.current_width, self.current_height)
         
-        # Update bosses (affected by time dilation)
-        for boss in self.bosses[:]:
+        # Update bosses (affected by time dilation), then drop finished ones in one pass
+        for boss in self.bosses:
             boss.update(dilated_dt, self.current_width, self.current_height, self.asteroids, self.ship)
-            if not boss.active:
-                self.bosses.remove(boss)
+        self.bosses = [boss for boss in self.bosses if boss.active]
         
         # Spawn bosses based on new level-based system
         if self.should_spawn_bosses() and not self.boss_spawned_this_level and self.boss_spawn_timer >= self.boss_spawn_delay:
@@ -9659,12 +9796,7 @@ class Game:
                     self.ufo_spawn_types = None  # Use normal random selection
                 
                 # Pick a random corner for this level
-                corners = [
-                    (0, 0),  # Top-left
-                    (self.current_width, 0),  # Top-right
-                    (0, self.current_height),  # Bottom-left
-                    (self.current_width, self.current_height)  # Bottom-right
-                ]
+                corners = self.get_ufo_spawn_corners()
                 self.ufo_spawn_corner = random.choice(corners)
                 
                 # 10% chance for mass spawn from all corners (not for level 1)
@@ -9937,7 +10069,7 @@ class Game:
         self.god_mode_was_on = self.god_mode
         
         # Check for ludicrous speed achievement (trigger when first crossing 5000 speed)
-        if self.ship and not self.ludicrous_speed_shown and self.ship.velocity.magnitude() >= 5000:
+        if self.ship and not self.ludicrous_speed_shown and self.ship.velocity.magnitude_sq() >= 5000 * 5000:
             # Clear any existing messages
             if self.show_spinning_trick:
                 # Mark spinning trick as shown if it was being displayed
@@ -9956,7 +10088,7 @@ class Game:
             self.ludicrous_speed_shown = True  # Mark as shown
         
         # Check for plaid achievement (trigger when first crossing 10000 speed)
-        if self.ship and not self.plaid_shown and self.ship.velocity.magnitude() >= 10000:
+        if self.ship and not self.plaid_shown and self.ship.velocity.magnitude_sq() >= 10000 * 10000:
             # Clear any existing messages
             if self.show_spinning_trick:
                 # Mark spinning trick as shown if it was being displayed
@@ -10104,12 +10236,7 @@ class Game:
             self.ufos_to_spawn = 5  # Exactly 5 UFOs for level 1 (1 of each type)
             self.ufo_spawn_types = ["aggressive", "defensive", "tactical", "swarm", "deadly"]  # One of each type
             # Pick a random corner for level 1
-            corners = [
-                (0, 0),  # Top-left
-                (self.current_width, 0),  # Top-right
-                (0, self.current_height),  # Bottom-left
-                (self.current_width, self.current_height)  # Bottom-right
-            ]
+            corners = self.get_ufo_spawn_corners()
             self.ufo_spawn_corner = random.choice(corners)
         else:
             self.initial_ufo_timer = 5.0  # 5 second delay for other levels
@@ -10180,10 +10307,10 @@ class Game:
         
         # Pulse opacity 1 time per level (25% to 100%)
         pulse_cycle = (flash_progress * self.level) % 1.0
-        opacity = 0.25 + 0.75 * (0.5 + 0.5 * math.sin(pulse_cycle * 2 * math.pi))  # 25% to 100%
+        opacity = 0.25 + 0.75 * (0.5 + 0.5 * math.sin(pulse_cycle * math.tau))  # 25% to 100%
         
         # Create large, bold font for level flash
-        flash_font = pygame.font.Font(None, 72)
+        flash_font = self.get_font(72)
         flash_text = f"LEVEL {self.level}"
         flash_surface = flash_font.render(flash_text, True, WHITE)
         
@@ -10221,11 +10348,14 @@ class Game:
         
         # Draw zap emojis when god mode is active (above life indicators)
         if self.god_mode:
-            # Use a system font that supports emojis better
-            try:
-                emoji_font = pygame.font.SysFont("segoeuiemoji", 20)
-            except:
-                emoji_font = pygame.font.Font(None, 20)
+            # Use a system font that supports emojis better (looked up once; SysFont scans system fonts)
+            emoji_font = self.fonts.get("emoji")
+            if emoji_font is None:
+                try:
+                    emoji_font = pygame.font.SysFont("segoeuiemoji", 20)
+                except:
+                    emoji_font = pygame.font.Font(None, 20)
+                self.fonts["emoji"] = emoji_font
             
             zap_emoji = "⚡"
             
@@ -10262,7 +10392,7 @@ class Game:
             pulse_offset = i * 0.33333  # 10% offset per life (10% of 3.3333 seconds)
             pulse_cycle = (self.life_pulse_timer + pulse_offset) % 3.33333  # 3.3333 second cycle
             pulse_progress = pulse_cycle / 3.33333
-            opacity = 0.25 + 0.75 * (0.5 + 0.5 * math.sin(pulse_progress * 2 * math.pi))  # 25% base + 0-75% pulse = 50% to 100%
+            opacity = 0.25 + 0.75 * (0.5 + 0.5 * math.sin(pulse_progress * math.tau))  # 25% base + 0-75% pulse = 50% to 100%
             
             x = start_x + i * spacing
             y = start_y
@@ -10296,7 +10426,7 @@ class Game:
         speed_text = f"{current_speed:.0f}   {time_scale_percent:.1f}%"
         
         # Create font
-        font = pygame.font.Font(None, 24)
+        font = self.get_font(24)
         
         # Render text with 35% opacity
         text_surface = font.render(speed_text, True, (255, 255, 255))
@@ -10656,12 +10786,7 @@ class Game:
         self.ufos_to_spawn = 5  # Exactly 5 UFOs for level 1 (1 of each type)
         self.ufo_spawn_delay = 0
         # Pick a random corner for level 1
-        corners = [
-            (0, 0),  # Top-left
-            (self.current_width, 0),  # Top-right
-            (0, self.current_height),  # Bottom-left
-            (self.current_width, self.current_height)  # Bottom-right
-        ]
+        corners = self.get_ufo_spawn_corners()
         self.ufo_spawn_corner = random.choice(corners)
         self.ufo_mass_spawn = False
         self.ufo_spawn_types = ["aggressive", "defensive", "tactical", "swarm", "deadly"]  # Cycle through all 5 types
@@ -10683,7 +10808,7 @@ class Game:
             return
         
         # Only draw if ship is moving (velocity > 5 to avoid flickering)
-        if ship.velocity.magnitude() > 5:
+        if ship.velocity.magnitude_sq() > 25:
             # Create a temporary asteroid to draw
             temp_asteroid = Asteroid(ship.position.x, ship.position.y, size=2, level=self.level)
             temp_asteroid.rotation_angle = ship.angle  # Use ship's rotation
@@ -10692,16 +10817,29 @@ class Game:
             # Save current alpha blending mode
             old_alpha = surface.get_alpha()
             
-            # Create a temporary surface for the asteroid
-            temp_surface = pygame.Surface((self.current_width, self.current_height), pygame.SRCALPHA)
+            # Reuse one full-screen layer for the asteroid (cleared each frame, reallocated on resize)
+            temp_surface = self.ship_asteroid_layer
+            if temp_surface is None or temp_surface.get_size() != (self.current_width, self.current_height):
+                temp_surface = self.ship_asteroid_layer = pygame.Surface((self.current_width, self.current_height), pygame.SRCALPHA)
+                # Apply 50% opacity to the entire surface
+                temp_surface.set_alpha(128)  # 50% opacity (128/255)
+            else:
+                temp_surface.fill((0, 0, 0, 0))
             temp_asteroid.draw(temp_surface, self.current_width, self.current_height)
             
-            # Apply 50% opacity to the entire surface
-            temp_surface.set_alpha(128)  # 50% opacity (128/255)
-            
             # Blit the semi-transparent asteroid surface
             surface.blit(temp_surface, (0, 0))
     
+    def get_screen_overlay(self, alpha):
+        """Full-screen black overlay at the given alpha, built once per screen size"""
+        overlay = self.screen_overlays.get(alpha)
+        if overlay is None or overlay.get_size() != (self.current_width, self.current_height):
+            overlay = pygame.Surface((self.current_width, self.current_height))
+            overlay.set_alpha(alpha)
+            overlay.fill(BLACK)
+            self.screen_overlays[alpha] = overlay
+        return overlay
+    
 
     def spawn_title_sine_wave_ufo(self):
         """Spawn a UFO for title screen sine wave movement"""
@@ -10714,7 +10852,7 @@ class Game:
         ufo.angle = math.radians(270)  # Start with 270 degrees (180 degrees from 90)
         
         # Calculate phase offset based on spawn order to spread out the waves
-        phase_offset = (len(self.title_ufo_wave_data) * 2 * math.pi) / 7  # Spread 7 UFOs across full cycle
+        phase_offset = (len(self.title_ufo_wave_data) * math.tau) / 7  # Spread 7 UFOs across full cycle
         
         # Generate varied sine wave parameters for this UFO
         wave_data = {
@@ -10894,7 +11032,7 @@ class Game:
             return
         
         # Count active title screen UFOs
-        active_ufos = sum(1 for ufo in self.ufos if ufo.active and ufo in [u for u in self.ufos if hasattr(u, 'position')])
+        active_ufos = sum(1 for ufo in self.ufos if ufo.active)  # Every UFO has a position - no nested list scan
         
         # If we have less than 7 active UFOs, respawn at 2-second intervals
         if active_ufos < 7 and self.ufo_respawn_timer >= 2.0:
@@ -11002,7 +11140,7 @@ class Game:
         self.title_ship.update(dt, self.current_width, self.current_height, 1.0, dt, 1.0, 0)
         
         # Trigger screen shake based on movement (like in game)
-        if self.title_ship.velocity.magnitude() > 100:  # Moving fast
+        if self.title_ship.velocity.magnitude_sq() > 10000:  # Moving fast
             self.trigger_screen_shake(2, 0.1, 1.0)
     
     def update_title_screen_ufos(self, dt):
@@ -11029,21 +11167,21 @@ class Game:
         self.update_title_sine_wave_ufos(dt)
         
         # Check for collisions between player asteroid and UFOs
-        if self.title_ship and self.title_ship.velocity.magnitude() > 5:  # Only when moving
+        if self.title_ship and self.title_ship.velocity.magnitude_sq() > 25:  # Only when moving
             self.check_title_ufo_collisions()
         
         # Handle UFO respawning
         self.update_title_ufo_respawning(dt)
         
         # Update UFO bullets
-        for bullet in self.ufo_bullets[:]:
+        for bullet in self.ufo_bullets:
             if bullet.active:
                 bullet.update(dt)
                 # Remove bullets that go off screen
                 if (bullet.x < -10 or bullet.x > self.current_width + 10 or
                     bullet.y < -10 or bullet.y > self.current_height + 10):
                     bullet.active = False
-                    self.ufo_bullets.remove(bullet)
+        self.ufo_bullets = [bullet for bullet in self.ufo_bullets if bullet.active]  # One pass instead of a copy plus remove() per bullet
     
     
     def draw_title_screen_ufo(self, surface, ufo):
@@ -11073,6 +11211,16 @@ class Game:
         # Draw the rotated image
         surface.blit(rotated_image, rect)
 
+    def draw_asteroid_layer(self, surface, asteroids, shadows, shake_x, shake_y):
+        """Draw one layer of asteroid sprites (or their shadows) with a single Surface.blits call"""
+        blit_list = []
+        for asteroid in asteroids:
+            if shadows:
+                asteroid.append_shadow_blits(blit_list, self.current_width, self.current_height, shake_x, shake_y)
+            else:
+                asteroid.append_main_blits(blit_list, self.current_width, self.current_height, shake_x, shake_y)
+        surface.blits(blit_list, doreturn=False)
+    
     def draw(self, dt=0.016):
         # Apply screen shake offset
         shake_x = int(self.screen_shake_x)
@@ -11092,91 +11240,29 @@ class Game:
         if self.game_state == "playing":
             # New detailed rendering order with interleaved shadows and asteroids
             
-            # Bottom layer - Size 9 asteroids (no shadows)
-            size_9_asteroids = [asteroid for asteroid in self.asteroids if asteroid.size == 9]
-            for asteroid in size_9_asteroids:
-                original_x = asteroid.position.x
-                original_y = asteroid.position.y
-                asteroid.position.x += shake_x
-                asteroid.position.y += shake_y
-                asteroid.draw_main_only(draw_surface, self.current_width, self.current_height)
-                asteroid.position.x = original_x
-                asteroid.position.y = original_y
-            
-            # Size 8 asteroids (no shadows)
-            size_8_asteroids = [asteroid for asteroid in self.asteroids if asteroid.size == 8]
-            for asteroid in size_8_asteroids:
-                original_x = asteroid.position.x
-                original_y = asteroid.position.y
-                asteroid.position.x += shake_x
-                asteroid.position.y += shake_y
-                asteroid.draw_main_only(draw_surface, self.current_width, self.current_height)
-                asteroid.position.x = original_x
-                asteroid.position.y = original_y
+            # Group asteroids by size in one pass instead of one list scan per size
+            asteroids_by_size = {size: [] for size in range(1, 10)}
+            for asteroid in self.asteroids:
+                size_group = asteroids_by_size.get(asteroid.size)
+                if size_group is not None:
+                    size_group.append(asteroid)
+            
+            # Bottom layer - Size 9 then size 8 asteroids (no shadows), one blits call
+            self.draw_asteroid_layer(draw_surface, asteroids_by_size[9] + asteroids_by_size[8], False, shake_x, shake_y)
             
             # Size 6 and 7 shadows (grouped layer underneath size 7)
-            size_6_asteroids = [asteroid for asteroid in self.asteroids if asteroid.size == 6]
-            size_7_asteroids = [asteroid for asteroid in self.asteroids if asteroid.size == 7]
-            for asteroid in size_6_asteroids + size_7_asteroids:
-                original_x = asteroid.position.x
-                original_y = asteroid.position.y
-                asteroid.position.x += shake_x
-                asteroid.position.y += shake_y
-                asteroid.draw_shadow_only(draw_surface, self.current_width, self.current_height)
-                asteroid.position.x = original_x
-                asteroid.position.y = original_y
-            
-            # Size 6 roids
-            for asteroid in size_6_asteroids:
-                original_x = asteroid.position.x
-                original_y = asteroid.position.y
-                asteroid.position.x += shake_x
-                asteroid.position.y += shake_y
-                asteroid.draw_main_only(draw_surface, self.current_width, self.current_height)
-                asteroid.position.x = original_x
-                asteroid.position.y = original_y
-            
-            # Size 7 roids
-            for asteroid in size_7_asteroids:
-                original_x = asteroid.position.x
-                original_y = asteroid.position.y
-                asteroid.position.x += shake_x
-                asteroid.position.y += shake_y
-                asteroid.draw_main_only(draw_surface, self.current_width, self.current_height)
-                asteroid.position.x = original_x
-                asteroid.position.y = original_y
+            size_6_and_7_asteroids = asteroids_by_size[6] + asteroids_by_size[7]
+            self.draw_asteroid_layer(draw_surface, size_6_and_7_asteroids, True, shake_x, shake_y)
+            
+            # Size 6 roids, then size 7 roids
+            self.draw_asteroid_layer(draw_surface, size_6_and_7_asteroids, False, shake_x, shake_y)
             
             # Size 4 and 5 shadows (grouped layer underneath size 5)
-            size_4_asteroids = [asteroid for asteroid in self.asteroids if asteroid.size == 4]
-            size_5_asteroids = [asteroid for asteroid in self.asteroids if asteroid.size == 5]
-            for asteroid in size_4_asteroids + size_5_asteroids:
-                original_x = asteroid.position.x
-                original_y = asteroid.position.y
-                asteroid.position.x += shake_x
-                asteroid.position.y += shake_y
-                asteroid.draw_shadow_only(draw_surface, self.current_width, self.current_height)
-                asteroid.position.x = original_x
-                asteroid.position.y = original_y
-            
-            # Size 4 roids
-            for asteroid in size_4_asteroids:
-                original_x = asteroid.position.x
-                original_y = asteroid.position.y
-                asteroid.position.x += shake_x
-                asteroid.position.y += shake_y
-                asteroid.draw_main_only(draw_surface, self.current_width, self.current_height)
-                asteroid.position.x = original_x
-                asteroid.position.y = original_y
-            
-            # Size 5 roids
-            for asteroid in size_5_asteroids:
-                original_x = asteroid.position.x
-                original_y = asteroid.position.y
-                asteroid.position.x += shake_x
-                asteroid.position.y += shake_y
-                asteroid.draw_main_only(draw_surface, self.current_width, self.current_height)
-                asteroid.position.x = original_x
-                asteroid.position.y = original_y
+            size_4_and_5_asteroids = asteroids_by_size[4] + asteroids_by_size[5]
+            self.draw_asteroid_layer(draw_surface, size_4_and_5_asteroids, True, shake_x, shake_y)
+            
+            # Size 4 roids, then size 5 roids
+            self.draw_asteroid_layer(draw_surface, size_4_and_5_asteroids, False, shake_x, shake_y)
             
             # Boss shadows
             for boss in self.bosses:
@@ -11185,9 +11271,7 @@ class Game:
                 boss.position.x += shake_x
                 boss.position.y += shake_y
                 # Draw boss shadow only
-                shadow_image = pygame.transform.scale_by(boss.image, 1.333)  # Make shadow 33.3% bigger
-                shadow_image.fill((0, 0, 0, 255), special_flags=pygame.BLEND_MULT)  # Make it black first
-                shadow_image.set_alpha(168)  # 66% opacity
+                shadow_image = boss.get_shadow_image()  # 33.3% bigger, 66% opacity (cached per boss)
                 shadow_x = int(boss.position.x - 250 + 15)
                 shadow_y = int(boss.position.y - 250 + 15)
                 draw_surface.blit(shadow_image, (shadow_x, shadow_y), special_flags=pygame.BLEND_ALPHA_SDL2)
@@ -11212,47 +11296,11 @@ class Game:
             
             
             # Size 1, 2, and 3 shadows (grouped layer underneath size 3)
-            size_1_asteroids = [asteroid for asteroid in self.asteroids if asteroid.size == 1]
-            size_2_asteroids = [asteroid for asteroid in self.asteroids if asteroid.size == 2]
-            size_3_asteroids = [asteroid for asteroid in self.asteroids if asteroid.size == 3]
-            for asteroid in size_1_asteroids + size_2_asteroids + size_3_asteroids:
-                original_x = asteroid.position.x
-                original_y = asteroid.position.y
-                asteroid.position.x += shake_x
-                asteroid.position.y += shake_y
-                asteroid.draw_shadow_only(draw_surface, self.current_width, self.current_height)
-                asteroid.position.x = original_x
-                asteroid.position.y = original_y
-            
-            # Size 1 roids
-            for asteroid in size_1_asteroids:
-                original_x = asteroid.position.x
-                original_y = asteroid.position.y
-                asteroid.position.x += shake_x
-                asteroid.position.y += shake_y
-                asteroid.draw_main_only(draw_surface, self.current_width, self.current_height)
-                asteroid.position.x = original_x
-                asteroid.position.y = original_y
-            
-            # Size 2 roids
-            for asteroid in size_2_asteroids:
-                original_x = asteroid.position.x
-                original_y = asteroid.position.y
-                asteroid.position.x += shake_x
-                asteroid.position.y += shake_y
-                asteroid.draw_main_only(draw_surface, self.current_width, self.current_height)
-                asteroid.position.x = original_x
-                asteroid.position.y = original_y
-            
-            # Size 3 roids
-            for asteroid in size_3_asteroids:
-                original_x = asteroid.position.x
-                original_y = asteroid.position.y
-                asteroid.position.x += shake_x
-                asteroid.position.y += shake_y
-                asteroid.draw_main_only(draw_surface, self.current_width, self.current_height)
-                asteroid.position.x = original_x
-                asteroid.position.y = original_y
+            small_asteroids = asteroids_by_size[1] + asteroids_by_size[2] + asteroids_by_size[3]
+            self.draw_asteroid_layer(draw_surface, small_asteroids, True, shake_x, shake_y)
+            
+            # Size 1, then 2, then 3 roids
+            self.draw_asteroid_layer(draw_surface, small_asteroids, False, shake_x, shake_y)
             
             # UFO shadows
             for ufo in self.ufos:
@@ -11288,7 +11336,8 @@ class Game:
                 ufo.position.x = original_x
                 ufo.position.y = original_y
             
-            # UFOs (main UFO image only)
+            # UFOs (main UFO image only, batched into one Surface.blits call)
+            ufo_blits = []
             for ufo in self.ufos:
                 original_x = ufo.position.x
                 original_y = ufo.position.y
@@ -11300,10 +11349,13 @@ class Game:
                         rotation_angle = ufo.visual_rotation_angle
                     else:
                         rotation_angle = ufo.angle
-                    rotated_ufo = pygame.transform.rotate(ufo.image, -math.degrees(rotation_angle) - 90)
+                    rotated_ufo = image_cache.get_heading_rotated_image(ufo.image, rotation_angle)
                     ufo_rect = rotated_ufo.get_rect(center=(int(ufo.position.x), int(ufo.position.y)))
-                    draw_surface.blit(rotated_ufo, ufo_rect)
+                    ufo_blits.append((rotated_ufo, ufo_rect))
                 else:
+                    # Flush the UFOs queued so far so the fallback keeps its place in the draw order
+                    draw_surface.blits(ufo_blits, doreturn=False)
+                    ufo_blits.clear()
                     # Fallback UFO shape
                     pygame.draw.ellipse(draw_surface, WHITE, 
                                       (ufo.position.x - ufo.radius, ufo.position.y - ufo.radius/2,
@@ -11313,6 +11365,7 @@ class Game:
                                      ufo.radius, ufo.radius/2))
                 ufo.position.x = original_x
                 ufo.position.y = original_y
+            draw_surface.blits(ufo_blits, doreturn=False)
             
             # Player shadow
             if self.ship:
@@ -11329,36 +11382,22 @@ class Game:
             
             # Player thrust is now handled by the ship's own draw method
             
-            # UFO & Player Bullets
-            for bullet in self.bullets:
-                original_x = bullet.position.x
-                original_y = bullet.position.y
-                bullet.position.x += shake_x
-                bullet.position.y += shake_y
-                bullet.draw(draw_surface)
-                bullet.position.x = original_x
-                bullet.position.y = original_y
-            for bullet in self.ufo_bullets:
-                original_x = bullet.position.x
-                original_y = bullet.position.y
-                bullet.position.x += shake_x
-                bullet.position.y += shake_y
-                bullet.draw(draw_surface)
-                bullet.position.x = original_x
-                bullet.position.y = original_y
-            
-            # Boss weapon bullets (same layer as other bullets)
-            for boss in self.bosses:
-                if boss.active:
-                    for bullet in boss.weapon_bullets:
-                        if bullet.active:
-                            original_x = bullet.position.x
-                            original_y = bullet.position.y
-                            bullet.position.x += shake_x
-                            bullet.position.y += shake_y
-                            bullet.draw(draw_surface)
-                            bullet.position.x = original_x
-                            bullet.position.y = original_y
+            # UFO & Player Bullets, then boss weapon bullets (same layer), batched into one Surface.blits call
+            bullet_blits = []
+            boss_bullets = [bullet for boss in self.bosses if boss.active for bullet in boss.weapon_bullets]
+            for bullet in self.bullets + self.ufo_bullets + boss_bullets:
+                if not bullet.append_blit(bullet_blits, shake_x, shake_y):
+                    # No sprite - flush the bullets queued so far, then draw the fallback ellipse in order
+                    draw_surface.blits(bullet_blits, doreturn=False)
+                    bullet_blits.clear()
+                    original_x = bullet.position.x
+                    original_y = bullet.position.y
+                    bullet.position.x += shake_x
+                    bullet.position.y += shake_y
+                    bullet.draw(draw_surface)
+                    bullet.position.x = original_x
+                    bullet.position.y = original_y
+            draw_surface.blits(bullet_blits, doreturn=False)
             
             # Player Ship (main ship only, no shadow or thrust)
             if self.ship:
@@ -11369,15 +11408,16 @@ class Game:
                 # Draw main ship only (no shadow or thrust)
                 if self.ship.image:
                     rotation_angle = get_rotation_degrees(self.ship.angle)
-                    draw_ship_with_effects(self.ship, draw_surface, self.ship.position, rotation_angle, use_cache=False, draw_shadow=False)
+                    draw_ship_with_effects(self.ship, draw_surface, self.ship.position, rotation_angle, use_cache=True, draw_shadow=False)
                 else:
-                    # Fallback triangle
-                    points = []
-                    for i in range(3):
-                        angle = self.ship.angle + i * (2 * math.pi / 3)
-                        x = self.ship.position.x + math.cos(angle) * self.ship.radius
-                        y = self.ship.position.y + math.sin(angle) * self.ship.radius
-                        points.append((x, y))
+                    # Fallback triangle - one cos/sin, then rotate the precomputed corner offsets
+                    ship_x = self.ship.position.x
+                    ship_y = self.ship.position.y
+                    radius = self.ship.radius
+                    cos_a = math.cos(self.ship.angle) * radius
+                    sin_a = math.sin(self.ship.angle) * radius
+                    points = [(ship_x + cos_a * ox - sin_a * oy, ship_y + sin_a * ox + cos_a * oy)
+                              for ox, oy in SHIP_TRIANGLE_OFFSETS]
                     
                     color = WHITE
                     if self.ship.invulnerable and is_invulnerability_flashing(self.ship.invulnerable_time):
@@ -11424,20 +11464,19 @@ class Game:
                 self.ship.position.x = original_x
                 self.ship.position.y = original_y
         
-        # Create font for UI elements
-        font = pygame.font.Font(None, 36)
-        
         # Draw UI (only during gameplay)
         if self.game_state == "playing":
             # Level - centered with 75% opacity (above score)
             level_text = f"LEVEL {self.level}"
-            level_surface = font.render(level_text, True, WHITE)
-            level_surface.set_alpha(int(255 * 0.5))  # 50% opacity
-            
-            # Draw level text shadow first (behind the text)
-            level_shadow_surface = pygame.transform.scale_by(level_surface, 1.1)  # Make shadow 10% bigger
-            level_shadow_surface.fill((0, 0, 0, 255), special_flags=pygame.BLEND_MULT)  # Make it black first
-            level_shadow_surface.set_alpha(128)  # 50% opacity
+            level_surface = self.render_text(level_text, 36, WHITE, alpha=int(255 * 0.5))  # 50% opacity
+            
+            # Draw level text shadow first (behind the text) - rebuilt only when the level changes
+            if self.level_text_shadow is None or self.level_text_shadow[0] != level_text:
+                level_shadow_surface = pygame.transform.scale_by(level_surface, 1.1)  # Make shadow 10% bigger
+                level_shadow_surface.fill((0, 0, 0, 255), special_flags=pygame.BLEND_MULT)  # Make it black first
+                level_shadow_surface.set_alpha(128)  # 50% opacity
+                self.level_text_shadow = (level_text, level_shadow_surface)
+            level_shadow_surface = self.level_text_shadow[1]
             level_shadow_rect = level_shadow_surface.get_rect(center=(self.current_width//2 + 3, 30 + 3))
             draw_surface.blit(level_shadow_surface, level_shadow_rect, special_flags=pygame.BLEND_ALPHA_SDL2)
             
@@ -11450,140 +11489,96 @@ class Game:
             # Special messages - centered at y=150 with 15-degree skew
             message_y = 120
             if self.show_spinning_trick:
-                spinning_font = pygame.font.Font(None, 36)
-                spinning_text = spinning_font.render("I'll try spinning, that's a good trick!", True, YELLOW)
-                # Apply 15-degree skew effect
-                skewed_spinning_text = self.create_skewed_message_text(spinning_text, skew_factor=0.15)
+                skewed_spinning_text = self.get_skewed_message_text("I'll try spinning, that's a good trick!", 36, YELLOW)
                 spinning_rect = skewed_spinning_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_spinning_text, spinning_rect)
                 message_y += 30
             elif self.show_interstellar:
-                interstellar_font = pygame.font.Font(None, 36)
-                interstellar_text = interstellar_font.render("Interstellar!", True, YELLOW)
-                # Apply 15-degree skew effect
-                skewed_interstellar_text = self.create_skewed_message_text(interstellar_text, skew_factor=0.15)
+                skewed_interstellar_text = self.get_skewed_message_text("Interstellar!", 36, YELLOW)
                 interstellar_rect = skewed_interstellar_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_interstellar_text, interstellar_rect)
                 message_y += 30
             elif self.show_god_mode:
-                god_mode_font = pygame.font.Font(None, 36)
-                god_mode_text = god_mode_font.render("The Force is strong with this one...", True, YELLOW)
-                # Apply 15-degree skew effect
-                skewed_god_mode_text = self.create_skewed_message_text(god_mode_text, skew_factor=0.15)
+                skewed_god_mode_text = self.get_skewed_message_text("The Force is strong with this one...", 36, YELLOW)
                 god_mode_rect = skewed_god_mode_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_god_mode_text, god_mode_rect)
                 message_y += 30
             elif self.show_ludicrous_speed:
-                ludicrous_font = pygame.font.Font(None, 36)
-                ludicrous_text = ludicrous_font.render("Ludicrous speed... Go!", True, YELLOW)
-                # Apply 15-degree skew effect
-                skewed_ludicrous_text = self.create_skewed_message_text(ludicrous_text, skew_factor=0.15)
+                skewed_ludicrous_text = self.get_skewed_message_text("Ludicrous speed... Go!", 36, YELLOW)
                 ludicrous_rect = skewed_ludicrous_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_ludicrous_text, ludicrous_rect)
                 message_y += 30
             elif self.show_plaid:
-                plaid_font = pygame.font.Font(None, 36)
-                plaid_text = plaid_font.render("You've gone... plaid!", True, YELLOW)
-                # Apply 15-degree skew effect
-                skewed_plaid_text = self.create_skewed_message_text(plaid_text, skew_factor=0.15)
+                skewed_plaid_text = self.get_skewed_message_text("You've gone... plaid!", 36, YELLOW)
                 plaid_rect = skewed_plaid_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_plaid_text, plaid_rect)
                 message_y += 30
             
             # Score milestone messages with priority (250k > 100k > 25k)
             if self.show_250k_message:
-                message_250k_font = pygame.font.Font(None, 36)
-                message_250k_text = message_250k_font.render("250k Extra Life + Fully Charged!", True, YELLOW)
-                # Apply 15-degree skew effect
-                skewed_250k_text = self.create_skewed_message_text(message_250k_text, skew_factor=0.15)
+                skewed_250k_text = self.get_skewed_message_text("250k Extra Life + Fully Charged!", 36, YELLOW)
                 message_250k_rect = skewed_250k_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_250k_text, message_250k_rect)
                 message_y += 30
             elif self.show_100k_message:
-                message_100k_font = pygame.font.Font(None, 36)
-                message_100k_text = message_100k_font.render("100k Blast Double Charged!", True, YELLOW)
-                # Apply 15-degree skew effect
-                skewed_100k_text = self.create_skewed_message_text(message_100k_text, skew_factor=0.15)
+                skewed_100k_text = self.get_skewed_message_text("100k Blast Double Charged!", 36, YELLOW)
                 message_100k_rect = skewed_100k_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_100k_text, message_100k_rect)
                 message_y += 30
             elif self.show_25k_message:
-                message_25k_font = pygame.font.Font(None, 36)
-                message_25k_text = message_25k_font.render("25k Shields Recharged!", True, YELLOW)
-                # Apply 15-degree skew effect
-                skewed_25k_text = self.create_skewed_message_text(message_25k_text, skew_factor=0.15)
+                skewed_25k_text = self.get_skewed_message_text("25k Shields Recharged!", 36, YELLOW)
                 message_25k_rect = skewed_25k_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_25k_text, message_25k_rect)
                 message_y += 30
             if self.show_nice_shot_message:
-                nice_shot_font = pygame.font.Font(None, 36)
-                nice_shot_text = nice_shot_font.render("Nice shot, kid! Shields are up!", True, (0, 255, 0))  # Green color
-                skewed_nice_shot_text = self.create_skewed_message_text(nice_shot_text, skew_factor=0.15)
+                skewed_nice_shot_text = self.get_skewed_message_text("Nice shot, kid! Shields are up!", 36, (0, 255, 0))  # Green color
                 nice_shot_rect = skewed_nice_shot_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_nice_shot_text, nice_shot_rect)
                 message_y += 30
             
             # Lowest priority UI messages (UFO count and multiplier) - only show if no higher priority messages
             elif self.show_ufo_90_message:
-                ufo_90_font = pygame.font.Font(None, 32)
-                ufo_90_text = ufo_90_font.render("90+ We've got incoming!", True, YELLOW)
-                skewed_ufo_90_text = self.create_skewed_message_text(ufo_90_text, skew_factor=0.15)
+                skewed_ufo_90_text = self.get_skewed_message_text("90+ We've got incoming!", 32, YELLOW)
                 ufo_90_rect = skewed_ufo_90_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_ufo_90_text, ufo_90_rect)
                 message_y += 30
             elif self.show_ufo_60_message:
-                ufo_60_font = pygame.font.Font(None, 32)
-                ufo_60_text = ufo_60_font.render("60+ This is where the fun begins.", True, YELLOW)
-                skewed_ufo_60_text = self.create_skewed_message_text(ufo_60_text, skew_factor=0.15)
+                skewed_ufo_60_text = self.get_skewed_message_text("60+ This is where the fun begins.", 32, YELLOW)
                 ufo_60_rect = skewed_ufo_60_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_ufo_60_text, ufo_60_rect)
                 message_y += 30
             elif self.show_ufo_30_message:
-                ufo_30_font = pygame.font.Font(None, 32)
-                ufo_30_text = ufo_30_font.render("30+ Stay on target… stay on target…", True, YELLOW)
-                skewed_ufo_30_text = self.create_skewed_message_text(ufo_30_text, skew_factor=0.15)
+                skewed_ufo_30_text = self.get_skewed_message_text("30+ Stay on target… stay on target…", 32, YELLOW)
                 ufo_30_rect = skewed_ufo_30_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_ufo_30_text, ufo_30_rect)
                 message_y += 30
             elif self.show_ufo_20_message:
-                ufo_20_font = pygame.font.Font(None, 32)
-                ufo_20_text = ufo_20_font.render("Launch fighters!", True, YELLOW)
-                skewed_ufo_20_text = self.create_skewed_message_text(ufo_20_text, skew_factor=0.15)
+                skewed_ufo_20_text = self.get_skewed_message_text("Launch fighters!", 32, YELLOW)
                 ufo_20_rect = skewed_ufo_20_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_ufo_20_text, ufo_20_rect)
                 message_y += 30
             elif self.show_ufo_10_message:
-                ufo_10_font = pygame.font.Font(None, 32)
-                ufo_10_text = ufo_10_font.render("All ships, fire at will!", True, YELLOW)
-                skewed_ufo_10_text = self.create_skewed_message_text(ufo_10_text, skew_factor=0.15)
+                skewed_ufo_10_text = self.get_skewed_message_text("All ships, fire at will!", 32, YELLOW)
                 ufo_10_rect = skewed_ufo_10_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_ufo_10_text, ufo_10_rect)
                 message_y += 30
             elif self.show_ufo_too_many_message:
-                ufo_too_many_font = pygame.font.Font(None, 32)
-                ufo_too_many_text = ufo_too_many_font.render("There's too many of them!", True, YELLOW)
-                skewed_ufo_too_many_text = self.create_skewed_message_text(ufo_too_many_text, skew_factor=0.15)
+                skewed_ufo_too_many_text = self.get_skewed_message_text("There's too many of them!", 32, YELLOW)
                 ufo_too_many_rect = skewed_ufo_too_many_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_ufo_too_many_text, ufo_too_many_rect)
                 message_y += 30
             elif self.show_mult_5x_message:
-                mult_5x_font = pygame.font.Font(None, 32)
-                mult_5x_text = mult_5x_font.render("5x Great, kid, don't get cocky.", True, YELLOW)
-                skewed_mult_5x_text = self.create_skewed_message_text(mult_5x_text, skew_factor=0.15)
+                skewed_mult_5x_text = self.get_skewed_message_text("5x Great, kid, don't get cocky.", 32, YELLOW)
                 mult_5x_rect = skewed_mult_5x_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_mult_5x_text, mult_5x_rect)
                 message_y += 30
             elif self.show_mult_4x_message:
-                mult_4x_font = pygame.font.Font(None, 32)
-                mult_4x_text = mult_4x_font.render("4x The Force will be with you, always.", True, YELLOW)
-                skewed_mult_4x_text = self.create_skewed_message_text(mult_4x_text, skew_factor=0.15)
+                skewed_mult_4x_text = self.get_skewed_message_text("4x The Force will be with you, always.", 32, YELLOW)
                 mult_4x_rect = skewed_mult_4x_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_mult_4x_text, mult_4x_rect)
                 message_y += 30
             elif self.show_mult_3x_message:
-                mult_3x_font = pygame.font.Font(None, 32)
-                mult_3x_text = mult_3x_font.render("3x We've got them on the run!", True, YELLOW)
-                skewed_mult_3x_text = self.create_skewed_message_text(mult_3x_text, skew_factor=0.15)
+                skewed_mult_3x_text = self.get_skewed_message_text("3x We've got them on the run!", 32, YELLOW)
                 mult_3x_rect = skewed_mult_3x_text.get_rect(center=(self.current_width//2, message_y))
                 draw_surface.blit(skewed_mult_3x_text, mult_3x_rect)
                 message_y += 30
@@ -11606,18 +11601,21 @@ class Game:
         
         if self.game_state == "waiting":
             # Draw starfield background with title ship velocity
-            ship_velocity = self.title_ship.velocity if self.title_ship else Vector2D(0, 0)
+            ship_velocity = self.title_ship.velocity if self.title_ship else ZERO_VECTOR
             self.star_field.draw(draw_surface, ship_velocity)
             
             # Title - bright yellow outline with gradient fill (yellow bottom to black top)
-            title_font = pygame.font.Font(None, 144)
-            title_font.set_bold(True)
-            
-            # Create title with outline and gradient effect
-            gradient_title = self.create_gradient_title_text("CHUCKSTAROIDS", title_font)
-            
-            # Apply skewed effect - narrower at top, wider at bottom
-            skewed_title = self.create_skewed_title_text(gradient_title, pinch_factor=0.75)
+            # The text never changes, so the outline/gradient/skew passes run only on the first title frame
+            if self.title_text_surface is None:
+                title_font = pygame.font.Font(None, 144)
+                title_font.set_bold(True)
+                
+                # Create title with outline and gradient effect
+                gradient_title = self.create_gradient_title_text("CHUCKSTAROIDS", title_font)
+                
+                # Apply skewed effect - narrower at top, wider at bottom
+                self.title_text_surface = self.create_skewed_title_text(gradient_title, pinch_factor=0.75)
+            skewed_title = self.title_text_surface
             
             # Scale animation: 0 to 150% then back to 100% over 3 seconds
             # Phase 1: 0-150% curved (quick upward scaling) over first 2 seconds
@@ -11653,23 +11651,19 @@ class Game:
                     draw_surface.blit(scaled_title, title_rect)
             
             # Add two blank lines above subtitle
-            blank_font = pygame.font.Font(None, 32)
-            blank_text1 = blank_font.render("", True, WHITE)
-            blank_text2 = blank_font.render("", True, WHITE)
+            blank_text1 = self.render_text("", 32)
+            blank_text2 = blank_text1
             blank_rect1 = blank_text1.get_rect(center=(self.current_width//2, self.current_height//2 - 80))
             blank_rect2 = blank_text2.get_rect(center=(self.current_width//2, self.current_height//2 - 60))
             draw_surface.blit(blank_text1, blank_rect1)
             draw_surface.blit(blank_text2, blank_rect2)
             
             # Subtitle with fade-in effect (200% bigger) - moved down 50px
-            subtitle_font = pygame.font.Font(None, 64)
-            subtitle_font.set_bold(True)
-            
             # Show different message when scoreboard is open
             if hasattr(self, 'show_scoreboard') and self.show_scoreboard:
-                subtitle_text = subtitle_font.render("PRESS TAB TO CLOSE SCOREBOARD", True, YELLOW)
+                subtitle_text = self.render_text("PRESS TAB TO CLOSE SCOREBOARD", 64, YELLOW, bold=True)
             else:
-                subtitle_text = subtitle_font.render("PRESS SPACE TO START", True, WHITE)
+                subtitle_text = self.render_text("PRESS SPACE TO START", 64, WHITE, bold=True)
             
             subtitle_rect = subtitle_text.get_rect(center=(self.current_width//2, self.current_height//2 + 30))
             
@@ -11682,8 +11676,6 @@ class Game:
                 draw_surface.blit(subtitle_text, subtitle_rect)
             
             # Top Score - displayed above controls with fade-in effect
-            top_score_font = pygame.font.Font(None, 28)
-            
             # Get local top score with level
             local_top_score, local_top_level = game_logger.get_top_local_score_with_level()
             local_score_display = f"{local_top_score:,} (Lv.{local_top_level})" if local_top_score is not None else "-"
@@ -11696,10 +11688,10 @@ class Game:
             # Create the top score text based on availability
             if global_top_score is not None:
                 # Both scores available - show full format
-                top_score_text = top_score_font.render(f"TOP SCORES:  Worldwide #1: {global_top_score:,}  -  Local #1: {local_score_display}", True, (255, 215, 0))  # Gold color
+                top_score_text = self.render_text(f"TOP SCORES:  Worldwide #1: {global_top_score:,}  -  Local #1: {local_score_display}", 28, (255, 215, 0))  # Gold color
             else:
                 # No global score available - show simple format
-                top_score_text = top_score_font.render(f"TOP SCORE: {local_score_display}", True, (255, 215, 0))  # Gold color
+                top_score_text = self.render_text(f"TOP SCORE: {local_score_display}", 28, (255, 215, 0))  # Gold color
             top_score_rect = top_score_text.get_rect(center=(self.current_width//2, self.current_height//2 + 230))
             
             # Apply fade-in effect to top score (same timing as controls)
@@ -11724,8 +11716,7 @@ class Game:
                     draw_surface.blit(self.controls_image, controls_rect)
             
             # Second line of controls text (always displayed)
-            controls_font = pygame.font.Font(None, 22)
-            controls_text2 = controls_font.render("SCORES - tab  .  RESTART - r  .  PAUSE - p  .  EXIT - esc", True, (200, 200, 200))
+            controls_text2 = self.render_text("SCORES - tab  .  RESTART - r  .  PAUSE - p  .  EXIT - esc", 22, (200, 200, 200))
             controls_rect2 = controls_text2.get_rect(center=(self.current_width//2, self.current_height//2 + 260))
             
             # Apply fade-in effect to second line
@@ -11795,19 +11786,20 @@ class Game:
             
             # Draw scoreboard instructions
             if self.show_scoreboard:
-                inst_font = pygame.font.Font(None, 20)
-                inst_text = inst_font.render("C = Refresh", True, (200, 200, 200))
+                inst_text = self.render_text("C = Refresh", 20, (200, 200, 200))
                 inst_rect = inst_text.get_rect(center=(self.current_width//2, self.current_height - 10))
                 draw_surface.blit(inst_text, inst_rect)
         elif self.game_state == "death_delay":
             # During death delay, continue showing the game world normally
             # Draw star field with no ship velocity since ship is destroyed
-            self.star_field.draw(draw_surface, Vector2D(0, 0))
+            self.star_field.draw(draw_surface, ZERO_VECTOR)
             
-            # Draw asteroids
+            # Draw asteroids (every asteroid's wrap copies in one Surface.blits call)
+            asteroid_blits = []
             for asteroid in self.asteroids:
                 if asteroid.active:
-                    asteroid.draw(draw_surface)
+                    asteroid.append_blits(asteroid_blits)
+            draw_surface.blits(asteroid_blits, doreturn=False)
             
             # Draw UFOs
             for ufo in self.ufos:
@@ -11841,8 +11833,7 @@ class Game:
             # Draw UI elements (score, lives, etc.) - copy from main game loop
             # Level - centered with 75% opacity (above score)
             level_text = f"LEVEL {self.level}"
-            level_surface = font.render(level_text, True, WHITE)
-            level_surface.set_alpha(int(255 * 0.5))  # 50% opacity
+            level_surface = self.render_text(level_text, 36, WHITE, alpha=int(255 * 0.5))  # 50% opacity
             level_rect = level_surface.get_rect(center=(self.current_width//2, 30))
             draw_surface.blit(level_surface, level_rect)
             
@@ -11853,18 +11844,13 @@ class Game:
             self.draw_life_indicators(draw_surface, 90, dt)  # Position below score at y=60
         elif self.game_state == "game_over":
             # Always show game over text, but fade it in after star explosion
-            # Create extra large font for game over text (200% increase = 3x size)
-            game_over_font = pygame.font.Font(None, 108)  # 36 * 3 = 108
-            game_over_text = game_over_font.render("GAME OVER", True, YELLOW)
-            restart_text = font.render("Press R to restart", True, WHITE)
+            # Extra large game over text (200% increase = 3x size)
+            game_over_text = self.render_text("GAME OVER", 108, YELLOW)  # 36 * 3 = 108
+            restart_text = self.render_text("Press R to restart", 36, WHITE)
             
-            # Create large font for score and level display
-            large_font = pygame.font.Font(None, 32)
-            large_font.set_bold(True)
-            
-            # Create score and level text
-            score_text = large_font.render(f"SCORE: {self.score}", True, RED)
-            level_text = large_font.render(f"LEVEL {self.level}", True, RED)
+            # Create score and level text (large bold font)
+            score_text = self.render_text(f"SCORE: {self.score}", 32, RED, bold=True)
+            level_text = self.render_text(f"LEVEL {self.level}", 32, RED, bold=True)
             
             # Calculate positions
             score_y = int(self.current_height * 0.25)
@@ -11906,7 +11892,7 @@ class Game:
                 self.draw_name_input(draw_surface)
             
             # Draw controls text at bottom
-            scoreboard_font = pygame.font.Font(None, 24)
+            scoreboard_font = self.get_font(24)
             
             # Show different instructions based on state
             if self.name_input_active:
@@ -11919,18 +11905,16 @@ class Game:
             
             # Draw scoreboard instructions
             if self.show_scoreboard:
-                inst_font = pygame.font.Font(None, 20)
-                inst_text = inst_font.render("C = Refresh", True, (200, 200, 200))
+                inst_text = self.render_text("C = Refresh", 20, (200, 200, 200))
                 inst_rect = inst_text.get_rect(center=(self.current_width//2, self.current_height - 10))
                 draw_surface.blit(inst_text, inst_rect)
             else:
-                inst_font = pygame.font.Font(None, 20)
-                inst_text = inst_font.render("TAB = View Leaderboard  |  R = Restart  |  ESC = Exit", True, (200, 200, 200))
+                inst_text = self.render_text("TAB = View Leaderboard  |  R = Restart  |  ESC = Exit", 20, (200, 200, 200))
                 inst_rect = inst_text.get_rect(center=(self.current_width//2, self.current_height - 10))
                 draw_surface.blit(inst_text, inst_rect)
         elif self.game_state == "paused":
-            pause_text = font.render("PAUSED", True, YELLOW)
-            resume_text = font.render("Press P to resume", True, WHITE)
+            pause_text = self.render_text("PAUSED", 36, YELLOW)
+            resume_text = self.render_text("Press P to resume", 36, WHITE)
             draw_surface.blit(pause_text, (self.current_width//2 - 60, self.current_height//2 - 50))
             draw_surface.blit(resume_text, (self.current_width//2 - 120, self.current_height//2))
         
@@ -11951,10 +11935,9 @@ class Game:
             self.draw_progress_bars(draw_surface)
         
         # Apply screen shake by blitting with offset
+        # (draw_surface is the screen itself, so without shake there is nothing to copy)
         if self.screen_shake_intensity > 0:
             self.screen.blit(draw_surface, (shake_x, shake_y))
-        else:
-            self.screen.blit(draw_surface, (0, 0))
         
         pygame.display.flip()
     
@@ -12191,6 +12174,40 @@ class Game:
             else:
                 pass
     
+    def get_font(self, size, bold=False):
+        """Return the default font at this size, constructed once and reused every frame"""
+        key = (size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            if bold:
+                font.set_bold(True)
+            self.fonts[key] = font
+        return font
+    
+    def render_text(self, text, size, color=WHITE, bold=False, alpha=None):
+        """Render text once and reuse the surface until the text changes (copy() before changing its alpha)"""
+        key = (text, size, color, bold, alpha)
+        text_surface = self.text_cache.get(key)
+        if text_surface is None:
+            font = self.get_font(size, bold)
+            if len(self.text_cache) > 500:
+                self.text_cache.clear()  # Drop stale numeric lines
+            text_surface = font.render(text, True, color)
+            if alpha is not None:
+                text_surface.set_alpha(alpha)
+            self.text_cache[key] = text_surface
+        return text_surface
+    
+    def get_skewed_message_text(self, text, size, color=YELLOW):
+        """Get a rendered and 15-degree skewed message, built once per message"""
+        key = (text, size, color)
+        skewed_text = self.skewed_text_cache.get(key)
+        if skewed_text is None:
+            skewed_text = self.create_skewed_message_text(self.get_font(size).render(text, True, color), skew_factor=0.15)
+            self.skewed_text_cache[key] = skewed_text
+        return skewed_text
+    
     def draw_debug_speed_display(self, surface):
         """Draw player speed and world speed in debug view, centered at bottom in white"""
         if not self.ship:
@@ -12204,11 +12221,8 @@ class Game:
         god_mode_text = " | GOD MODE" if self.god_mode else ""
         speed_text = f"Player Speed: {player_speed:.0f} | World Speed: {world_speed:.1f}%{god_mode_text}"
         
-        # Create font
-        font = pygame.font.Font(None, 24)
-        
         # Render text in white
-        text_surface = font.render(speed_text, True, WHITE)
+        text_surface = self.render_text(speed_text, 24, WHITE)
         
         # Center the text horizontally at the bottom
         text_rect = text_surface.get_rect(center=(self.current_width // 2, self.current_height - 20))
@@ -12230,12 +12244,9 @@ class Game:
         rof_text = f"ROF: {shots_per_second:.1f} shots/sec"
         bonus_text = f"Asteroid Bonus: -{asteroid_bonus:.4f}s"
         
-        # Create font
-        font = pygame.font.Font(None, 20)
-        
         # Render text in cyan
-        rof_surface = font.render(rof_text, True, (0, 255, 255))
-        bonus_surface = font.render(bonus_text, True, (0, 255, 255))
+        rof_surface = self.render_text(rof_text, 20, (0, 255, 255))
+        bonus_surface = self.render_text(bonus_text, 20, (0, 255, 255))
         
         # Position text at top-left
         start_x = 10
@@ -12251,9 +12262,6 @@ class Game:
         if not hasattr(self, 'debug_mode') or not self.debug_mode:
             return
         
-        # Create debug font
-        debug_font = pygame.font.Font(None, 20)
-        
         # Debug controls text
         controls_text = [
             "DEBUG CONTROLS:",
@@ -12266,25 +12274,26 @@ class Game:
             "5 - Advance Level"
         ]
         
-        # Draw background on right side
-        y_offset = self.current_height - 200  # Position at bottom
-        for i, text in enumerate(controls_text):
-            text_surface = debug_font.render(text, True, (255, 255, 255))
-            # Semi-transparent background
-            bg_rect = text_surface.get_rect()
-            bg_rect.x = self.current_width - 200  # Position on right side
-            bg_rect.y = y_offset + i * 20
-            bg_rect.width += 10
-            bg_rect.height += 2
-            
-            # Draw semi-transparent background
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height))
-            bg_surface.set_alpha(128)
-            bg_surface.fill((0, 0, 0))
-            surface.blit(bg_surface, (bg_rect.x, bg_rect.y))
-            
-            # Draw text
-            surface.blit(text_surface, (bg_rect.x + 5, bg_rect.y + 1))
+        # The controls never change, so the panel (backgrounds + text) is composed once
+        if self.debug_controls_panel is None:
+            line_surfaces = [self.render_text(text, 20) for text in controls_text]
+            panel_width = max(line.get_width() for line in line_surfaces) + 10
+            panel_height = (len(line_surfaces) - 1) * 20 + line_surfaces[-1].get_height() + 2
+            panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+            for i, text_surface in enumerate(line_surfaces):
+                # Semi-transparent background per line
+                bg_rect = text_surface.get_rect()
+                bg_rect.y = i * 20
+                bg_rect.width += 10
+                bg_rect.height += 2
+                panel.fill((0, 0, 0, 128), bg_rect)
+                
+                # Text on top of its background
+                panel.blit(text_surface, (bg_rect.x + 5, bg_rect.y + 1))
+            self.debug_controls_panel = panel
+        
+        # Single blit at the bottom-right of the screen
+        surface.blit(self.debug_controls_panel, (self.current_width - 200, self.current_height - 200))
     
     def draw_debug_cache_stats(self, surface):
         """Draw image cache performance statistics in debug view"""
@@ -12294,9 +12303,6 @@ class Game:
         # Get cache statistics
         stats = image_cache.get_cache_stats()
         
-        # Create debug font
-        debug_font = pygame.font.Font(None, 24)
-        
         # Cache statistics text
         cache_text = [
             f"Image Cache Stats:",
@@ -12309,7 +12315,7 @@ class Game:
         # Draw background
         y_offset = 50
         for i, text in enumerate(cache_text):
-            text_surface = debug_font.render(text, True, (255, 255, 255))
+            text_surface = self.render_text(text, 24)
             # Semi-transparent background
             bg_rect = text_surface.get_rect()
             bg_rect.x = 10
@@ -12324,14 +12330,11 @@ class Game:
         if not hasattr(self, 'debug_mode') or not self.debug_mode:
             return
         
-        # Create debug font (200% bigger - from 20 to 60)
-        debug_font = pygame.font.Font(None, 60)
-        
         # FPS information text
         fps_text = f"FPS: {self.current_fps:.1f}"
         
-        # Render main FPS text in green
-        text_surface = debug_font.render(fps_text, True, (0, 255, 0))
+        # Render main FPS text in green (200% bigger font - from 20 to 60)
+        text_surface = self.render_text(fps_text, 60, (0, 255, 0))
         
         # Position at top-right corner
         text_rect = text_surface.get_rect()
@@ -12352,6 +12355,7 @@ class Game:
     def clear_image_cache(self):
         """Clear the image cache to free memory"""
         image_cache.clear_cache()
+        Asteroid._rotation_cache.clear()
         # Image cache cleared (console output removed)
     
     def draw_debug_memory_display(self, surface):
@@ -12380,9 +12384,6 @@ class Game:
         bullet_memory = (bullet_count + ufo_bullet_count + boss_bullet_count) * 0.01
         particle_memory = particle_count * 0.001
         
-        # Create debug font
-        debug_font = pygame.font.Font(None, 20)
-        
         # Memory information text
         memory_text = [
             f"Memory Usage: {memory_mb:.1f} MB",
@@ -12395,7 +12396,7 @@ class Game:
         # Draw background and text
         y_offset = 100
         for i, text in enumerate(memory_text):
-            text_surface = debug_font.render(text, True, (255, 255, 255))
+            text_surface = self.render_text(text, 20)
             # Semi-transparent background
             bg_rect = text_surface.get_rect()
             bg_rect.x = 10
@@ -12419,9 +12420,6 @@ class Game:
         boss_bullet_count = sum(len(b.weapon_bullets) for b in self.bosses if b.active)
         particle_count = len(self.explosions.particles) if hasattr(self, 'explosions') else 0
         
-        # Create debug font
-        debug_font = pygame.font.Font(None, 20)
-        
         # Object counts text
         objects_text = [
             "Active Objects:",
@@ -12437,7 +12435,7 @@ class Game:
         # Draw background and text
         y_offset = 250
         for i, text in enumerate(objects_text):
-            text_surface = debug_font.render(text, True, (255, 255, 255))
+            text_surface = self.render_text(text, 20)
             # Semi-transparent background
             bg_rect = text_surface.get_rect()
             bg_rect.x = 10
@@ -12459,9 +12457,6 @@ class Game:
         collision_checks = len(self.asteroids) * len(self.bullets) + len(self.ufos) * len(self.bullets)  # Rough estimate
         particle_performance = len(self.explosions.particles) if hasattr(self, 'explosions') else 0
         
-        # Create debug font
-        debug_font = pygame.font.Font(None, 20)
-        
         # Performance metrics text
         performance_text = [
             "Performance Metrics:",
@@ -12475,7 +12470,7 @@ class Game:
         # Draw background and text
         y_offset = 450
         for i, text in enumerate(performance_text):
-            text_surface = debug_font.render(text, True, (255, 255, 255))
+            text_surface = self.render_text(text, 20)
             # Semi-transparent background
             bg_rect = text_surface.get_rect()
             bg_rect.x = 10
@@ -12490,9 +12485,6 @@ class Game:
         if not hasattr(self, 'debug_mode') or not self.debug_mode:
             return
         
-        # Create debug font
-        debug_font = pygame.font.Font(None, 20)
-        
         # AI information text
         ai_text = ["UFO AI Debug:"]
         
@@ -12509,7 +12501,7 @@ class Game:
         # Draw background and text
         y_offset = 600
         for i, text in enumerate(ai_text):
-            text_surface = debug_font.render(text, True, (255, 255, 255))
+            text_surface = self.render_text(text, 20)
             # Semi-transparent background
             bg_rect = text_surface.get_rect()
             bg_rect.x = 10
@@ -12521,29 +12513,29 @@ class Game:
 
     def draw_debug_hitboxes(self, surface):
         """Draw debug hitboxes for all game objects with screen wrapping"""
-        # Draw ship hitbox
+        # Collect every hitbox circle first, then draw them in one pass
+        circles = []
+        
+        # Ship hitbox
         if self.ship and self.ship.active:
-            pygame.draw.circle(surface, (255, 0, 0), 
-                             (int(self.ship.position.x), int(self.ship.position.y)), 
-                             int(self.ship.radius), 2)
+            circles.append(((255, 0, 0), (int(self.ship.position.x), int(self.ship.position.y)), int(self.ship.radius)))
         
-        # Draw asteroid hitboxes with wrapping and size info
+        # Asteroid hitboxes with wrapping and size info
         for asteroid in self.asteroids:
             if asteroid.active:
-                # Draw hitbox at offset position (dim white)
+                # Hitbox at offset position (dim white)
                 hitbox_center = asteroid.get_hitbox_center()
-                self.draw_wrapped_hitbox(surface, hitbox_center, asteroid.radius, (200, 200, 200))
+                self.add_wrapped_hitbox(circles, hitbox_center, asteroid.radius, (200, 200, 200))
                 # Draw asteroid size text
-                font = pygame.font.Font(None, 20)
                 size_text = f"Size {asteroid.size}"
-                text_surface = font.render(size_text, True, (200, 200, 200))
+                text_surface = self.render_text(size_text, 20, (200, 200, 200))
                 text_rect = text_surface.get_rect(center=(int(asteroid.position.x), int(asteroid.position.y) - asteroid.radius - 15))
                 surface.blit(text_surface, text_rect)
         
-        # Draw UFO hitboxes with wrapping
+        # UFO hitboxes with wrapping
         for ufo in self.ufos:
             if ufo.active:
-                self.draw_wrapped_hitbox(surface, ufo.get_hitbox_center(), ufo.radius, (255, 255, 0))
+                self.add_wrapped_hitbox(circles, ufo.get_hitbox_center(), ufo.radius, (255, 255, 0))
         
         # Draw boss hitboxes (no wrapping - bosses don't wrap around screen)
         for boss in self.bosses:
@@ -12551,21 +12543,26 @@ class Game:
                 # Draw polygon hitbox
                 boss.draw_hitbox(surface)
         
-        # Draw bullet hitboxes with wrapping
+        # Bullet hitboxes with wrapping
         for bullet in self.bullets:
             if bullet.active:
-                self.draw_wrapped_hitbox(surface, bullet.position, bullet.radius, (0, 0, 255))
+                self.add_wrapped_hitbox(circles, bullet.position, bullet.radius, (0, 0, 255))
         
         for bullet in self.ufo_bullets:
             if bullet.active:
-                self.draw_wrapped_hitbox(surface, bullet.position, bullet.radius, (255, 0, 255))
+                self.add_wrapped_hitbox(circles, bullet.position, bullet.radius, (255, 0, 255))
         
-        # Draw boss weapon bullet hitboxes with wrapping
+        # Boss weapon bullet hitboxes with wrapping
         for boss in self.bosses:
             if boss.active:
                 for bullet in boss.weapon_bullets:
                     if bullet.active:
-                        self.draw_wrapped_hitbox(surface, bullet.position, bullet.radius, (255, 165, 0))  # Orange color for boss shots
+                        self.add_wrapped_hitbox(circles, bullet.position, bullet.radius, (255, 165, 0))  # Orange color for boss shots
+        
+        # Single tight draw loop over all collected circles
+        draw_circle = pygame.draw.circle
+        for color, center, radius in circles:
+            draw_circle(surface, color, center, radius, 2)
     
     def check_boss_spawn_collisions(self, boss):
         """Check for collisions when a boss spawns, including off-screen positions"""
@@ -12598,45 +12595,13 @@ class Game:
                         asteroid.active = False
                         
                         # Add screen shake for asteroid sizes 5+ only
-                        if asteroid.size == 9:
-                            self.trigger_screen_shake(12, 0.75)  # Large shake for size 9
-                        elif asteroid.size == 8:
-                            self.trigger_screen_shake(10, 0.5)  # Base shake for size 8
-                        elif asteroid.size == 7:
-                            self.trigger_screen_shake(8, 0.4)  # Medium shake for size 7
-                        elif asteroid.size == 6:
-                            self.trigger_screen_shake(6, 0.30)  # Medium shake for size 6
-                        elif asteroid.size == 5:
-                            self.trigger_screen_shake(5, 0.20)  # Small shake for size 5
-                        # Size 3-4: No screen shake
+                        intensity, duration = get_asteroid_shake_params(asteroid.size)
+                        if intensity > 0:
+                            self.trigger_screen_shake(intensity, duration)
                         
                         # Add explosion particles (with randomized lifetimes)
-                        total_particles = int((20 + ((2 * asteroid.size) * 20)) * 0.5)  # 50% fewer particles
-                        
-                        # 40% Gray particles (75-125 range)
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.40), 
-                                                    color=(75, 75, 75), asteroid_size=asteroid.size)  # Gray
-                        # 20% dark brown particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.20), 
-                                                    color=(34, 9, 1), asteroid_size=asteroid.size)  # Dark brown
-                        # 15% red-brown particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.15), 
-                                                    color=(98, 23, 8), asteroid_size=asteroid.size)  # Red-brown
-                        # 10% orange-red particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.10), 
-                                                    color=(148, 27, 12), asteroid_size=asteroid.size)  # Orange-red
-                        # 8% orange particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.08), 
-                                                    color=(188, 57, 8), asteroid_size=asteroid.size)  # Orange
-                        # 7% golden particles
-                        self.explosions.add_explosion(asteroid.position.x, asteroid.position.y, 
-                                                    num_particles=int(total_particles * 0.07), 
-                                                    color=(246, 170, 28), asteroid_size=asteroid.size)  # Golden
+                        self.explosions.add_explosion_multicolor(asteroid.position.x, asteroid.position.y,
+                                                                 ASTEROID_EXPLOSION_BATCHES[asteroid.size], asteroid_size=asteroid.size)
                         
                         # Add score (size 3 = 33 points, size 4 = 44 points, etc.)
                         self.add_score(asteroid.size * 11, "asteroid collision")
@@ -12669,45 +12634,13 @@ class Game:
                     new_asteroid.active = False
                     
                     # Add screen shake for asteroid sizes 5+ only
-                    if new_asteroid.size == 9:
-                        self.trigger_screen_shake(12, 0.75)  # Large shake for size 9
-                    elif new_asteroid.size == 8:
-                        self.trigger_screen_shake(10, 0.5)  # Base shake for size 8
-                    elif new_asteroid.size == 7:
-                        self.trigger_screen_shake(8, 0.4)  # Medium shake for size 7
-                    elif new_asteroid.size == 6:
-                        self.trigger_screen_shake(6, 0.30)  # Medium shake for size 6
-                    elif new_asteroid.size == 5:
-                        self.trigger_screen_shake(5, 0.20)  # Small shake for size 5
-                    # Size 3-4: No screen shake
+                    intensity, duration = get_asteroid_shake_params(new_asteroid.size)
+                    if intensity > 0:
+                        self.trigger_screen_shake(intensity, duration)
                     
                     # Add explosion particles (with randomized lifetimes)
-                    total_particles = int((20 + ((2 * new_asteroid.size) * 20)) * 0.5)  # 50% fewer particles
-                    
-                    # 40% Gray particles (75-125 range)
-                    self.explosions.add_explosion(new_asteroid.position.x, new_asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.40), 
-                                                color=(75, 75, 75), asteroid_size=new_asteroid.size)  # Gray
-                    # 20% dark brown particles
-                    self.explosions.add_explosion(new_asteroid.position.x, new_asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.20), 
-                                                color=(34, 9, 1), asteroid_size=new_asteroid.size)  # Dark brown
-                    # 15% red-brown particles
-                    self.explosions.add_explosion(new_asteroid.position.x, new_asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.15), 
-                                                color=(98, 23, 8), asteroid_size=new_asteroid.size)  # Red-brown
-                    # 10% orange-red particles
-                    self.explosions.add_explosion(new_asteroid.position.x, new_asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.10), 
-                                                color=(148, 27, 12), asteroid_size=new_asteroid.size)  # Orange-red
-                    # 8% orange particles
-                    self.explosions.add_explosion(new_asteroid.position.x, new_asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.08), 
-                                                color=(188, 57, 8), asteroid_size=new_asteroid.size)  # Orange
-                    # 7% golden particles
-                    self.explosions.add_explosion(new_asteroid.position.x, new_asteroid.position.y, 
-                                                num_particles=int(total_particles * 0.07), 
-                                                color=(246, 170, 28), asteroid_size=new_asteroid.size)  # Golden
+                    self.explosions.add_explosion_multicolor(new_asteroid.position.x, new_asteroid.position.y,
+                                                             ASTEROID_EXPLOSION_BATCHES[new_asteroid.size], asteroid_size=new_asteroid.size)
                     
                     # Add score (size 3 = 33 points, size 4 = 44 points, etc.)
                     self.add_score(new_asteroid.size * 11, "asteroid shot")
@@ -12771,6 +12704,15 @@ class Game:
         """Check collision between two objects with screen wrapping support"""
         width = self.current_width
         height = self.current_height
+        reach = radius1 + radius2
+        
+        # Broad phase: no wrapped copy can be closer on an axis than the shortest wrapped gap on that axis
+        gap_x = abs(pos1.x - pos2.x) % width
+        if min(gap_x, width - gap_x) >= reach:
+            return False
+        gap_y = abs(pos1.y - pos2.y) % height
+        if min(gap_y, height - gap_y) >= reach:
+            return False
          
         # Use pre-allocated lists for better performance
         self.temp_positions_1.clear()
@@ -12780,38 +12722,49 @@ class Game:
         self.get_wrapped_positions_optimized(pos1, radius1, width, height, self.temp_positions_1)
         self.get_wrapped_positions_optimized(pos2, radius2, width, height, self.temp_positions_2)
         
-        for p1 in self.temp_positions_1:
-            for p2 in self.temp_positions_2:
-                distance = math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
-                if distance < radius1 + radius2:
+        reach_sq = reach * reach  # Compare squared distances - no sqrt per wrapped pair
+        for x1, y1 in self.temp_positions_1:
+            for x2, y2 in self.temp_positions_2:
+                dx = x1 - x2
+                dy = y1 - y2
+                if dx * dx + dy * dy < reach_sq:
                     return True
         return False
     
     def get_wrapped_positions_optimized(self, position, radius, width, height, positions_list):
         """Get all possible wrapped positions for an object (optimized version)"""
-        positions_list.append((position.x, position.y))
+        x = position.x  # Read the coordinates once instead of on every edge test
+        y = position.y
+        append = positions_list.append
+        append((x, y))
+        
+        # Which edges the circle overlaps
+        near_left = x < radius
+        near_right = x > width - radius
+        near_top = y < radius
+        near_bottom = y > height - radius
         
         # Horizontal wrapping
-        if position.x < radius:
-            positions_list.append((position.x + width, position.y))
-        elif position.x > width - radius:
-            positions_list.append((position.x - width, position.y))
+        if near_left:
+            append((x + width, y))
+        elif near_right:
+            append((x - width, y))
         
         # Vertical wrapping
-        if position.y < radius:
-            positions_list.append((position.x, position.y + height))
-        elif position.y > height - radius:
-            positions_list.append((position.x, position.y - height))
+        if near_top:
+            append((x, y + height))
+        elif near_bottom:
+            append((x, y - height))
         
         # Corner wrapping
-        if (position.x < radius and position.y < radius):
-            positions_list.append((position.x + width, position.y + height))
-        elif (position.x > width - radius and position.y < radius):
-            positions_list.append((position.x - width, position.y + height))
-        elif (position.x < radius and position.y > height - radius):
-            positions_list.append((position.x + width, position.y - height))
-        elif (position.x > width - radius and position.y > height - radius):
-            positions_list.append((position.x - width, position.y - height))
+        if near_left and near_top:
+            append((x + width, y + height))
+        elif near_right and near_top:
+            append((x - width, y + height))
+        elif near_left and near_bottom:
+            append((x + width, y - height))
+        elif near_right and near_bottom:
+            append((x - width, y - height))
     
     def get_wrapped_positions(self, position, radius, width, height):
         """Get all possible wrapped positions for an object"""
@@ -12841,54 +12794,14 @@ class Game:
         
         return positions
     
-    def draw_wrapped_hitbox(self, surface, position, radius, color):
-        """Draw a hitbox with screen wrapping support"""
-        width = self.current_width
-        height = self.current_height
-        
-        # Main position
-        pygame.draw.circle(surface, color, 
-                         (int(position.x), int(position.y)), 
-                         int(radius), 2)
-        
-        # Check if object is crossing screen edges and add wrapped positions
-        # Horizontal wrapping
-        if position.x < radius:
-            pygame.draw.circle(surface, color, 
-                             (int(position.x + width), int(position.y)), 
-                             int(radius), 2)
-        elif position.x > width - radius:
-            pygame.draw.circle(surface, color, 
-                             (int(position.x - width), int(position.y)), 
-                             int(radius), 2)
-        
-        # Vertical wrapping
-        if position.y < radius:
-            pygame.draw.circle(surface, color, 
-                             (int(position.x), int(position.y + height)), 
-                             int(radius), 2)
-        elif position.y > height - radius:
-            pygame.draw.circle(surface, color, 
-                             (int(position.x), int(position.y - height)), 
-                             int(radius), 2)
-        
-        # Corner wrapping (when object is near both edges)
-        if position.x < radius and position.y < radius:
-            pygame.draw.circle(surface, color, 
-                             (int(position.x + width), int(position.y + height)), 
-                             int(radius), 2)
-        elif position.x > width - radius and position.y < radius:
-            pygame.draw.circle(surface, color, 
-                             (int(position.x - width), int(position.y + height)), 
-                             int(radius), 2)
-        elif position.x < radius and position.y > height - radius:
-            pygame.draw.circle(surface, color, 
-                             (int(position.x + width), int(position.y - height)), 
-                             int(radius), 2)
-        elif position.x > width - radius and position.y > height - radius:
-            pygame.draw.circle(surface, color, 
-                             (int(position.x - width), int(position.y - height)), 
-                             int(radius), 2)
+    def add_wrapped_hitbox(self, circles, position, radius, color):
+        """Queue a hitbox circle (plus its screen-wrapped copies) for drawing"""
+        positions = self.temp_positions_1
+        positions.clear()
+        self.get_wrapped_positions_optimized(position, radius, self.current_width, self.current_height, positions)
+        int_radius = int(radius)
+        for x, y in positions:
+            circles.append((color, (int(x), int(y)), int_radius))
     
     def should_spawn_bosses(self):
         """Check if the current level should spawn bosses"""
@@ -13306,8 +13219,7 @@ class Game:
                 else:
                     self.gc_timer = 0.0
                 
-                # Update the display
-                pygame.display.flip()
+                # Display is presented once per frame at the end of draw()
                 
         except Exception as e:
             # Game crashed - exit gracefully
@@ -13348,10 +13260,7 @@ class Game:
             
             # Semi-transparent background
             try:
-                overlay = pygame.Surface((self.current_width, self.current_height))
-                overlay.set_alpha(200)
-                overlay.fill(BLACK)
-                surface.blit(overlay, (0, 0))
+                surface.blit(self.get_screen_overlay(200), (0, 0))
             except Exception as e:
                 # print(f"[SCOREBOARD DEBUG] Error creating overlay: {e}")
                 # Don't return, just continue without overlay
@@ -13359,7 +13268,7 @@ class Game:
             
             # Title
             try:
-                font_large = pygame.font.Font(None, 48)
+                font_large = self.get_font(48)
                 if not self.scoreboard_available or not self.scoreboard:
                     title_text = font_large.render("SCOREBOARD UNAVAILABLE", True, WHITE)
                 else:
@@ -13370,7 +13279,7 @@ class Game:
                 # print(f"[SCOREBOARD DEBUG] Error rendering title: {e}")
                 # Don't return, just continue with fallback
                 try:
-                    fallback_font = pygame.font.Font(None, 36)
+                    fallback_font = self.get_font(36)
                     fallback_title = fallback_font.render("SCOREBOARD", True, WHITE)
                     fallback_rect = fallback_title.get_rect(center=(self.current_width // 2, 100))
                     surface.blit(fallback_title, fallback_rect)
@@ -13379,7 +13288,7 @@ class Game:
             
             # Scores - with error handling
             try:
-                font = pygame.font.Font(None, 32)
+                font = self.get_font(32)
                 y_offset = 150
                 
                 # Ensure scoreboard_scores is valid
@@ -13462,7 +13371,7 @@ class Game:
             
             # Instructions - show close message only on title screen
             try:
-                font_small = pygame.font.Font(None, 24)
+                font_small = self.get_font(24)
                 if hasattr(self, 'game_state') and self.game_state == "waiting":
                     # On title screen, show close instruction
                     inst_text = font_small.render("Press TAB to close", True, YELLOW)
@@ -13477,7 +13386,7 @@ class Game:
             # print(f"[SCOREBOARD DEBUG] Critical error in draw_scoreboard: {e}")
             # Draw a simple error message
             try:
-                error_font = pygame.font.Font(None, 36)
+                error_font = self.get_font(36)
                 error_text = error_font.render("Scoreboard Error", True, WHITE)
                 if error_text:
                     error_rect = error_text.get_rect(center=(self.current_width // 2, self.current_height // 2))
@@ -13489,10 +13398,7 @@ class Game:
         """Draw name input dialog"""
         try:
             # Semi-transparent background
-            overlay = pygame.Surface((self.current_width, self.current_height))
-            overlay.set_alpha(150)
-            overlay.fill(BLACK)
-            surface.blit(overlay, (0, 0))
+            surface.blit(self.get_screen_overlay(150), (0, 0))
         
             # Dialog box
             dialog_width = 400
@@ -13512,7 +13418,7 @@ class Game:
                 pygame.draw.rect(surface, BLACK, (dialog_x + 2, dialog_y + 2, dialog_width - 4, dialog_height - 4))
             
             # Text
-            font = pygame.font.Font(None, 32)
+            font = self.get_font(32)
             prompt_text = font.render("Enter your name:", True, WHITE)
             prompt_rect = prompt_text.get_rect(center=(self.current_width // 2, dialog_y + 50))
             surface.blit(prompt_text, prompt_rect)
@@ -13544,7 +13450,7 @@ class Game:
                     pass  # If even this fails, just continue
             
             # Instructions - show different messages based on submission state
-            font_small = pygame.font.Font(None, 24)
+            font_small = self.get_font(24)
             
             if self.score_submission_in_progress:
                 # Show submission in progress message with animated dots
@@ -13573,7 +13479,7 @@ class Game:
             # print(f"[SCOREBOARD DEBUG] Error in draw_name_input: {e}")
             # Draw a simple error message
             try:
-                error_font = pygame.font.Font(None, 36)
+                error_font = self.get_font(36)
                 error_text = error_font.render("Name Input Error", True, WHITE)
                 error_rect = error_text.get_rect(center=(self.current_width // 2, self.current_height // 2))
                 surface.blit(error_text, error_rect)